@@ -37,7 +37,7 @@ async def create_comment(
     service = CommentService(db)
     comment = await service.create_comment(
         deal_id=deal_id,
-        user_id=current_user.id,
+        user=current_user,
         content=body.content,
         parent_id=body.parent_id,
     )
@@ -63,7 +63,7 @@ async def update_comment(
     service = CommentService(db)
     comment = await service.update_comment(
         comment_id=comment_id,
-        user_id=current_user.id,
+        user=current_user,
         content=body.content,
     )
 
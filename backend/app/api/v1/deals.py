@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies import get_db, get_current_user, get_optional_user
 from app.models.user import User
 from app.schemas import ApiResponse, DealDetailResponse, DealResponse, PaginationMeta, VoteRequest
-from app.services.deal_service import DealService
+from app.services.deal_service import DealService, encode_deal_cursor
 from app.services.product_service import ProductService
 from app.services.vote_service import VoteService
 from app.services.cache_service import get_cache, cache_key_for_deals, cache_key_for_top_deals, invalidate_deals_cache
@@ -27,6 +27,7 @@ async def list_deals(
     sort_by: str = Query("newest", regex="^(newest|score|discount|views)$", description="Sort method"),
     min_discount: Optional[float] = Query(None, ge=0, le=100, description="Minimum discount percentage"),
     deal_type: Optional[str] = Query(None, description="Filter by deal type"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides page)"),
     db: AsyncSession = Depends(get_db),
 ):
     """List active deals with pagination and filtering.
@@ -37,6 +38,9 @@ async def list_deals(
     - discount: Highest discount percentage first
     - views: Most viewed deals first
 
+    Deep pages should follow ``meta.next_cursor`` instead of incrementing
+    ``page``; cursor pages cost the same regardless of depth.
+
     This endpoint is cached for 30 seconds.
     """
     # Try to get from cache
@@ -49,6 +53,7 @@ async def list_deals(
         sort_by=sort_by,
         min_discount=min_discount,
         deal_type=deal_type,
+        cursor=cursor,
     )
 
     cached = await cache.get(cache_key)
@@ -57,17 +62,22 @@ async def list_deals(
 
     # Cache miss - fetch from database
     service = DealService(db)
-    deals, total = await service.get_deals(
-        page=page,
-        limit=limit,
-        category_slug=category,
-        shop_slug=shop,
-        sort_by=sort_by,
-        min_discount=min_discount,
-        deal_type=deal_type,
-    )
+    try:
+        deals, total = await service.get_deals(
+            page=page,
+            limit=limit,
+            category_slug=category,
+            shop_slug=shop,
+            sort_by=sort_by,
+            min_discount=min_discount,
+            deal_type=deal_type,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     total_pages = (total + limit - 1) // limit if total > 0 else 0
+    next_cursor = encode_deal_cursor(deals[-1], sort_by) if len(deals) == limit else None
 
     response = ApiResponse(
         status="success",
@@ -77,6 +87,7 @@ async def list_deals(
             limit=limit,
             total=total,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
 
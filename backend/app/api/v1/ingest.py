@@ -25,25 +25,87 @@ avoid timing-oracle attacks.
 """
 
 import secrets
+import zlib
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, text
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.db.session import async_session_factory
 from app.dependencies import get_db
 from app.models.shop import Shop
 from app.schemas.ingest import IngestRequest, IngestResponse, IngestStats
+from app.services.cache_service import invalidate_deals_cache
+from app.services.deal_service import (
+    ACTIVE_DEAL_INDEX,
+    invalidate_deal_counts,
+    reset_active_deal_index_check,
+)
 from app.scrapers.base import NormalizedDeal, NormalizedProduct
 from app.scrapers.scraper_service import ScraperService
 
-router = APIRouter()
 logger = structlog.get_logger(__name__)
 
+# Cap on a decompressed request body, so a small gzip upload can't expand
+# into an unbounded amount of memory before the API key is even checked.
+MAX_DECOMPRESSED_BODY_BYTES = 32 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Gzip request bodies
+# ---------------------------------------------------------------------------
+
+
+class GzipRequest(Request):
+    """Request whose body is transparently gunzipped when it is gzip-encoded."""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                try:
+                    body = decompressor.decompress(body, MAX_DECOMPRESSED_BODY_BYTES)
+                except zlib.error:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid gzip request body",
+                    )
+                if decompressor.unconsumed_tail:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Decompressed request body too large",
+                    )
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Route class that accepts ``Content-Encoding: gzip`` request bodies.
+
+    The local scraper compresses its ingest payloads, which are large and
+    uploaded from a home connection.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def gzip_route_handler(request: Request) -> Response:
+            request = GzipRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return gzip_route_handler
+
+
+router = APIRouter(route_class=GzipRoute)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -194,7 +256,7 @@ async def ingest_deals(
             # Continue with remaining items
 
     # --- Process through existing pipeline ---
-    service = ScraperService(db)
+    service = ScraperService(db, session_factory=async_session_factory)
 
     # process_deals raises ValueError if shop_slug is unknown or inactive.
     # Surface that as a 422 so the local scraper knows immediately.
@@ -424,20 +486,24 @@ class MigrateResponse(BaseModel):
     images_fixed_deals: int = 0
     categories_fixed_products: int = 0
     categories_fixed_deals: int = 0
+    duplicate_deals_deactivated: int = 0
 
 
 @router.post(
     "/migrate-fix",
     response_model=MigrateResponse,
     status_code=status.HTTP_200_OK,
-    summary="Fix existing data: http→https images + auto-classify empty categories",
+    summary=(
+        "Fix existing data: http→https images, auto-classify empty categories, "
+        "deactivate duplicate active deals"
+    ),
     tags=["ingest"],
 )
 async def migrate_fix(
     body: MigrateRequest,
     db: AsyncSession = Depends(get_db),
 ) -> MigrateResponse:
-    """One-time migration to fix image URLs and empty categories in existing data."""
+    """One-time migration to fix image URLs, empty categories and duplicate deals."""
     _verify_api_key(body.api_key)
 
     from app.models.product import Product
@@ -447,6 +513,20 @@ async def migrate_fix(
 
     log = logger.bind(endpoint="migrate-fix")
 
+    # --- 0. Keep only the newest active deal per product+shop, then build
+    # the unique index the deal upsert relies on (PostgreSQL only) ---
+    duplicates_deactivated = 0
+    if db.get_bind().dialect.name == "postgresql":
+        result_dup = await db.execute(text(
+            "UPDATE deals SET is_active = false WHERE id IN ("
+            "SELECT id FROM (SELECT id, row_number() OVER ("
+            "PARTITION BY product_id, shop_id ORDER BY updated_at DESC"
+            ") AS rn FROM deals WHERE is_active) ranked WHERE rn > 1)"
+        ))
+        duplicates_deactivated = result_dup.rowcount
+        await db.execute(CreateIndex(ACTIVE_DEAL_INDEX, if_not_exists=True))
+        log.info("duplicate_deals_deactivated", count=duplicates_deactivated)
+
     # --- 1. Fix http:// → https:// in image URLs ---
     result_p = await db.execute(
         update(Product)
@@ -500,12 +580,18 @@ async def migrate_fix(
 
     await db.commit()
 
+    # Deals were deactivated or re-categorised; drop stale counts and pages
+    reset_active_deal_index_check()
+    invalidate_deal_counts()
+    await invalidate_deals_cache()
+
     log.info(
         "migrate_fix_complete",
         images_products=images_fixed_products,
         images_deals=images_fixed_deals,
         categories_products=products_fixed,
         categories_deals=deals_fixed,
+        duplicate_deals=duplicates_deactivated,
     )
 
     return MigrateResponse(
@@ -514,4 +600,5 @@ async def migrate_fix(
         images_fixed_deals=images_fixed_deals,
         categories_fixed_products=products_fixed,
         categories_fixed_deals=deals_fixed,
+        duplicate_deals_deactivated=duplicates_deactivated,
     )
@@ -2,18 +2,21 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.session import async_session_factory
 from app.dependencies import get_db
 from app.schemas import ApiResponse, DealResponse, PaginationMeta
-from app.services.search_service import SearchService
+from app.services.search_service import SearchService, track_search_keyword
+from app.services.cache_service import get_cache, cache_key_for_search
 
 router = APIRouter()
 
 
 @router.get("", response_model=ApiResponse)
 async def search(
+    background_tasks: BackgroundTasks,
     q: str = Query("", description="Search query", min_length=1),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -28,9 +31,11 @@ async def search(
     which supports fuzzy Korean text search.
 
     Sort options:
-    - relevance: Best matching results first (AI score as proxy)
+    - relevance: Best matching results first, then highest AI score
     - score: Highest AI score first
     - newest: Most recently created deals first
+
+    This endpoint is cached for 60 seconds.
     """
     if not q or not q.strip():
         raise HTTPException(
@@ -38,6 +43,17 @@ async def search(
             detail="Search query 'q' cannot be empty",
         )
 
+    # Keyword analytics are written after the response goes out, cached or not
+    background_tasks.add_task(track_search_keyword, async_session_factory, q)
+
+    cache = await get_cache()
+    cache_key = cache_key_for_search(
+        q, page=page, limit=limit, category_slug=category, shop_slug=shop, sort_by=sort_by
+    )
+    cached = await cache.get(cache_key)
+    if cached:
+        return ApiResponse.model_validate_json(cached)
+
     service = SearchService(db)
     deals, total = await service.search_deals(
         query=q,
@@ -46,11 +62,12 @@ async def search(
         category_slug=category,
         shop_slug=shop,
         sort_by=sort_by,
+        track_keyword=False,
     )
 
     total_pages = (total + limit - 1) // limit if total > 0 else 0
 
-    return ApiResponse(
+    response = ApiResponse(
         status="success",
         data=[DealResponse.model_validate(d) for d in deals],
         meta=PaginationMeta(
@@ -61,9 +78,14 @@ async def search(
         ),
     )
 
+    await cache.set(cache_key, response.model_dump_json(), ttl=60)
+
+    return response
+
 
 @router.get("/advanced", response_model=ApiResponse)
 async def advanced_search(
+    background_tasks: BackgroundTasks,
     q: str = Query("", description="Search query", min_length=1),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -76,6 +98,8 @@ async def advanced_search(
     """Advanced search with additional filters.
 
     Provides more granular filtering options including price range and AI score thresholds.
+
+    This endpoint is cached for 60 seconds.
     """
     if not q or not q.strip():
         raise HTTPException(
@@ -83,6 +107,23 @@ async def advanced_search(
             detail="Search query 'q' cannot be empty",
         )
 
+    background_tasks.add_task(track_search_keyword, async_session_factory, q)
+
+    cache = await get_cache()
+    cache_key = cache_key_for_search(
+        q,
+        page=page,
+        limit=limit,
+        category_slug=category,
+        shop_slug=shop,
+        sort_by="advanced",
+        min_score=min_score,
+        max_price=max_price,
+    )
+    cached = await cache.get(cache_key)
+    if cached:
+        return ApiResponse.model_validate_json(cached)
+
     service = SearchService(db)
     deals, total = await service.search_deals_advanced(
         query=q,
@@ -92,11 +133,12 @@ async def advanced_search(
         max_price=max_price,
         category_slug=category,
         shop_slug=shop,
+        track_keyword=False,
     )
 
     total_pages = (total + limit - 1) // limit if total > 0 else 0
 
-    return ApiResponse(
+    response = ApiResponse(
         status="success",
         data=[DealResponse.model_validate(d) for d in deals],
         meta=PaginationMeta(
@@ -106,3 +148,7 @@ async def advanced_search(
             total_pages=total_pages,
         ),
     )
+
+    await cache.set(cache_key, response.model_dump_json(), ttl=60)
+
+    return response
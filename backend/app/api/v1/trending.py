@@ -54,11 +54,25 @@ async def get_recent_searches(
     """Get recently searched keywords.
 
     Returns the most recently searched keywords with their search counts and timestamps.
+
+    This endpoint is cached for 60 seconds.
     """
+    cache = await get_cache()
+    cache_key = f"trending:recent:limit={limit}"
+
+    cached = await cache.get(cache_key)
+    if cached:
+        return ApiResponse.model_validate_json(cached)
+
     service = SearchService(db)
     recent = await service.get_recent_keywords(limit=limit)
 
-    return ApiResponse(
+    response = ApiResponse(
         status="success",
         data=[RecentKeywordResponse(**kw) for kw in recent],
     )
+
+    # Recent searches move faster than trending ones, so cache for less time
+    await cache.set(cache_key, response.model_dump_json(), ttl=60)
+
+    return response
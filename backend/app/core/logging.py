@@ -1,10 +1,16 @@
 """Structured logging configuration using structlog."""
 
+import logging
+
 import structlog
 
 
-def setup_logging() -> None:
-    """Configure structlog for the application."""
+def setup_logging(level: int = logging.INFO) -> None:
+    """Configure structlog for the application.
+
+    Args:
+        level: Minimum level to emit; calls below it are no-ops
+    """
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -14,7 +20,7 @@ def setup_logging() -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.dev.ConsoleRenderer(),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(0),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
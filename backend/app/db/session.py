@@ -1,15 +1,29 @@
 """Async database session and engine configuration."""
 
+import asyncio
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
 # SQLite doesn't support pool_size / max_overflow / pool_pre_ping
 _is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
+POOL_SIZE = 20
+
+# Connections opened by prewarm_pool() at startup
+POOL_PREWARM_CONNECTIONS = 5
+
 _engine_kwargs: dict = {"echo": settings.DEBUG}
 if not _is_sqlite:
-    _engine_kwargs.update(pool_size=20, max_overflow=10, pool_pre_ping=True)
+    _engine_kwargs.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=10,
+        pool_pre_ping=True,
+    )
 
 engine = create_async_engine(settings.DATABASE_URL, **_engine_kwargs)
 
@@ -18,3 +32,24 @@ async_session_factory = async_sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
 )
+
+
+async def prewarm_pool(connections: int = POOL_PREWARM_CONNECTIONS) -> None:
+    """Open pool connections ahead of the first requests.
+
+    The pool connects lazily, so without this the first requests after a
+    deploy each pay for a TCP/TLS handshake and asyncpg's type introspection.
+    Checkouts run concurrently so each one gets its own connection, and all
+    of them go back to the pool afterwards.
+
+    Args:
+        connections: Number of connections to open (at most POOL_SIZE)
+    """
+    if _is_sqlite:
+        return
+
+    async def _checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(min(connections, POOL_SIZE))))
@@ -8,20 +8,23 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_v1_router
 from app.config import settings
-from app.db.session import async_session_factory, engine
+from app.db.session import async_session_factory, engine, prewarm_pool
 import asyncio
 import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select, text
+from sqlalchemy.schema import CreateIndex
 
 from app.scrapers.scheduler import ScraperScheduler
 from app.scrapers.register_adapters import register_all_adapters
 from app.scrapers.utils.browser_manager import get_browser_manager
 from app.scrapers.utils.normalizer import CurrencyConverter
 from app.services.cache_service import get_cache_service
+from app.services.deal_service import ACTIVE_DEAL_INDEX
 from app.models.base import Base
+from app.core.logging import setup_logging
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +32,7 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
+setup_logging(logging.DEBUG if settings.DEBUG else logging.INFO)
 
 # Global scheduler instance
 scheduler: ScraperScheduler = None
@@ -53,27 +57,106 @@ async def lifespan(app: FastAPI):
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables verified/created")
 
-        # Create optional PostgreSQL-specific indexes (GIN trigram for search)
         if not settings.DATABASE_URL.startswith("sqlite"):
+            # The active-deal unique index backs the ON CONFLICT upsert in
+            # DealService.create_or_update_deal. create_all only builds it
+            # for new tables, so add it to existing databases here, in its
+            # own transaction. Duplicate active deals left by older versions
+            # block it; POST /api/v1/ingest/migrate-fix deactivates those and
+            # builds it. Until then new deals use a plain INSERT.
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(CreateIndex(ACTIVE_DEAL_INDEX, if_not_exists=True))
+            except Exception as idx_err:
+                logger.error(
+                    f"Could not create {ACTIVE_DEAL_INDEX.name}; run "
+                    f"POST /api/v1/ingest/migrate-fix to remove duplicate active deals: {idx_err}"
+                )
+
+            # Create optional PostgreSQL-specific indexes (GIN trigram for search)
             try:
                 async with engine.begin() as conn:
                     await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                    # Search only ever matches active deals, so the title
+                    # trigram index skips inactive ones; it replaces the
+                    # older full-table idx_deals_title_trgm
                     await conn.execute(text(
-                        "CREATE INDEX IF NOT EXISTS idx_deals_title_trgm "
-                        "ON deals USING gin (title gin_trgm_ops)"
+                        "CREATE INDEX IF NOT EXISTS idx_deals_title_trgm_active "
+                        "ON deals USING gin (title gin_trgm_ops) WHERE is_active"
                     ))
+                    await conn.execute(text("DROP INDEX IF EXISTS idx_deals_title_trgm"))
                     await conn.execute(text(
                         "CREATE INDEX IF NOT EXISTS idx_products_title_trgm "
                         "ON products USING gin (title gin_trgm_ops)"
                     ))
+                    # Top-deals indexes: predicate matches get_top_deals'
+                    # WHERE so ORDER BY ai_score DESC LIMIT n reads n entries
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_top "
+                        "ON deals (ai_score DESC) "
+                        "WHERE is_active AND ai_score IS NOT NULL"
+                    ))
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_top_category "
+                        "ON deals (category_id, ai_score DESC) "
+                        "WHERE is_active AND ai_score IS NOT NULL"
+                    ))
+                    await conn.execute(text("DROP INDEX IF EXISTS idx_deals_ai_score_active"))
+                    # Expiry sweep only ever looks at active deals with a deadline
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_expiring "
+                        "ON deals (expires_at) "
+                        "WHERE is_active AND expires_at IS NOT NULL"
+                    ))
+                    # Newest-first history reads for scoring can be served
+                    # from the index alone (declared on the model for new
+                    # databases). It makes the older product_id indexes
+                    # redundant, so drop them to save work on every insert.
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_price_history_product_recent "
+                        "ON price_history (product_id, recorded_at DESC) INCLUDE (price)"
+                    ))
+                    await conn.execute(text(
+                        "DROP INDEX IF EXISTS idx_price_history_product_recorded"
+                    ))
+                    await conn.execute(text(
+                        "DROP INDEX IF EXISTS ix_price_history_product_id"
+                    ))
+                    # (user_id, deal_id) unique constraint already covers
+                    # user_id lookups
+                    await conn.execute(text("DROP INDEX IF EXISTS ix_user_votes_user_id"))
+                    # Keyset pagination indexes for DealService.get_deals
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_keyset_created "
+                        "ON deals (is_active, created_at DESC, id DESC)"
+                    ))
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_keyset_score "
+                        "ON deals (is_active, (COALESCE(ai_score, -1)) DESC, id DESC)"
+                    ))
                     await conn.execute(text(
-                        "CREATE INDEX IF NOT EXISTS idx_deals_ai_score_active "
-                        "ON deals (ai_score) WHERE is_active = true"
+                        "CREATE INDEX IF NOT EXISTS idx_deals_keyset_discount "
+                        "ON deals (is_active, (COALESCE(discount_percentage, -1)) DESC, id DESC)"
                     ))
                 logger.info("PostgreSQL GIN/partial indexes created")
             except Exception as idx_err:
                 logger.warning(f"Could not create optional PG indexes (non-fatal): {idx_err}")
 
+            # GiST trigram index for relevance-ranked search, which orders by
+            # the <<-> distance that GIN can't serve. The default 12-byte
+            # signature saturates on full product titles and turns most index
+            # entries into false positives; 256 bytes keeps titles of a few
+            # hundred characters distinguishable. siglen needs PostgreSQL 13+,
+            # so this runs on its own and may fail without losing the above.
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS idx_deals_title_trgm_gist "
+                        "ON deals USING gist (title gist_trgm_ops(siglen=256))"
+                    ))
+            except Exception as idx_err:
+                logger.warning(f"Could not create trigram GiST index (non-fatal): {idx_err}")
+
         # Seed initial data if empty
         from app.models.shop import Shop
         from app.models.category import Category
@@ -103,6 +186,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Database init failed: {e}", exc_info=True)
 
+    # Open pooled connections now rather than on the first requests
+    try:
+        await prewarm_pool()
+    except Exception as e:
+        logger.warning(f"Database pool prewarm failed (non-fatal): {e}")
+
     # Register all scraper adapters
     logger.info("Registering scraper adapters...")
     register_all_adapters()
@@ -119,6 +208,9 @@ async def lifespan(app: FastAPI):
             logger.info(f"Scheduler started with {jobs_count} shop jobs")
         except Exception as e:
             logger.error(f"Failed to load shop jobs: {e}", exc_info=True)
+
+        # Publish category medians to Redis for limited-history scoring
+        scheduler.add_category_stats_job()
     else:
         logger.info("Scheduler disabled (test environment)")
 
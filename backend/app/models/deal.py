@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Text, ForeignKey, Boolean, Numeric, DateTime, Integer, Index
+from sqlalchemy import String, Text, ForeignKey, Boolean, Numeric, DateTime, Integer, Index, text
 from sqlalchemy import JSON as JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -140,6 +140,14 @@ class Deal(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __table_args__ = (
         Index("idx_deals_active_created", "is_active", "created_at"),
         Index("idx_deals_expires_at", "expires_at"),
+        # At most one active deal per product+shop; backs the ON CONFLICT
+        # upsert in DealService.create_or_update_deal (PostgreSQL only)
+        Index(
+            "uq_deals_active_product_shop",
+            "product_id", "shop_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ).ddl_if(dialect="postgresql"),
     )
 
     # Relationships
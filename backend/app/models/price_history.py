@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, Numeric, DateTime, Index, func
+from sqlalchemy import String, ForeignKey, Numeric, DateTime, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, UUIDPrimaryKeyMixin
@@ -27,7 +27,6 @@ class PriceHistory(UUIDPrimaryKeyMixin, Base):
     product_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
 
     # Price data
@@ -50,9 +49,17 @@ class PriceHistory(UUIDPrimaryKeyMixin, Base):
         comment="When this price was recorded"
     )
 
-    # Indexes for efficient queries
+    # Indexes for efficient queries. Newest-first reads per product (scoring
+    # windows, last recorded price) are a range scan on the composite index,
+    # which also serves plain product_id lookups; on PostgreSQL it carries
+    # price so those reads never touch the heap.
     __table_args__ = (
-        Index("idx_price_history_product_recorded", "product_id", "recorded_at"),
+        Index(
+            "idx_price_history_product_recent",
+            "product_id",
+            text("recorded_at DESC"),
+            postgresql_include=["price"],
+        ),
         Index("idx_price_history_recorded_desc", "recorded_at", postgresql_using="btree"),
     )
 
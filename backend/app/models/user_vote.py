@@ -20,9 +20,10 @@ class UserVote(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     __tablename__ = "user_votes"
 
+    # Lookups by user_id use the leading column of uq_user_deal_vote
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False, index=True,
+        nullable=False,
     )
     deal_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("deals.id", ondelete="CASCADE"),
@@ -14,6 +14,7 @@ class PaginationMeta(BaseModel):
     limit: int = 20  # Changed from 'size' to 'limit' for consistency
     total: int = 0
     total_pages: int = 0
+    next_cursor: str | None = None
 
 
 class ApiResponse(BaseModel, Generic[T]):
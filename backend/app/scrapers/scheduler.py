@@ -20,6 +20,10 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.models.shop import Shop
 from app.models.scraper_job import ScraperJob
 from app.scrapers.scraper_service import ScraperService
+from app.services.category_stats_refresher import (
+    REFRESH_INTERVAL_MINUTES,
+    refresh_category_medians,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -191,6 +195,43 @@ class ScraperScheduler:
         self.logger.info("shop_job_removed", shop_slug=shop_slug)
         return True
 
+    def add_category_stats_job(self) -> Job:
+        """Add the periodic job that publishes category medians to Redis.
+
+        The first run fires immediately so scoring has medians right
+        after startup.
+
+        Returns:
+            APScheduler Job instance
+        """
+        job = self.scheduler.add_job(
+            func=self._run_category_stats_wrapper,
+            trigger=IntervalTrigger(minutes=REFRESH_INTERVAL_MINUTES, timezone="UTC"),
+            id="refresh_category_medians",
+            name="Refresh category medians",
+            replace_existing=True,
+            max_instances=1,
+            next_run_time=datetime.now(timezone.utc),
+        )
+
+        self.logger.info(
+            "category_stats_job_added",
+            interval_minutes=REFRESH_INTERVAL_MINUTES,
+        )
+
+        return job
+
+    async def _run_category_stats_wrapper(self) -> None:
+        """Wrapper for refresh_category_medians that handles exceptions."""
+        try:
+            await refresh_category_medians(self.db_session_factory)
+        except Exception as e:
+            self.logger.error(
+                "category_stats_job_failed",
+                error=str(e),
+                exc_info=True,
+            )
+
     async def _run_shop_scrape_wrapper(self, shop_slug: str) -> None:
         """Wrapper for run_shop_scrape that handles exceptions.
 
@@ -250,7 +291,7 @@ class ScraperScheduler:
 
             try:
                 # Run scraper service
-                scraper_service = ScraperService(db)
+                scraper_service = ScraperService(db, session_factory=self.db_session_factory)
                 stats = await scraper_service.run_adapter(shop_slug)
 
                 # Calculate duration
@@ -4,17 +4,18 @@ This service connects the scraper adapter layer with the database services.
 It handles the end-to-end flow from fetching deals to storing them in the database.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 from decimal import Decimal
 import structlog
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.shop import Shop
 from app.models.category import Category
+from app.models.product import Product
 from app.scrapers.base import NormalizedDeal, BaseScraperAdapter
 from app.scrapers.factory import get_adapter_factory
 from app.scrapers.utils.browser_manager import get_browser_manager
@@ -32,15 +33,21 @@ class ScraperService:
     It handles the complete flow: fetch deals → upsert products → create deals → log results.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
         """Initialize scraper service.
 
         Args:
             db: Async database session
+            session_factory: Optional factory passed to DealService so deal
+                scoring can read price history on a side connection
         """
         self.db = db
         self.product_service = ProductService(db)
-        self.deal_service = DealService(db)
+        self.deal_service = DealService(db, session_factory=session_factory)
         self.price_analyzer = PriceAnalyzer(db)
         self.adapter_factory = get_adapter_factory()
         self.logger = logger.bind(service="scraper_service")
@@ -131,11 +138,10 @@ class ScraperService:
     ) -> Dict[str, int]:
         """Process a list of normalized deals into the database.
 
-        For each deal:
-        1. Upsert the product
-        2. Record price history (done by ProductService)
-        3. Compute AI score
-        4. Create or update deal
+        Products for all deals are upserted in bulk first (ProductService
+        also records their price history), then for each deal:
+        1. Compute AI score
+        2. Create or update deal
 
         Args:
             deals: List of NormalizedDeal from adapter
@@ -167,6 +173,8 @@ class ScraperService:
             self.logger.error("shop_not_found", shop_slug=shop_slug)
             return stats
 
+        # Resolve categories first so every product can go into one bulk upsert
+        prepared: List[Tuple[NormalizedDeal, Optional[UUID]]] = []
         for deal in deals:
             try:
                 # Auto-categorize product: use hint, fallback to title classifier
@@ -185,21 +193,26 @@ class ScraperService:
                 if deal.image_url and deal.image_url.startswith("http://"):
                     deal.image_url = "https://" + deal.image_url[7:]
 
-                # Upsert product
-                product_before_count = await self._count_products(shop.id)
-                product = await self.product_service.upsert_product(
-                    shop_id=shop.id,
-                    normalized=deal.product,
-                    category_id=category_id,
+                prepared.append((deal, category_id))
+
+            except Exception as e:
+                stats["errors"] += 1
+                self.logger.error(
+                    "deal_processing_failed",
+                    deal_title=deal.title[:50] if deal.title else "unknown",
+                    error=str(e),
+                    exc_info=True,
                 )
-                product_after_count = await self._count_products(shop.id)
 
-                # Track if product was created or updated
-                if product_after_count > product_before_count:
-                    stats["products_created"] += 1
-                else:
-                    stats["products_updated"] += 1
+        # Upsert products
+        products = await self._upsert_products(shop.id, prepared, stats)
+
+        for (deal, _), product in zip(prepared, products):
+            if product is None:
+                # Product upsert failed (already counted in stats["errors"])
+                continue
 
+            try:
                 # Create or update deal (returns None when score < DEAL_THRESHOLD)
                 deal_before_count = await self._count_active_deals(product.id, shop.id)
 
@@ -263,6 +276,66 @@ class ScraperService:
 
         return stats
 
+    async def _upsert_products(
+        self,
+        shop_id: UUID,
+        prepared: List[Tuple[NormalizedDeal, Optional[UUID]]],
+        stats: Dict[str, int],
+    ) -> List[Optional[Product]]:
+        """Upsert the products of prepared deals, in bulk where possible.
+
+        If the bulk upsert fails, falls back to one upsert per product so a
+        single bad product only costs itself. Updates the product counters
+        and errors in stats.
+
+        Args:
+            shop_id: Shop UUID
+            prepared: (deal, category UUID) pairs
+            stats: Processing statistics to update
+
+        Returns:
+            Product for each pair, or None where its upsert failed
+        """
+        items = [(deal.product, category_id) for deal, category_id in prepared]
+        products_before = await self._count_products(shop_id)
+
+        try:
+            products: List[Optional[Product]] = list(
+                await self.product_service.bulk_upsert_products(shop_id, items)
+            )
+        except Exception as e:
+            await self.db.rollback()
+            self.logger.warning(
+                "bulk_product_upsert_failed",
+                count=len(items),
+                error=str(e),
+                exc_info=True,
+            )
+            products = []
+            for normalized, category_id in items:
+                try:
+                    products.append(await self.product_service.upsert_product(
+                        shop_id=shop_id,
+                        normalized=normalized,
+                        category_id=category_id,
+                    ))
+                except Exception as e:
+                    await self.db.rollback()
+                    products.append(None)
+                    stats["errors"] += 1
+                    self.logger.error(
+                        "product_upsert_failed",
+                        external_id=normalized.external_id,
+                        error=str(e),
+                        exc_info=True,
+                    )
+
+        created = await self._count_products(shop_id) - products_before
+        stats["products_created"] += created
+        stats["products_updated"] += sum(p is not None for p in products) - created
+
+        return products
+
     async def _get_shop(self, shop_slug: str) -> Optional[Shop]:
         """Get shop by slug.
 
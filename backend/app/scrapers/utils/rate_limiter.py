@@ -10,7 +10,9 @@ class TokenBucket:
 
     The bucket starts full and refills at a constant rate.
     Each request consumes one token. If no tokens are available,
-    the request waits until tokens are refilled.
+    the request reserves one anyway (the balance goes negative) and
+    sleeps until its reservation is covered, so waiters are served
+    in order without holding anything while they sleep.
     """
 
     def __init__(self, rate: float, capacity: float):
@@ -24,7 +26,6 @@ class TokenBucket:
         self.capacity = capacity
         self.tokens = capacity
         self.last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time since last refill."""
@@ -39,15 +40,19 @@ class TokenBucket:
         Args:
             tokens: Number of tokens to acquire (default 1.0)
         """
-        async with self._lock:
-            while True:
+        # No await between refill and reservation, so this is atomic
+        # with respect to other tasks on the event loop
+        self._refill()
+        self.tokens -= tokens
+        if self.tokens < 0:
+            # Wait until the refill has paid back this reservation
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                # The request won't be made; hand the reservation back
                 self._refill()
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    return
-                # Calculate wait time until we have enough tokens
-                wait_time = (tokens - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
+                self.tokens = min(self.capacity, self.tokens + tokens)
+                raise
 
 
 class DomainRateLimiter:
@@ -5,7 +5,7 @@ of the DealHawk platform. Services handle data access, analysis, and
 orchestration of complex operations.
 """
 
-from app.services.price_analysis import PriceAnalyzer, DealScore
+from app.services.price_analysis import PriceAnalyzer, DealScore, ScoreInput
 from app.services.deal_service import DealService
 from app.services.product_service import ProductService
 from app.services.search_service import SearchService
@@ -13,6 +13,7 @@ from app.services.search_service import SearchService
 __all__ = [
     "PriceAnalyzer",
     "DealScore",
+    "ScoreInput",
     "DealService",
     "ProductService",
     "SearchService",
@@ -4,8 +4,11 @@ This module provides a singleton Redis cache service with TTL support,
 pattern-based invalidation, and health checking.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+import hashlib
 import json
+import time
 import structlog
 
 from redis.asyncio import Redis, from_url
@@ -244,6 +247,67 @@ class NullCacheService(CacheService):
         pass
 
 
+class LocalTTLCache:
+    """Bounded in-process cache with per-entry TTL.
+
+    Used for small, hot values (e.g. list counts) where even a Redis round
+    trip is too expensive. Entries expire after ``ttl`` seconds and the
+    least recently written entry is evicted once ``maxsize`` is reached.
+    Not shared between worker processes.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 15.0):
+        """Initialize local cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Time-to-live in seconds for each entry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ``ttl`` seconds."""
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries whose key matches predicate (all entries if None).
+
+        Returns:
+            Number of entries removed
+        """
+        if predicate is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
 def get_cache_service() -> CacheService:
     """Get or create the global cache service instance.
 
@@ -296,6 +360,7 @@ async def invalidate_deals_cache() -> int:
         "deals:*",
         "deals_top:*",
         "trending:*",
+        "search:*",
     ]
 
     total_deleted = 0
@@ -316,6 +381,7 @@ def cache_key_for_deals(
     sort_by: str = "newest",
     min_discount: Optional[float] = None,
     deal_type: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> str:
     """Generate cache key for deals endpoint.
 
@@ -327,6 +393,7 @@ def cache_key_for_deals(
         sort_by: Sort method
         min_discount: Minimum discount filter
         deal_type: Deal type filter
+        cursor: Keyset pagination cursor
 
     Returns:
         Cache key string
@@ -350,6 +417,9 @@ def cache_key_for_deals(
     if deal_type:
         parts.append(f"t{deal_type}")
 
+    if cursor:
+        parts.append(f"k{cursor}")
+
     return ":".join(parts)
 
 
@@ -372,3 +442,42 @@ def cache_key_for_top_deals(
         parts.append(f"c{category_slug}")
 
     return ":".join(parts)
+
+
+def cache_key_for_search(
+    query: str,
+    page: int = 1,
+    limit: int = 20,
+    category_slug: Optional[str] = None,
+    shop_slug: Optional[str] = None,
+    sort_by: str = "relevance",
+    min_score: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> str:
+    """Generate cache key for search endpoints.
+
+    The query is arbitrary user text, so the parameters are hashed instead
+    of being joined into the key. Title matching ignores case, so the query
+    is lowercased first and differently-cased searches share an entry.
+
+    Args:
+        query: Search query
+        page: Page number
+        limit: Results per page
+        category_slug: Category filter
+        shop_slug: Shop filter
+        sort_by: Sort method ("advanced" for the advanced search endpoint)
+        min_score: Minimum AI score filter
+        max_price: Maximum price filter
+
+    Returns:
+        Cache key string
+    """
+    raw = "|".join(
+        str(part)
+        for part in (
+            query.strip().lower(), page, limit, category_slug, shop_slug,
+            sort_by, min_score, max_price,
+        )
+    )
+    return f"search:{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"
@@ -0,0 +1,69 @@
+"""Periodic refresh of per-category price medians.
+
+Limited-history deal scoring compares a deal's price against the median of
+its category. Medians drift over hours, so instead of computing them on the
+scoring path this job recomputes all of them every few minutes and publishes
+each to its own Redis key (category_median_cache_key), where PriceAnalyzer
+reads only the categories it scores.
+"""
+
+import json
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.category import Category
+from app.services.cache_service import get_cache_service
+from app.services.price_analysis import (
+    CATEGORY_MEDIAN_CACHE_MIN_PEERS,
+    CATEGORY_MEDIANS_REFRESH_MINUTES,
+    category_median_cache_key,
+    compute_category_medians,
+)
+
+logger = structlog.get_logger(__name__)
+
+REFRESH_INTERVAL_MINUTES = CATEGORY_MEDIANS_REFRESH_MINUTES
+
+# Outlive a couple of missed refreshes, but expire if the job stops running
+# so scoring falls back to the DB instead of using very old medians.
+CATEGORY_MEDIANS_TTL_SECONDS = REFRESH_INTERVAL_MINUTES * 60 * 3
+
+
+async def refresh_category_medians(
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> int:
+    """Recompute category medians and publish them to Redis.
+
+    Only categories with more than CATEGORY_MEDIAN_CACHE_MIN_PEERS active
+    deals are published, matching what PriceAnalyzer caches in-process;
+    keys of categories that fell below it are deleted.
+
+    Args:
+        db_session_factory: Async session factory for database access
+
+    Returns:
+        Number of categories published
+    """
+    async with db_session_factory() as db:
+        medians = await compute_category_medians(db)
+        slug_result = await db.execute(select(Category.id, Category.slug))
+        slugs = dict(slug_result.all())
+
+    payload = {
+        slugs[category_id]: [median, count]
+        for category_id, (median, count) in medians.items()
+        if count > CATEGORY_MEDIAN_CACHE_MIN_PEERS and category_id in slugs
+    }
+
+    cache = get_cache_service()
+    for slug in slugs.values():
+        key = category_median_cache_key(slug)
+        if slug in payload:
+            await cache.set(key, json.dumps(payload[slug]), ttl=CATEGORY_MEDIANS_TTL_SECONDS)
+        else:
+            await cache.delete(key)
+
+    logger.info("category_medians_refreshed", categories=len(payload))
+    return len(payload)
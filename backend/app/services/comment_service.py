@@ -3,12 +3,31 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, update, literal, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, noload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.comment import Comment
 from app.models.deal import Deal
+from app.models.user import User
+
+# Built once and reused so each request skips statement construction and
+# hits SQLAlchemy's compiled-SQL cache directly. Authors, replies and reply
+# authors are JOINed into the same SELECT (one round trip instead of three).
+_DEAL_COMMENTS_QUERY = (
+    select(Comment)
+    .where(Comment.deal_id == bindparam("deal_id"), Comment.parent_id.is_(None), Comment.is_deleted == False)
+    .options(
+        joinedload(Comment.user),
+        joinedload(Comment.replies).options(
+            joinedload(Comment.user),
+            # Threads are one level deep; never lazy-load under AsyncSession
+            noload(Comment.replies),
+        ),
+    )
+    .order_by(Comment.created_at.asc())
+)
 
 
 class CommentService:
@@ -21,74 +40,91 @@ class CommentService:
         self, deal_id: uuid.UUID
     ) -> List[Comment]:
         """Get all top-level comments for a deal with nested replies."""
-        stmt = (
-            select(Comment)
-            .where(Comment.deal_id == deal_id, Comment.parent_id.is_(None), Comment.is_deleted == False)
-            .options(
-                selectinload(Comment.user),
-                selectinload(Comment.replies).selectinload(Comment.user),
-            )
-            .order_by(Comment.created_at.asc())
-        )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        result = await self.db.execute(_DEAL_COMMENTS_QUERY, {"deal_id": deal_id})
+        return list(result.unique().scalars().all())
 
     async def create_comment(
         self,
         deal_id: uuid.UUID,
-        user_id: uuid.UUID,
+        user: User,
         content: str,
         parent_id: Optional[uuid.UUID] = None,
     ) -> Optional[Comment]:
-        """Create a new comment on a deal. Returns None if deal not found."""
-        # Validate deal exists
-        deal_check = await self.db.execute(select(Deal).where(Deal.id == deal_id))
-        if not deal_check.scalar_one_or_none():
-            return None
+        """Create a new comment on a deal. Returns None if deal not found.
 
-        # Validate parent comment if replying
+        ``user`` is the already-loaded author (e.g. from get_current_user);
+        it is attached to the new comment instead of being re-selected.
+        """
+        comment_id = uuid.uuid4()
+        columns = Comment.__table__.c
+
+        conditions = [select(Deal.id).where(Deal.id == deal_id).exists()]
         if parent_id:
-            parent_check = await self.db.execute(
-                select(Comment).where(
+            conditions.append(
+                select(Comment.id).where(
                     Comment.id == parent_id,
                     Comment.deal_id == deal_id,
                     Comment.is_deleted == False,
-                )
+                ).exists()
+            )
+
+        source = select(
+            literal(comment_id, columns.id.type),
+            literal(deal_id, columns.deal_id.type),
+            literal(user.id, columns.user_id.type),
+            literal(parent_id, columns.parent_id.type),
+            literal(content, columns.content.type),
+            literal(False, columns.is_deleted.type),
+        ).where(*conditions)
+
+        insert_stmt = (
+            insert(Comment)
+            .from_select(
+                ["id", "deal_id", "user_id", "parent_id", "content", "is_deleted"],
+                source,
             )
-            if not parent_check.scalar_one_or_none():
-                return None
-
-        comment = Comment(
-            deal_id=deal_id,
-            user_id=user_id,
-            content=content,
-            parent_id=parent_id,
+            .returning(Comment)
         )
-        self.db.add(comment)
-        await self.db.flush()
+        # Deal/parent validation happens inside the INSERT: nothing is
+        # inserted (and no row returned) when either target is missing
+        result = await self.db.execute(insert_stmt)
+        comment = result.scalar_one_or_none()
+        if comment is None:
+            return None
 
         # Increment deal comment_count
-        stmt = select(Deal).where(Deal.id == deal_id)
-        result = await self.db.execute(stmt)
-        deal = result.scalar_one_or_none()
-        if deal:
-            deal.comment_count = deal.comment_count + 1
+        await self.db.execute(
+            update(Deal)
+            .where(Deal.id == deal_id)
+            .values(comment_count=Deal.comment_count + 1)
+        )
 
-        # Reload with user relationship
-        await self.db.refresh(comment, ["user"])
+        # The author is already in memory and a new comment has no replies
+        set_committed_value(comment, "user", user)
+        set_committed_value(comment, "replies", [])
         return comment
 
     async def update_comment(
         self,
         comment_id: uuid.UUID,
-        user_id: uuid.UUID,
+        user: User,
         content: str,
     ) -> Optional[Comment]:
-        """Update a comment's content. Only the author can edit."""
-        stmt = select(Comment).where(
-            Comment.id == comment_id,
-            Comment.user_id == user_id,
-            Comment.is_deleted == False,
+        """Update a comment's content. Only the author can edit.
+
+        ``user`` is the already-loaded author and is attached to the
+        returned comment without another SELECT.
+        """
+        stmt = (
+            update(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.user_id == user.id,
+                Comment.is_deleted == False,
+            )
+            .values(content=content)
+            .returning(Comment)
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
         comment = result.scalar_one_or_none()
@@ -96,9 +132,7 @@ class CommentService:
         if not comment:
             return None
 
-        comment.content = content
-        await self.db.flush()
-        await self.db.refresh(comment, ["user"])
+        set_committed_value(comment, "user", user)
         return comment
 
     async def delete_comment(
@@ -121,11 +155,11 @@ class CommentService:
         comment.is_deleted = True
         comment.content = "삭제된 댓글입니다"
 
-        # Decrement deal comment_count
-        deal_stmt = select(Deal).where(Deal.id == comment.deal_id)
-        deal_result = await self.db.execute(deal_stmt)
-        deal = deal_result.scalar_one_or_none()
-        if deal and deal.comment_count > 0:
-            deal.comment_count = deal.comment_count - 1
+        # Decrement deal comment_count atomically (never below zero)
+        await self.db.execute(
+            update(Deal)
+            .where(Deal.id == comment.deal_id, Deal.comment_count > 0)
+            .values(comment_count=Deal.comment_count - 1)
+        )
 
         return True
@@ -4,25 +4,281 @@ This service handles creating, updating, querying, and expiring deals.
 It integrates with the PriceAnalyzer to compute AI scores for all deals.
 """
 
+import asyncio
+import base64
+import json
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, func, and_, update, or_
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, and_, update, insert, or_, tuple_, literal_column, bindparam, Integer, text
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import contains_eager, joinedload
 
 from app.models.deal import Deal
 from app.models.product import Product
 from app.models.price_history import PriceHistory
 from app.models.shop import Shop
 from app.models.category import Category
-from app.services.price_analysis import PriceAnalyzer, DEAL_THRESHOLD, CATEGORY_THRESHOLDS
+from app.services.cache_service import LocalTTLCache
+from app.services.price_analysis import (
+    PriceAnalyzer,
+    PriceStats,
+    DEAL_THRESHOLD,
+    CATEGORY_THRESHOLDS,
+    HISTORY_WINDOW_DAYS,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Filtered deal counts keyed by (category_slug, shop_slug, min_discount,
+# deal_type). Totals rarely change second-to-second, so a short TTL lets
+# cursor pages skip the COUNT(*) scan entirely.
+_deal_count_cache = LocalTTLCache(maxsize=1024, ttl=15)
+
+# (category_id, shop_id) -> (category_slug, shop_slug) from recent upserts, so
+# a memoized DealScore can be found before the price history is fetched
+_deal_slug_cache = LocalTTLCache(maxsize=1024, ttl=3600)
+
+
+def invalidate_deal_counts(
+    category_slug: Optional[str] = None,
+    shop_slug: Optional[str] = None,
+) -> int:
+    """Drop cached deal counts that may include the given category/shop.
+
+    With no arguments every cached count is dropped.
+
+    Returns:
+        Number of cached counts removed
+    """
+    if category_slug is None and shop_slug is None:
+        return _deal_count_cache.invalidate()
+
+    return _deal_count_cache.invalidate(
+        lambda key: key[0] in (None, category_slug) and key[1] in (None, shop_slug)
+    )
+
+# Sort keys for deal listings: (Deal attribute, ORDER BY expression).
+# Nullable columns are coalesced to -1 so NULLs sort last on every dialect
+# and keyset cursors always have a concrete value to compare against. The
+# expressions match the PostgreSQL indexes created at startup in main.py.
+_SORT_KEYS = {
+    "newest": ("created_at", Deal.created_at),
+    "score": ("ai_score", func.coalesce(Deal.ai_score, literal_column("-1"))),
+    "discount": ("discount_percentage", func.coalesce(Deal.discount_percentage, literal_column("-1"))),
+    "views": ("view_count", Deal.view_count),
+}
+
+# Unfiltered listings on PostgreSQL report the planner's row estimate as
+# the total instead of counting every active deal; below this size the
+# exact COUNT(*) is cheap enough to run.
+_ESTIMATED_COUNT_MIN = 10_000
+
+# Columns refreshed when an insert collides with an existing active deal;
+# mirrors the fields create_or_update_deal updates on an existing deal.
+_UPSERT_COLUMNS = (
+    "deal_price",
+    "original_price",
+    "discount_percentage",
+    "discount_amount",
+    "ai_score",
+    "ai_reasoning",
+    "title",
+    "image_url",
+    "deal_url",
+    "description",
+    "expires_at",
+)
+
+# Unique index on active (product_id, shop_id), declared on the Deal model;
+# the PostgreSQL ON CONFLICT upsert needs it to exist
+ACTIVE_DEAL_INDEX = next(
+    index for index in Deal.__table__.indexes
+    if index.name == "uq_deals_active_product_shop"
+)
+
+# Whether ACTIVE_DEAL_INDEX exists, checked once per process (None = unknown).
+# Existing databases only get it once startup or migrate-fix can build it.
+_active_deal_index_exists: Optional[bool] = None
+
+
+def reset_active_deal_index_check() -> None:
+    """Forget whether ACTIVE_DEAL_INDEX exists, e.g. after building it."""
+    global _active_deal_index_exists
+    _active_deal_index_exists = None
+
+
+async def _has_active_deal_index(db: AsyncSession) -> bool:
+    """Return whether ACTIVE_DEAL_INDEX exists, querying at most once."""
+    global _active_deal_index_exists
+    if _active_deal_index_exists is None:
+        found = await db.scalar(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = :name"),
+            {"name": ACTIVE_DEAL_INDEX.name},
+        )
+        _active_deal_index_exists = found is not None
+        if not _active_deal_index_exists:
+            logger.warning("active_deal_index_missing", index=ACTIVE_DEAL_INDEX.name)
+    return _active_deal_index_exists
+
+
+def encode_deal_cursor(deal: Deal, sort_by: str = "newest") -> str:
+    """Build an opaque keyset cursor pointing just after ``deal``.
+
+    Args:
+        deal: Last deal of the current page
+        sort_by: Sort method the page was fetched with
+
+    Returns:
+        URL-safe cursor string for the next ``get_deals`` call
+    """
+    attr, _ = _SORT_KEYS.get(sort_by, _SORT_KEYS["newest"])
+    value = getattr(deal, attr)
+    if value is None:
+        value = -1
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+
+    payload = json.dumps([value, str(deal.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_deal_cursor(cursor: str, sort_by: str) -> Tuple[Any, UUID]:
+    """Decode a cursor produced by ``encode_deal_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        value, deal_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if sort_by == "newest":
+            value = datetime.fromisoformat(value)
+        elif sort_by == "views":
+            value = int(value)
+        else:
+            value = Decimal(str(value))
+        return value, UUID(deal_id)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+# Statements are built once per filter shape with values left as bound
+# parameters, then reused. Reusing the same Select object skips statement
+# construction and lets SQLAlchemy reuse its memoized cache key, so each
+# request goes straight to the engine's compiled-SQL cache.
+@lru_cache(maxsize=256)
+def _deal_list_statements(
+    has_category: bool,
+    has_shop: bool,
+    has_min_discount: bool,
+    has_deal_type: bool,
+    sort_by: str,
+    keyset: bool,
+    window_total: bool = True,
+) -> Tuple[Select, Select]:
+    """Build the (page, count) statements for one get_deals filter shape."""
+    # Base query - only active deals with eager loading. For offset pages
+    # the total is carried on every row via a window function so one round
+    # trip returns both the page and the filtered count; under a cursor the
+    # window would only count the remaining rows.
+    if keyset or not window_total:
+        columns = [Deal]
+    else:
+        columns = [Deal, func.count().over().label("total")]
+    query = select(*columns).where(Deal.is_active == True)
+    count_query = select(func.count(Deal.id)).where(Deal.is_active == True)
+
+    # Apply filters. Shop and category are many-to-one, so they are loaded
+    # in the same round trip: reuse the filter JOIN when there is one,
+    # otherwise eager-load with a LEFT OUTER JOIN.
+    if has_category:
+        query = (
+            query.join(Deal.category)
+            .options(contains_eager(Deal.category))
+            .where(Category.slug == bindparam("category_slug"))
+        )
+        count_query = count_query.join(Deal.category).where(Category.slug == bindparam("category_slug"))
+    else:
+        query = query.options(joinedload(Deal.category))
+
+    if has_shop:
+        query = (
+            query.join(Deal.shop)
+            .options(contains_eager(Deal.shop))
+            .where(Shop.slug == bindparam("shop_slug"))
+        )
+        count_query = count_query.join(Deal.shop).where(Shop.slug == bindparam("shop_slug"))
+    else:
+        query = query.options(joinedload(Deal.shop))
+
+    if has_min_discount:
+        query = query.where(Deal.discount_percentage >= bindparam("min_discount"))
+        count_query = count_query.where(Deal.discount_percentage >= bindparam("min_discount"))
+
+    if has_deal_type:
+        query = query.where(Deal.deal_type == bindparam("deal_type"))
+        count_query = count_query.where(Deal.deal_type == bindparam("deal_type"))
+
+    # Sorting, with id as tie-breaker so keyset pages are stable
+    _, sort_key = _SORT_KEYS[sort_by]
+    query = query.order_by(sort_key.desc(), Deal.id.desc())
+
+    # Pagination
+    if keyset:
+        query = query.where(
+            tuple_(sort_key, Deal.id) < tuple_(
+                bindparam("last_value", type_=sort_key.type),
+                bindparam("last_id", type_=Deal.id.type),
+            )
+        )
+    else:
+        query = query.offset(bindparam("offset", type_=Integer))
+    query = query.limit(bindparam("limit", type_=Integer))
+
+    return query, count_query
+
+
+@lru_cache(maxsize=2)
+def _top_deals_statement(has_category: bool) -> Select:
+    """Build the get_top_deals statement with or without a category filter."""
+    query = (
+        select(Deal)
+        .options(joinedload(Deal.shop))
+        .where(Deal.is_active == True, Deal.ai_score.isnot(None))
+        .order_by(Deal.ai_score.desc())
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+    if has_category:
+        query = (
+            query.join(Deal.category)
+            .options(contains_eager(Deal.category))
+            .where(Category.slug == bindparam("category_slug"))
+        )
+    else:
+        query = query.options(joinedload(Deal.category))
+
+    return query
+
+
+_DEAL_DETAIL_QUERY = (
+    select(Deal)
+    .options(
+        joinedload(Deal.shop),
+        joinedload(Deal.category),
+        joinedload(Deal.product),
+    )
+    .where(Deal.id == bindparam("deal_id"))
+)
+
 
 class DealService:
     """Service for managing deals.
@@ -31,15 +287,25 @@ class DealService:
     pagination, and lifecycle management (expiration).
     """
 
-    def __init__(self, db: AsyncSession):
+    # Lazy, so the level filter configured at startup applies
+    logger = structlog.get_logger(__name__, service="deal_service")
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
         """Initialize deal service.
 
         Args:
             db: Async database session
+            session_factory: Optional factory for short-lived side sessions.
+                When given, create_or_update_deal reads price history on a
+                separate connection concurrently with its deal lookup.
         """
         self.db = db
+        self.session_factory = session_factory
         self.price_analyzer = PriceAnalyzer(db)
-        self.logger = logger.bind(service="deal_service")
 
     async def get_deals(
         self,
@@ -50,9 +316,16 @@ class DealService:
         sort_by: str = "newest",
         min_discount: Optional[float] = None,
         deal_type: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Deal], int]:
         """Get paginated deals with filters.
 
+        When ``cursor`` is given the page is fetched with keyset pagination
+        (``page`` is ignored), so the cost no longer grows with page depth.
+        Use ``encode_deal_cursor`` on the last returned deal to get the next
+        cursor. Unfiltered listings on PostgreSQL report the planner's row
+        estimate as the total once it exceeds ``_ESTIMATED_COUNT_MIN``.
+
         Args:
             page: Page number (1-indexed)
             limit: Results per page
@@ -61,11 +334,15 @@ class DealService:
             sort_by: Sort method ("newest", "score", "discount", "views")
             min_discount: Minimum discount percentage filter
             deal_type: Filter by deal type
+            cursor: Opaque keyset cursor from a previous page
 
         Returns:
             Tuple of (deals list, total count)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        self.logger.info(
+        self.logger.debug(
             "fetching_deals",
             page=page,
             limit=limit,
@@ -74,56 +351,61 @@ class DealService:
             sort=sort_by,
         )
 
-        # Base query - only active deals with eager loading
-        query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-            )
-            .where(Deal.is_active == True)
-        )
-        count_query = select(func.count(Deal.id)).where(Deal.is_active == True)
-
-        # Apply filters
-        if category_slug:
-            query = query.join(Deal.category).where(Category.slug == category_slug)
-            count_query = count_query.join(Deal.category).where(Category.slug == category_slug)
-
-        if shop_slug:
-            query = query.join(Deal.shop).where(Shop.slug == shop_slug)
-            count_query = count_query.join(Deal.shop).where(Shop.slug == shop_slug)
-
-        if min_discount is not None:
-            query = query.where(Deal.discount_percentage >= min_discount)
-            count_query = count_query.where(Deal.discount_percentage >= min_discount)
-
-        if deal_type:
-            query = query.where(Deal.deal_type == deal_type)
-            count_query = count_query.where(Deal.deal_type == deal_type)
-
-        # Sorting (use CASE for SQLite compat instead of nullslast)
-        sort_map = {
-            "newest": Deal.created_at.desc(),
-            "score": Deal.ai_score.desc(),
-            "discount": Deal.discount_percentage.desc(),
-            "views": Deal.view_count.desc(),
-        }
-        order = sort_map.get(sort_by, Deal.created_at.desc())
-        query = query.order_by(order)
+        if sort_by not in _SORT_KEYS:
+            sort_by = "newest"
 
-        # Pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
-
-        # Execute queries
-        result = await self.db.execute(query)
-        deals = list(result.scalars().all())
+        unfiltered = not (category_slug or shop_slug or min_discount is not None or deal_type)
+        estimate_total = unfiltered and self.db.get_bind().dialect.name == "postgresql"
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        query, count_query = _deal_list_statements(
+            has_category=bool(category_slug),
+            has_shop=bool(shop_slug),
+            has_min_discount=min_discount is not None,
+            has_deal_type=bool(deal_type),
+            sort_by=sort_by,
+            keyset=bool(cursor),
+            window_total=not estimate_total,
+        )
 
-        self.logger.info(
+        filter_params = {
+            "category_slug": category_slug,
+            "shop_slug": shop_slug,
+            "min_discount": min_discount,
+            "deal_type": deal_type,
+        }
+        params = dict(filter_params, limit=limit)
+        if cursor:
+            params["last_value"], params["last_id"] = _decode_deal_cursor(cursor, sort_by)
+        else:
+            params["offset"] = (page - 1) * limit
+
+        # Execute query
+        result = await self.db.execute(query, params)
+        rows = result.all()
+        deals = [row[0] for row in rows]
+
+        count_key = (category_slug, shop_slug, min_discount, deal_type)
+        windowed = not cursor and not estimate_total
+        if rows and windowed:
+            total = rows[0].total
+            _deal_count_cache.set(count_key, total)
+        elif page == 1 and windowed:
+            total = 0
+        else:
+            # Keyset pages, pages past the end and estimated listings have
+            # no window total
+            total = _deal_count_cache.get(count_key)
+            if total is None:
+                if estimate_total:
+                    total = await self._estimate_count(count_query)
+                    if total < _ESTIMATED_COUNT_MIN:
+                        total = None
+                if total is None:
+                    total_result = await self.db.execute(count_query, filter_params)
+                    total = total_result.scalar() or 0
+                _deal_count_cache.set(count_key, total)
+
+        self.logger.debug(
             "deals_fetched",
             count=len(deals),
             total=total,
@@ -132,6 +414,30 @@ class DealService:
 
         return deals, total
 
+    async def _estimate_count(self, count_query: Select) -> int:
+        """Return the PostgreSQL planner's row estimate for a count query.
+
+        EXPLAINs the rows being counted (not the aggregate) and reads the top
+        node's ``Plan Rows``, which comes from table statistics and costs no
+        scan.
+
+        Args:
+            count_query: Unparameterized ``SELECT count(...)`` statement
+
+        Returns:
+            Estimated number of matching rows
+        """
+        rows_query = count_query.with_only_columns(Deal.id)
+        compiled = rows_query.compile(
+            dialect=self.db.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        result = await self.db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def get_top_deals(
         self,
         limit: int = 20,
@@ -146,27 +452,13 @@ class DealService:
         Returns:
             List of top-scored active deals
         """
-        query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-            )
-            .where(and_(
-                Deal.is_active == True,
-                Deal.ai_score.isnot(None),
-            ))
-            .order_by(Deal.ai_score.desc())
-            .limit(limit)
+        query = _top_deals_statement(bool(category_slug))
+        result = await self.db.execute(
+            query, {"limit": limit, "category_slug": category_slug}
         )
-
-        if category_slug:
-            query = query.join(Deal.category).where(Category.slug == category_slug)
-
-        result = await self.db.execute(query)
         deals = list(result.scalars().all())
 
-        self.logger.info(
+        self.logger.debug(
             "top_deals_fetched",
             count=len(deals),
             category=category_slug,
@@ -185,17 +477,7 @@ class DealService:
         Returns:
             Deal object or None if not found
         """
-        query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-                selectinload(Deal.product),
-            )
-            .where(Deal.id == deal_id)
-        )
-
-        result = await self.db.execute(query)
+        result = await self.db.execute(_DEAL_DETAIL_QUERY, {"deal_id": deal_id})
         deal = result.scalar_one_or_none()
 
         if deal:
@@ -203,7 +485,7 @@ class DealService:
             deal.view_count += 1
             await self.db.commit()
 
-            self.logger.info(
+            self.logger.debug(
                 "deal_viewed",
                 deal_id=str(deal_id),
                 view_count=deal.view_count,
@@ -253,48 +535,71 @@ class DealService:
         Returns:
             Created or updated Deal object, or None if score is below threshold
         """
-        self.logger.info(
+        self.logger.debug(
             "creating_or_updating_deal",
             product_id=str(product_id),
             shop_id=str(shop_id),
             deal_price=float(deal_price),
         )
 
-        # Check for existing active deal for this product+shop
-        existing = await self.db.execute(
-            select(Deal).where(and_(
+        # Fetch the existing active deal for this product+shop together with
+        # the category and shop slugs needed for AI scoring. The slugs come
+        # from a one-row derived table so they are returned even when no
+        # deal matches the outer join.
+        slugs = select(
+            select(Category.slug).where(Category.id == category_id).scalar_subquery().label("category_slug"),
+            select(Shop.slug).where(Shop.id == shop_id).scalar_subquery().label("shop_slug"),
+        ).subquery()
+        lookup_stmt = (
+            select(Deal, slugs.c.category_slug, slugs.c.shop_slug)
+            .select_from(slugs)
+            .outerjoin(Deal, and_(
                 Deal.product_id == product_id,
                 Deal.shop_id == shop_id,
                 Deal.is_active == True,
             ))
         )
-        deal = existing.scalar_one_or_none()
 
-        # Get category slug and shop slug for AI scoring
-        category_slug = None
-        if category_id:
-            cat_result = await self.db.execute(
-                select(Category.slug).where(Category.id == category_id)
+        # A recently memoized score needs no price history at all
+        score_result = None
+        known_slugs = _deal_slug_cache.get((category_id, shop_id))
+        if known_slugs is not None:
+            score_result = self.price_analyzer.get_cached_deal_score(
+                product_id=product_id,
+                current_price=deal_price,
+                original_price=original_price,
+                category_slug=known_slugs[0],
+                title=title,
+                shop_slug=known_slugs[1],
             )
-            category_slug = cat_result.scalar_one_or_none()
 
-        shop_slug = None
-        shop_result = await self.db.execute(
-            select(Shop.slug).where(Shop.id == shop_id)
-        )
-        shop_slug = shop_result.scalar_one_or_none()
-
-        # Compute AI score (pass title + shop_slug for keyword/reliability scoring)
-        score_result = await self.price_analyzer.compute_deal_score(
-            product_id=product_id,
-            current_price=deal_price,
-            original_price=original_price,
-            category_slug=category_slug,
-            title=title,
-            shop_slug=shop_slug,
-        )
+        # Otherwise the price stats the scorer needs don't depend on the
+        # lookup, so with a side session both reads overlap. An AsyncSession
+        # can't multiplex, hence the separate connection.
+        price_stats = None
+        if score_result is None and self.session_factory is not None:
+            lookup, price_stats = await asyncio.gather(
+                self.db.execute(lookup_stmt),
+                self._fetch_price_stats(product_id),
+            )
+        else:
+            lookup = await self.db.execute(lookup_stmt)
+        deal, category_slug, shop_slug = lookup.first()
+        _deal_slug_cache.set((category_id, shop_id), (category_slug, shop_slug))
 
-        self.logger.info(
+        if score_result is None or known_slugs != (category_slug, shop_slug):
+            # Compute AI score (pass title + shop_slug for keyword/reliability scoring)
+            score_result = await self.price_analyzer.compute_deal_score(
+                product_id=product_id,
+                current_price=deal_price,
+                original_price=original_price,
+                category_slug=category_slug,
+                title=title,
+                shop_slug=shop_slug,
+                stats=price_stats,
+            )
+
+        self.logger.debug(
             "ai_score_computed",
             score=float(score_result.score),
             tier=score_result.deal_tier,
@@ -318,6 +623,7 @@ class DealService:
                 deal.ai_score = score_result.score
                 deal.ai_reasoning = score_result.reasoning
                 await self.db.commit()
+                invalidate_deal_counts(category_slug, shop_slug)
             else:
                 # New product didn't reach the bar — don't create a deal
                 self.logger.info(
@@ -339,28 +645,40 @@ class DealService:
         if not expires_at:
             expires_at = datetime.now(timezone.utc) + timedelta(hours=48)
 
+        # Both branches write with RETURNING so server-side columns
+        # (id, created_at, updated_at) come back without a refresh SELECT
         if deal:
             # Update existing deal
-            self.logger.info("updating_existing_deal", deal_id=str(deal.id))
-
-            deal.deal_price = deal_price
-            deal.original_price = original_price
-            deal.discount_percentage = discount_pct
-            deal.discount_amount = discount_amt
-            deal.ai_score = score_result.score
-            deal.ai_reasoning = score_result.reasoning
-            deal.title = title
-            deal.image_url = image_url
-            deal.deal_url = deal_url
-            deal.description = description
-            deal.expires_at = expires_at
+            self.logger.debug("updating_existing_deal", deal_id=str(deal.id))
+
+            values = dict(
+                deal_price=deal_price,
+                original_price=original_price,
+                discount_percentage=discount_pct,
+                discount_amount=discount_amt,
+                ai_score=score_result.score,
+                ai_reasoning=score_result.reasoning,
+                title=title,
+                image_url=image_url,
+                deal_url=deal_url,
+                description=description,
+                expires_at=expires_at,
+            )
             if metadata:
-                deal.metadata_ = metadata
+                values["metadata_"] = metadata
+
+            stmt = (
+                update(Deal)
+                .where(Deal.id == deal.id)
+                .values(**values)
+                .returning(Deal)
+                .execution_options(populate_existing=True)
+            )
         else:
             # Create new deal
-            self.logger.info("creating_new_deal")
+            self.logger.debug("creating_new_deal")
 
-            deal = Deal(
+            new_values = dict(
                 product_id=product_id,
                 shop_id=shop_id,
                 category_id=category_id,
@@ -379,10 +697,32 @@ class DealService:
                 expires_at=expires_at,
                 metadata_=metadata or {},
             )
-            self.db.add(deal)
 
+            if (
+                self.db.get_bind().dialect.name == "postgresql"
+                and await _has_active_deal_index(self.db)
+            ):
+                # A concurrent writer may have created the active deal since
+                # the lookup above; ON CONFLICT turns that race into an update
+                # instead of a duplicate (ACTIVE_DEAL_INDEX)
+                stmt = pg_insert(Deal).values(**new_values)
+                columns = Deal.__table__.c
+                conflict_set = {columns[name]: stmt.excluded[name] for name in _UPSERT_COLUMNS}
+                if metadata:
+                    conflict_set[columns.metadata] = stmt.excluded.metadata
+                conflict_set[columns.updated_at] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[columns.product_id, columns.shop_id],
+                    index_where=columns.is_active == True,
+                    set_=conflict_set,
+                ).returning(Deal).execution_options(populate_existing=True)
+            else:
+                stmt = insert(Deal).values(**new_values).returning(Deal)
+
+        result = await self.db.execute(stmt)
+        deal = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(deal)
+        invalidate_deal_counts(category_slug, shop_slug)
 
         self.logger.info(
             "deal_saved",
@@ -393,6 +733,20 @@ class DealService:
 
         return deal
 
+    async def _fetch_price_stats(self, product_id: UUID) -> PriceStats:
+        """Summarize scoring price history on a short-lived side session.
+
+        Args:
+            product_id: Product UUID
+
+        Returns:
+            PriceStats for the scoring window
+        """
+        async with self.session_factory() as session:
+            return await PriceAnalyzer(session)._get_price_stats(
+                product_id, days=HISTORY_WINDOW_DAYS
+            )
+
     async def deactivate_low_score_deals(
         self,
         threshold: Optional[Decimal] = None,
@@ -428,6 +782,7 @@ class DealService:
             .values(is_active=False)
         )
         await self.db.commit()
+        invalidate_deal_counts()
 
         count = result.rowcount
 
@@ -439,11 +794,17 @@ class DealService:
 
         return count
 
-    async def expire_stale_deals(self) -> int:
+    async def expire_stale_deals(self, batch_size: int = 10000) -> int:
         """Expire deals past their expiration time.
 
         This should be run periodically (e.g., via scheduler) to mark
-        expired deals as inactive.
+        expired deals as inactive. Rows are updated in batches of
+        ``batch_size`` (each committed separately) so a large backlog never
+        holds row locks for long; the batch SELECT is served by the
+        ``idx_deals_expiring`` partial index on PostgreSQL.
+
+        Args:
+            batch_size: Maximum number of deals expired per statement
 
         Returns:
             Number of deals that were expired
@@ -451,18 +812,34 @@ class DealService:
         self.logger.info("expiring_stale_deals")
 
         now = datetime.now(timezone.utc)
-        result = await self.db.execute(
-            update(Deal)
-            .where(and_(
-                Deal.is_active == True,
-                Deal.expires_at.isnot(None),
-                Deal.expires_at < now,
-            ))
-            .values(is_active=False, is_expired=True)
-        )
-        await self.db.commit()
+        expired_ids: List[UUID] = []
+        while True:
+            batch = (
+                select(Deal.id)
+                .where(
+                    Deal.is_active == True,
+                    Deal.expires_at.isnot(None),
+                    Deal.expires_at < now,
+                )
+                .limit(batch_size)
+            )
+            result = await self.db.execute(
+                update(Deal)
+                .where(Deal.id.in_(batch))
+                .values(is_active=False, is_expired=True)
+                .returning(Deal.id)
+            )
+            ids = list(result.scalars().all())
+            await self.db.commit()
+
+            expired_ids.extend(ids)
+            if len(ids) < batch_size:
+                break
 
-        expired_count = result.rowcount
+        if expired_ids:
+            invalidate_deal_counts()
+
+        expired_count = len(expired_ids)
 
         self.logger.info(
             "deals_expired",
@@ -484,20 +861,23 @@ class DealService:
         if vote_type not in ["up", "down"]:
             raise ValueError("vote_type must be 'up' or 'down'")
 
-        query = select(Deal).where(Deal.id == deal_id)
-        result = await self.db.execute(query)
+        # Single atomic increment; RETURNING hands back the latest counts
+        # without a separate SELECT or refresh
+        column = Deal.vote_up if vote_type == "up" else Deal.vote_down
+        stmt = (
+            update(Deal)
+            .where(Deal.id == deal_id)
+            .values({column: column + 1})
+            .returning(Deal)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
         deal = result.scalar_one_or_none()
 
         if not deal:
             return None
 
-        if vote_type == "up":
-            deal.vote_up += 1
-        else:
-            deal.vote_down += 1
-
         await self.db.commit()
-        await self.db.refresh(deal)
 
         self.logger.info(
             "deal_voted",
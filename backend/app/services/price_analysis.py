@@ -12,19 +12,27 @@ and the shop's reputation tier.  When history IS sufficient (>= 5 records) the
 original history-based algorithm runs unchanged.
 """
 
+import json
+import logging
+import math
+import re
 import statistics
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, and_
+from sqlalchemy import Row, select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.category import Category
 from app.models.price_history import PriceHistory
 from app.models.deal import Deal
+from app.services.cache_service import LocalTTLCache, get_cache_service
 
 logger = structlog.get_logger(__name__)
 
@@ -36,14 +44,47 @@ HOT_DEAL_THRESHOLD = Decimal("70.0")   # Hot deal threshold
 SUPER_DEAL_THRESHOLD = Decimal("85.0") # Super deal / featured threshold
 
 # Category-specific thresholds (some categories have different deal definitions)
-CATEGORY_THRESHOLDS = {
+CATEGORY_THRESHOLDS: Mapping[str, Decimal] = MappingProxyType({
     "pc-hardware": Decimal("30.0"),     # PC parts often have smaller margins
     "games-software": Decimal("40.0"),  # Games have steeper sales
     "gift-cards": Decimal("20.0"),      # Gift cards rarely discount deeply
     "electronics-tv": Decimal("35.0"),
     "laptop-mobile": Decimal("35.0"),
     "living-food": Decimal("25.0"),     # Food/grocery has frequent but smaller sales
-}
+})
+
+# Tier labels in ascending order, indexed by how many cutoffs a score reaches
+_TIER_LABELS = ("none", "deal", "hot_deal", "super_deal")
+
+# Korean tier names prefixed to the reasoning text
+_TIER_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType({
+    "super_deal": "슈퍼특가",
+    "hot_deal": "핫딜",
+    "deal": "특가",
+})
+
+
+def _tier_cutoffs(threshold: Decimal) -> tuple[float, float, float]:
+    """Ascending (deal, hot_deal, super_deal) cutoffs for a deal threshold."""
+    return (
+        float(min(threshold, HOT_DEAL_THRESHOLD)),
+        float(HOT_DEAL_THRESHOLD),
+        float(SUPER_DEAL_THRESHOLD),
+    )
+
+
+# Tier cutoffs per category slug, resolved once at import
+_DEFAULT_TIER_CUTOFFS = _tier_cutoffs(DEAL_THRESHOLD)
+_CATEGORY_TIER_CUTOFFS: Mapping[str, tuple[float, float, float]] = MappingProxyType({
+    slug: _tier_cutoffs(threshold) for slug, threshold in CATEGORY_THRESHOLDS.items()
+})
+
+
+def _category_tier(score: float, category_slug: Optional[str]) -> str:
+    """Classify a score into a deal tier using its category's threshold."""
+    cutoffs = _CATEGORY_TIER_CUTOFFS.get(category_slug, _DEFAULT_TIER_CUTOFFS)
+    return _TIER_LABELS[bisect_right(cutoffs, score)]
+
 
 # ---------------------------------------------------------------------------
 # Statistical analysis parameters (used in the full history path)
@@ -52,6 +93,8 @@ MIN_HISTORY_FOR_FULL_SCORING = 5   # Records needed to use the full algorithm
 MIN_HISTORY_FOR_STATS = 3          # Minimum points for any statistical analysis
 HISTORY_WINDOW_DAYS = 90           # Look back 90 days for historical average
 RECENT_WINDOW_DAYS = 7             # Look back 7 days for recent average
+MAX_HISTORY_POINTS = 200           # Newest records used per product
+HISTORY_STREAM_CHUNK_SIZE = 1000   # Rows per fetch when streaming bulk history
 
 # ---------------------------------------------------------------------------
 # Korean deal keywords used in the lightweight scoring path
@@ -86,8 +129,51 @@ DEAL_KEYWORDS: dict[str, float] = {
     "추천": 1.0,
 }
 
-# Shop reliability tiers: slug -> bonus points (out of 10)
-SHOP_RELIABILITY: dict[str, float] = {
+# ---------------------------------------------------------------------------
+# Lightweight-path scoring curves
+# ---------------------------------------------------------------------------
+# Piecewise-linear curves as (x breakpoints, y values), evaluated by
+# _interpolate(); values outside the breakpoints clamp to the ends.
+LISTED_DISCOUNT_CURVE = ((0.0, 20.0, 50.0, 80.0), (0.0, 16.0, 30.0, 40.0))
+CATEGORY_RELATIVE_CURVE = ((0.0, 10.0, 20.0, 35.0, 50.0), (0.0, 4.0, 8.0, 14.0, 20.0))
+
+# Freshness step function: a deal at most FRESHNESS_MAX_AGE_SECONDS[i] old
+# earns FRESHNESS_POINTS[i]; older deals earn the final 0.
+FRESHNESS_MAX_AGE_SECONDS = (
+    timedelta(hours=1).total_seconds(),
+    timedelta(hours=6).total_seconds(),
+    timedelta(hours=24).total_seconds(),
+    timedelta(days=3).total_seconds(),
+    timedelta(days=7).total_seconds(),
+)
+FRESHNESS_POINTS = (10.0, 8.0, 6.0, 4.0, 2.0, 0.0)
+
+
+def _interpolate(x: float, curve: tuple[tuple[float, ...], tuple[float, ...]]) -> float:
+    """Evaluate a piecewise-linear (xs, ys) curve at x, clamped at both ends."""
+    xs, ys = curve
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+    i = bisect_right(xs, x)
+    x0, x1 = xs[i - 1], xs[i]
+    y0, y1 = ys[i - 1], ys[i]
+    return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
+
+
+# Longest keywords first, so a specific phrase ("오늘만특가") claims its span
+# of the title before the generic keywords it contains ("특가") are tried.
+_DEAL_KEYWORDS_BY_LENGTH = sorted(DEAL_KEYWORDS.items(), key=lambda kv: -len(kv[0]))
+KEYWORD_BONUS_CAP = 25.0
+
+# One alternation over every keyword, compiled once: a single scan of the
+# title tells whether any keyword is present before the per-keyword loop.
+_DEAL_KEYWORD_PATTERN = re.compile("|".join(re.escape(k) for k, _ in _DEAL_KEYWORDS_BY_LENGTH))
+
+# Shop reliability tiers: slug -> bonus points (out of 10). Keys are
+# lowercase, matching how shop slugs are stored.
+SHOP_RELIABILITY: Mapping[str, float] = MappingProxyType({
     "naver": 7.0,    # Naver Shopping – aggregator with large seller base
     "coupang": 9.0,  # Coupang – highly trusted Korean mega-mall
     "11st": 8.0,     # 11번가 – established Korean platform
@@ -103,26 +189,274 @@ SHOP_RELIABILITY: dict[str, float] = {
     "amazon": 8.0,
     "aliexpress": 5.0,
     "ebay": 6.0,
-}
-
+})
+
+# Category slug -> id rarely changes, and the category median drifts slowly,
+# so both are kept in-process to spare limited-history scoring two queries.
+# Medians are only cached for categories with more than
+# CATEGORY_MEDIAN_CACHE_MIN_PEERS deals, where excluding the scored product
+# from the peer set makes no practical difference.
+CATEGORY_MEDIAN_CACHE_MIN_PEERS = 50
+_category_id_cache = LocalTTLCache(maxsize=256, ttl=3600)
+_category_median_cache = LocalTTLCache(maxsize=64, ttl=60)
+
+# Recent DealScores keyed by every scoring input, so repeated scoring of the
+# same deal (scrape retries, the same product seen by several sources) skips
+# the history query and the math. Scores depend on slowly changing history,
+# so a few minutes of reuse is harmless.
+_deal_score_cache = LocalTTLCache(maxsize=8192, ttl=300)
+
+
+def invalidate_category_stats() -> None:
+    """Drop cached category ids and medians."""
+    _category_id_cache.clear()
+    _category_median_cache.clear()
+    _shared_category_median_cache.clear()
+
+
+def clear_deal_score_cache() -> None:
+    """Drop all memoized DealScores."""
+    _deal_score_cache.clear()
+
+
+def _deal_score_cache_key(
+    product_id: UUID,
+    current_price: Decimal,
+    original_price: Optional[Decimal],
+    category_slug: Optional[str],
+    title: Optional[str],
+    shop_slug: Optional[str],
+    created_at: Optional[datetime],
+) -> tuple:
+    """Key of a memoized DealScore; price history is not part of it."""
+    return (
+        product_id,
+        current_price,
+        original_price,
+        category_slug,
+        title,
+        shop_slug,
+        created_at,
+    )
+
+
+# category_stats_refresher publishes [median, peer_count] for every category
+# above CATEGORY_MEDIAN_CACHE_MIN_PEERS to its own Redis key every
+# CATEGORY_MEDIANS_REFRESH_MINUTES.
+CATEGORY_MEDIAN_CACHE_KEY_PREFIX = "cat_median:"
+CATEGORY_MEDIANS_REFRESH_MINUTES = 5
+
+# Redis answers per category slug, including "not published", kept until the
+# next refresh so scoring does at most one GET per category per refresh.
+_shared_category_median_cache = LocalTTLCache(
+    maxsize=256, ttl=CATEGORY_MEDIANS_REFRESH_MINUTES * 60
+)
+_NOT_PUBLISHED = (None, 0)
+
+
+def category_median_cache_key(category_slug: str) -> str:
+    """Redis key holding a category's published median."""
+    return f"{CATEGORY_MEDIAN_CACHE_KEY_PREFIX}{category_slug}"
+
+
+async def compute_category_medians(
+    db: AsyncSession,
+    category_ids: Optional[list[UUID]] = None,
+) -> dict[UUID, tuple[float, int]]:
+    """Compute the median active deal price per category.
+
+    Args:
+        db: Async database session
+        category_ids: Categories to include (all categories if None)
+
+    Returns:
+        Mapping of category id -> (median deal price, number of deals)
+    """
+    peer_filter = and_(
+        Deal.is_active == True,  # noqa: E712
+        Deal.deal_price > 0,
+    )
+    if category_ids is not None:
+        peer_filter = and_(peer_filter, Deal.category_id.in_(category_ids))
+
+    if db.get_bind().dialect.name == "postgresql":
+        median_result = await db.execute(
+            select(
+                Deal.category_id,
+                func.percentile_cont(0.5).within_group(Deal.deal_price.asc()),
+                func.count(),
+            )
+            .where(peer_filter, Deal.category_id.is_not(None))
+            .group_by(Deal.category_id)
+        )
+        return {
+            category_id: (float(median), count)
+            for category_id, median, count in median_result.all()
+        }
 
-@dataclass
+    peers_result = await db.execute(
+        select(Deal.category_id, Deal.deal_price).where(
+            peer_filter, Deal.category_id.is_not(None)
+        )
+    )
+    prices_by_category: dict[UUID, list[float]] = {}
+    for category_id, price in peers_result.all():
+        prices_by_category.setdefault(category_id, []).append(float(price))
+    return {
+        category_id: (statistics.median(prices), len(prices))
+        for category_id, prices in prices_by_category.items()
+    }
+
+
+async def _get_shared_category_median(category_slug: str) -> Optional[tuple[float, int]]:
+    """Read a category's precomputed median from Redis, if published."""
+    cached = _shared_category_median_cache.get(category_slug)
+    if cached is None:
+        raw = await get_cache_service().get(category_median_cache_key(category_slug))
+        cached = _NOT_PUBLISHED
+        if raw:
+            median, peer_count = json.loads(raw)
+            cached = (float(median), int(peer_count))
+        _shared_category_median_cache.set(category_slug, cached)
+    return None if cached is _NOT_PUBLISHED else cached
+
+
+@dataclass(slots=True, frozen=True)
 class DealScore:
     """Result of AI deal scoring analysis.
 
+    Instances are immutable because memoized scores are shared between
+    callers; slots keep batches of thousands of scores compact.
+
     Attributes:
         score: Overall deal quality score (0-100)
         is_deal: Whether this qualifies as a deal based on threshold
         deal_tier: Classification tier ("none", "deal", "hot_deal", "super_deal")
         reasoning: Human-readable Korean explanation of the score
-        components: Breakdown of individual scoring components
+        components: Read-only breakdown of individual scoring components
     """
 
     score: Decimal
     is_deal: bool
     deal_tier: str
     reasoning: str
-    components: dict
+    components: Mapping[str, object]
+
+
+@dataclass
+class ScoreInput:
+    """Inputs for scoring one deal with PriceAnalyzer.compute_deal_scores().
+
+    Attributes mirror the arguments of PriceAnalyzer.compute_deal_score().
+    """
+
+    product_id: UUID
+    current_price: Decimal
+    original_price: Optional[Decimal] = None
+    category_slug: Optional[str] = None
+    title: Optional[str] = None
+    shop_slug: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PriceStats:
+    """Summary of a product's recent price history used by scoring.
+
+    Attributes:
+        count: Number of history records in the window
+        avg_price: Mean price (0.0 without records)
+        min_price: Lowest price (inf without records)
+        max_price: Highest price (-inf without records)
+        std_dev: Sample standard deviation (0.0 with fewer than 2 records)
+        recent_avg: Mean price over the last RECENT_WINDOW_DAYS, or
+            avg_price when there are no recent records
+    """
+
+    count: int
+    avg_price: float
+    min_price: float
+    max_price: float
+    std_dev: float
+    recent_avg: float
+
+
+_EMPTY_PRICE_STATS = PriceStats(
+    count=0,
+    avg_price=0.0,
+    min_price=float("inf"),
+    max_price=float("-inf"),
+    std_dev=0.0,
+    recent_avg=0.0,
+)
+
+
+def _price_stats_from_aggregates(
+    count: int,
+    avg_price: Optional[Decimal],
+    min_price: Optional[Decimal],
+    max_price: Optional[Decimal],
+    std_dev: Optional[Decimal],
+    recent_avg: Optional[Decimal],
+) -> PriceStats:
+    """Build PriceStats from SQL aggregates, which are NULL over no rows."""
+    avg = float(avg_price) if avg_price is not None else 0.0
+    return PriceStats(
+        count=count,
+        avg_price=avg,
+        min_price=float(min_price) if min_price is not None else float("inf"),
+        max_price=float(max_price) if max_price is not None else float("-inf"),
+        std_dev=float(std_dev) if std_dev is not None else 0.0,
+        recent_avg=float(recent_avg) if recent_avg is not None else avg,
+    )
+
+
+def _summarize_history(history: List[Row], recent_cutoff: datetime) -> PriceStats:
+    """Summarize price history rows in one pass.
+
+    Args:
+        history: Rows with ``price`` and ``recorded_at``
+        recent_cutoff: Records after this count towards recent_avg
+
+    Returns:
+        PriceStats for the rows
+    """
+    if history and history[0].recorded_at.tzinfo is None:
+        # SQLite hands back naive UTC timestamps
+        recent_cutoff = recent_cutoff.replace(tzinfo=None)
+
+    # Running mean and variance (Welford), price range, and the recent
+    # sum and count
+    count = 0
+    avg_price = 0.0
+    sq_dev_sum = 0.0
+    min_price = float("inf")
+    max_price = float("-inf")
+    recent_sum = 0.0
+    recent_count = 0
+    for h in history:
+        price = float(h.price)
+        count += 1
+        delta = price - avg_price
+        avg_price += delta / count
+        sq_dev_sum += delta * (price - avg_price)
+        if price < min_price:
+            min_price = price
+        if price > max_price:
+            max_price = price
+        if h.recorded_at > recent_cutoff:
+            recent_sum += price
+            recent_count += 1
+
+    return PriceStats(
+        count=count,
+        avg_price=avg_price,
+        min_price=min_price,
+        max_price=max_price,
+        # Sample standard deviation, as statistics.stdev
+        std_dev=math.sqrt(sq_dev_sum / (count - 1)) if count > 1 else 0.0,
+        recent_avg=recent_sum / recent_count if recent_count else avg_price,
+    )
 
 
 class PriceAnalyzer:
@@ -148,6 +482,9 @@ class PriceAnalyzer:
     Total score ranges from 0-100, with higher scores indicating better deals.
     """
 
+    # Lazy, so the level filter configured at startup applies
+    logger = structlog.get_logger(__name__, service="price_analyzer")
+
     def __init__(self, db: AsyncSession):
         """Initialize price analyzer.
 
@@ -155,7 +492,6 @@ class PriceAnalyzer:
             db: Async database session
         """
         self.db = db
-        self.logger = logger.bind(service="price_analyzer")
 
     # ------------------------------------------------------------------
     # Public API
@@ -170,12 +506,20 @@ class PriceAnalyzer:
         title: Optional[str] = None,
         shop_slug: Optional[str] = None,
         created_at: Optional[datetime] = None,
+        history: Optional[List[Row]] = None,
+        stats: Optional[PriceStats] = None,
+        now: Optional[datetime] = None,
+        bypass_cache: bool = False,
     ) -> DealScore:
         """Compute AI deal score (0-100) based on price history analysis.
 
         Automatically selects between the full history-based algorithm (when
         >= 5 price records exist) and the lightweight signal-based algorithm
-        (when fewer records are available).
+        (when fewer records are available). Results are memoized for a few
+        minutes per distinct set of inputs, except ``history``, ``stats`` and
+        ``now``: those are assumed to describe the product's current price
+        history, so a memoized score is returned even when they are given.
+        Pass bypass_cache=True to score against other history.
 
         Args:
             product_id: UUID of the product to analyze
@@ -185,23 +529,63 @@ class PriceAnalyzer:
             title: Optional product title for keyword analysis
             shop_slug: Optional shop slug for reliability scoring
             created_at: Optional deal creation time for freshness scoring
+            history: Optional pre-fetched price history rows with ``price``
+                and ``recorded_at`` (last HISTORY_WINDOW_DAYS, newest
+                first); fetched when omitted
+            stats: Optional pre-computed PriceStats (see _get_price_stats),
+                used instead of history
+            now: Reference time for every time window in this scoring
+                call; defaults to the current UTC time
+            bypass_cache: Always recompute (and refresh the memoized score),
+                e.g. for admin rescoring
 
         Returns:
             DealScore object with score, tier, reasoning, and component breakdown
         """
-        self.logger.info(
-            "computing_deal_score",
-            product_id=str(product_id),
-            current_price=float(current_price),
-            category=category_slug,
-        )
+        # Debug event fields are only built when debug logging is on
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                "computing_deal_score",
+                product_id=str(product_id),
+                current_price=float(current_price),
+                category=category_slug,
+            )
 
-        # 1. Fetch price history
-        history = await self._get_price_history(product_id, days=HISTORY_WINDOW_DAYS)
+        cache_key = _deal_score_cache_key(
+            product_id,
+            current_price,
+            original_price,
+            category_slug,
+            title,
+            shop_slug,
+            created_at,
+        )
+        if not bypass_cache:
+            cached = _deal_score_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # 1. Summarize price history (the limited path only needs a count)
+        if stats is not None:
+            history_count = stats.count
+        elif history is not None:
+            history_count = len(history)
+            if history_count >= MIN_HISTORY_FOR_FULL_SCORING:
+                stats = _summarize_history(
+                    history, now - timedelta(days=RECENT_WINDOW_DAYS)
+                )
+        else:
+            stats = await self._get_price_stats(
+                product_id, days=HISTORY_WINDOW_DAYS, now=now
+            )
+            history_count = stats.count
 
         # 2. Route to the appropriate scoring path
-        if len(history) >= MIN_HISTORY_FOR_FULL_SCORING:
-            return await self._score_with_full_history(
+        if history_count >= MIN_HISTORY_FOR_FULL_SCORING:
+            result = await self._score_with_full_history(
                 product_id=product_id,
                 current_price=current_price,
                 original_price=original_price,
@@ -209,10 +593,11 @@ class PriceAnalyzer:
                 title=title,
                 shop_slug=shop_slug,
                 created_at=created_at,
-                history=history,
+                stats=stats,
+                now=now,
             )
         else:
-            return await self._score_with_limited_history(
+            result = await self._score_with_limited_history(
                 product_id=product_id,
                 current_price=current_price,
                 original_price=original_price,
@@ -220,9 +605,93 @@ class PriceAnalyzer:
                 title=title,
                 shop_slug=shop_slug,
                 created_at=created_at,
-                history=history,
+                history_count=history_count,
+                now=now,
             )
 
+        _deal_score_cache.set(cache_key, result)
+        return result
+
+    def get_cached_deal_score(
+        self,
+        product_id: UUID,
+        current_price: Decimal,
+        original_price: Optional[Decimal] = None,
+        category_slug: Optional[str] = None,
+        title: Optional[str] = None,
+        shop_slug: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> Optional[DealScore]:
+        """Return the memoized compute_deal_score() result for these inputs.
+
+        Lets callers skip fetching price history when a score is already
+        known. Arguments match compute_deal_score().
+
+        Returns:
+            The memoized DealScore, or None if there is none
+        """
+        return _deal_score_cache.get(_deal_score_cache_key(
+            product_id,
+            current_price,
+            original_price,
+            category_slug,
+            title,
+            shop_slug,
+            created_at,
+        ))
+
+    async def compute_deal_scores(
+        self,
+        items: List[ScoreInput],
+        bypass_cache: bool = False,
+    ) -> List[DealScore]:
+        """Score many deals at once with batched queries.
+
+        Price stats for every product come from one query and the category
+        caches are warmed with one grouped query, then each item is scored
+        exactly as compute_deal_score() would.
+
+        Args:
+            items: Deals to score
+            bypass_cache: Ignore memoized scores (see compute_deal_score)
+
+        Returns:
+            DealScore for each item, in the same order
+        """
+        if not items:
+            return []
+
+        now = datetime.now(timezone.utc)
+        stats_by_product = await self._get_price_stats_bulk(
+            list({item.product_id for item in items}), days=HISTORY_WINDOW_DAYS, now=now
+        )
+
+        limited_slugs = {
+            item.category_slug
+            for item in items
+            if item.category_slug
+            and stats_by_product.get(item.product_id, _EMPTY_PRICE_STATS).count
+            < MIN_HISTORY_FOR_FULL_SCORING
+        }
+        if limited_slugs:
+            await self._prefetch_category_medians(limited_slugs)
+
+        return [
+            await self.compute_deal_score(
+                product_id=item.product_id,
+                current_price=item.current_price,
+                original_price=item.original_price,
+                category_slug=item.category_slug,
+                title=item.title,
+                shop_slug=item.shop_slug,
+                created_at=item.created_at,
+                stats=stats_by_product.get(item.product_id, _EMPTY_PRICE_STATS),
+                now=now,
+                bypass_cache=bypass_cache,
+            )
+            for item in items
+        ]
+
     # ------------------------------------------------------------------
     # Scoring path 1: Full history (>= 5 records) — original algorithm
     # ------------------------------------------------------------------
@@ -236,7 +705,8 @@ class PriceAnalyzer:
         title: Optional[str],
         shop_slug: Optional[str],
         created_at: Optional[datetime],
-        history: list,
+        stats: PriceStats,
+        now: datetime,
     ) -> DealScore:
         """Score a deal using full price history analysis.
 
@@ -250,56 +720,33 @@ class PriceAnalyzer:
             D. Listed discount percentage (0-15 points)
             E. Statistical anomaly bonus (0-10 points)
         """
-        prices = [float(h.price) for h in history]
-        avg_price = Decimal(str(statistics.mean(prices)))
-        min_price = Decimal(str(min(prices)))
-        max_price = Decimal(str(max(prices)))
-        std_dev = (
-            Decimal(str(statistics.stdev(prices))) if len(prices) > 1 else Decimal("0")
-        )
-        median_price = Decimal(str(statistics.median(prices)))  # noqa: F841
-
-        # Recent average (last 7 days)
-        now = datetime.now(timezone.utc)
-        recent = [
-            h for h in history
-            if h.recorded_at > now - timedelta(days=RECENT_WINDOW_DAYS)
-        ]
-        recent_avg = (
-            Decimal(str(statistics.mean([float(h.price) for h in recent])))
-            if recent
-            else avg_price
-        )
+        # Pure float arithmetic from here on; only the final score is
+        # converted back to Decimal.
+        current = float(current_price)
 
-        self.logger.debug(
-            "full_history_stats",
-            avg=float(avg_price),
-            min=float(min_price),
-            max=float(max_price),
-            std_dev=float(std_dev),
-            recent_avg=float(recent_avg),
-            history_count=len(history),
-        )
+        avg_price = stats.avg_price
+        min_price = stats.min_price
+        max_price = stats.max_price
+        std_dev = stats.std_dev
+        recent_avg = stats.recent_avg
 
         # Component A: Discount from historical average (0-30)
         if avg_price > 0:
-            pct_below_avg = float((avg_price - current_price) / avg_price * 100)
+            pct_below_avg = (avg_price - current) / avg_price * 100
         else:
             pct_below_avg = 0.0
         score_a = min(30.0, max(0.0, pct_below_avg * 1.5))
 
         # Component B: Recent price drop (0-20)
         if recent_avg > 0:
-            pct_below_recent = float(
-                (recent_avg - current_price) / recent_avg * 100
-            )
+            pct_below_recent = (recent_avg - current) / recent_avg * 100
         else:
             pct_below_recent = 0.0
         score_b = min(20.0, max(0.0, pct_below_recent * 2.0))
 
         # Component C: All-time low proximity (0-25)
         if max_price > min_price:
-            position = float((max_price - current_price) / (max_price - min_price))
+            position = (max_price - current) / (max_price - min_price)
             score_c = position * 25.0
         else:
             score_c = 12.5  # Neutral if no price range
@@ -307,68 +754,67 @@ class PriceAnalyzer:
         # Component D: Listed discount (0-15)
         listed_discount = 0.0
         if original_price and original_price > current_price:
-            listed_discount = float(
-                (original_price - current_price) / original_price * 100
-            )
+            original = float(original_price)
+            listed_discount = (original - current) / original * 100
         score_d = min(15.0, listed_discount * 0.3)
 
         # Component E: Statistical anomaly (0-10)
         if std_dev > 0:
-            z_score = float((avg_price - current_price) / std_dev)
+            z_score = (avg_price - current) / std_dev
             score_e = min(10.0, max(0.0, (z_score - 1.0) * 5.0))
         else:
             score_e = 0.0
 
-        total = Decimal(
-            str(round(min(100.0, max(0.0, score_a + score_b + score_c + score_d + score_e)), 2))
-        )
-
-        self.logger.debug(
-            "full_history_score_components",
-            total=float(total),
-            vs_avg=score_a,
-            vs_recent=score_b,
-            atl_proximity=score_c,
-            listed_disc=score_d,
-            anomaly=score_e,
-        )
+        total_float = round(min(100.0, max(0.0, score_a + score_b + score_c + score_d + score_e)), 2)
+        total = Decimal(str(total_float))
 
-        threshold = CATEGORY_THRESHOLDS.get(category_slug, DEAL_THRESHOLD)
-        tier = self._classify_tier(total, threshold)
+        tier = _category_tier(total_float, category_slug)
         is_deal = tier != "none"
 
         reasoning = self._generate_reasoning_full(
             total=total,
             pct_below_avg=pct_below_avg,
             pct_below_recent=pct_below_recent,
-            is_all_time_low=(current_price <= min_price),
+            is_all_time_low=(current <= min_price),
             listed_discount=listed_discount,
             tier=tier,
-            history_count=len(history),
+            history_count=stats.count,
         )
 
-        self.logger.info(
-            "deal_score_computed",
-            product_id=str(product_id),
-            score=float(total),
-            tier=tier,
-            path="full_history",
-        )
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                "deal_score_computed",
+                product_id=str(product_id),
+                score=float(total),
+                tier=tier,
+                path="full_history",
+                avg=avg_price,
+                min=min_price,
+                max=max_price,
+                std_dev=std_dev,
+                recent_avg=recent_avg,
+                history_count=stats.count,
+                vs_avg=score_a,
+                vs_recent=score_b,
+                atl_proximity=score_c,
+                listed_disc=score_d,
+                anomaly=score_e,
+            )
 
         return DealScore(
             score=total,
             is_deal=is_deal,
             deal_tier=tier,
             reasoning=reasoning,
-            components={
+            components=MappingProxyType({
                 "vs_average": round(score_a, 2),
                 "vs_recent": round(score_b, 2),
                 "all_time_low": round(score_c, 2),
                 "listed_discount": round(score_d, 2),
                 "anomaly_bonus": round(score_e, 2),
                 "scoring_path": "full_history",
-                "history_points": len(history),
-            },
+                "history_points": stats.count,
+            }),
         )
 
     # ------------------------------------------------------------------
@@ -384,7 +830,8 @@ class PriceAnalyzer:
         title: Optional[str],
         shop_slug: Optional[str],
         created_at: Optional[datetime],
-        history: list,
+        history_count: int,
+        now: datetime,
     ) -> DealScore:
         """Score a deal when price history is limited (< 5 records).
 
@@ -403,7 +850,8 @@ class PriceAnalyzer:
             title: Product/deal title for keyword analysis
             shop_slug: Shop slug for reliability scoring
             created_at: When the deal was created (for freshness)
-            history: Existing (possibly empty) price history records
+            history_count: Number of existing price history records
+            now: Reference time for freshness scoring
 
         Returns:
             DealScore for this deal
@@ -411,7 +859,7 @@ class PriceAnalyzer:
         self.logger.warning(
             "limited_history_scoring",
             product_id=str(product_id),
-            history_count=len(history),
+            history_count=history_count,
         )
 
         # ------------------------------------------------------------------
@@ -419,9 +867,8 @@ class PriceAnalyzer:
         # ------------------------------------------------------------------
         listed_discount_pct = 0.0
         if original_price and original_price > 0 and current_price < original_price:
-            listed_discount_pct = float(
-                (original_price - current_price) / original_price * 100
-            )
+            original = float(original_price)
+            listed_discount_pct = (original - float(current_price)) / original * 100
 
         score_f = self._score_listed_discount_limited(listed_discount_pct)
 
@@ -448,7 +895,7 @@ class PriceAnalyzer:
         # ------------------------------------------------------------------
         # Component I: Freshness bonus (0-10 points)
         # ------------------------------------------------------------------
-        score_i = self._score_freshness(created_at)
+        score_i = self._score_freshness(created_at, now)
 
         # ------------------------------------------------------------------
         # Component J: Shop reliability bonus (0-10 points)
@@ -456,21 +903,10 @@ class PriceAnalyzer:
         score_j = self._score_shop_reliability(shop_slug)
 
         total_raw = score_f + score_g + score_h + score_i + score_j
-        total = Decimal(str(round(min(100.0, max(0.0, total_raw)), 2)))
-
-        self.logger.debug(
-            "limited_history_score_components",
-            total=float(total),
-            listed_discount=score_f,
-            keyword_boost=score_g,
-            category_relative=score_h,
-            freshness=score_i,
-            shop_reliability=score_j,
-            keywords_found=keyword_hits,
-        )
+        total_float = round(min(100.0, max(0.0, total_raw)), 2)
+        total = Decimal(str(total_float))
 
-        threshold = CATEGORY_THRESHOLDS.get(category_slug, DEAL_THRESHOLD)
-        tier = self._classify_tier(total, threshold)
+        tier = _category_tier(total_float, category_slug)
         is_deal = tier != "none"
 
         reasoning = self._generate_reasoning_limited(
@@ -486,29 +922,36 @@ class PriceAnalyzer:
             tier=tier,
         )
 
-        self.logger.info(
-            "deal_score_computed",
-            product_id=str(product_id),
-            score=float(total),
-            tier=tier,
-            path="limited_history",
-        )
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                "deal_score_computed",
+                product_id=str(product_id),
+                score=float(total),
+                tier=tier,
+                path="limited_history",
+                listed_discount=score_f,
+                keyword_boost=score_g,
+                category_relative=score_h,
+                freshness=score_i,
+                shop_reliability=score_j,
+                keywords_found=keyword_hits,
+            )
 
         return DealScore(
             score=total,
             is_deal=is_deal,
             deal_tier=tier,
             reasoning=reasoning,
-            components={
+            components=MappingProxyType({
                 "listed_discount": round(score_f, 2),
                 "keyword_boost": round(score_g, 2),
                 "category_relative": round(score_h, 2),
                 "freshness": round(score_i, 2),
                 "shop_reliability": round(score_j, 2),
                 "scoring_path": "limited_history",
-                "history_points": len(history),
+                "history_points": history_count,
                 "keywords_found": keyword_hits,
-            },
+            }),
         )
 
     # ------------------------------------------------------------------
@@ -536,43 +979,48 @@ class PriceAnalyzer:
         Returns:
             Score from 0.0 to 40.0
         """
-        if discount_pct <= 0:
-            return 0.0
         # Piecewise linear scaling; steep at first, then flattens
-        if discount_pct >= 80:
-            return 40.0
-        if discount_pct >= 50:
-            # 50% -> 30, 80% -> 40  =>  0.333 per %
-            return 30.0 + (discount_pct - 50) * (10.0 / 30.0)
-        if discount_pct >= 20:
-            # 20% -> 16, 50% -> 30  =>  0.467 per %
-            return 16.0 + (discount_pct - 20) * (14.0 / 30.0)
-        # 0% -> 0, 20% -> 16  =>  0.8 per %
-        return discount_pct * 0.8
+        return _interpolate(discount_pct, LISTED_DISCOUNT_CURVE)
 
     def _score_title_keywords(self, title: str) -> tuple[float, list[str]]:
         """Scan product title for Korean deal keywords and return a score.
 
-        Searches the title (case-insensitive) for each keyword.  Points are
-        cumulative but capped at 20.  Returns both the score and the list of
+        Searches the title (case-insensitive) for each keyword, longest
+        first.  A keyword only counts if it occurs outside the spans already
+        claimed by a longer match, so "초특가" does not also earn the points
+        for "특가".  Points are cumulative but capped at 25; scanning stops
+        once the cap is reached.  Returns both the score and the list of
         matched keywords (for reasoning).
 
         Args:
             title: Product or deal title string
 
         Returns:
-            Tuple of (score 0-20, list of matched keyword strings)
+            Tuple of (score 0-25, list of matched keyword strings)
         """
         title_lower = title.lower()
+        if not _DEAL_KEYWORD_PATTERN.search(title_lower):
+            return 0.0, []
+
         total_bonus = 0.0
         hits: list[str] = []
+        claimed = bytearray(len(title_lower))
 
-        for keyword, points in DEAL_KEYWORDS.items():
-            if keyword in title_lower:
-                total_bonus += points
-                hits.append(keyword)
+        for keyword, points in _DEAL_KEYWORDS_BY_LENGTH:
+            size = len(keyword)
+            start = title_lower.find(keyword)
+            while start != -1 and any(claimed[start:start + size]):
+                start = title_lower.find(keyword, start + 1)
+            if start == -1:
+                continue
 
-        return min(25.0, total_bonus), hits
+            claimed[start:start + size] = b"\x01" * size
+            total_bonus += points
+            hits.append(keyword)
+            if total_bonus >= KEYWORD_BONUS_CAP:
+                break
+
+        return min(KEYWORD_BONUS_CAP, total_bonus), hits
 
     async def _score_category_relative_price(
         self,
@@ -582,8 +1030,11 @@ class PriceAnalyzer:
     ) -> tuple[float, float]:
         """Score based on how current_price compares to the category median.
 
-        Fetches the median deal price for all active deals in the same
-        category (excluding the current product to avoid self-comparison).
+        Uses the median deal price for all active deals in the same
+        category, preferring the in-process cache and then the medians
+        published to Redis by category_stats_refresher. Only on a miss is it
+        computed from the DB, excluding the current product to avoid
+        self-comparison.
         Products priced well below the category median score higher.
 
         Scoring:
@@ -602,57 +1053,42 @@ class PriceAnalyzer:
             Tuple of (score 0-20, pct_below_category_median as float)
         """
         try:
-            # Import here to avoid circular import at module load time
-            from app.models.category import Category
-
             # Resolve category id from slug
-            cat_result = await self.db.execute(
-                select(Category.id).where(Category.slug == category_slug)
-            )
-            cat_row = cat_result.scalar_one_or_none()
-            if cat_row is None:
-                return 0.0, 0.0
-
-            category_id = cat_row
-
-            # Compute median deal_price across all active deals in category
-            # SQLite doesn't have a native PERCENTILE_CONT so we fetch all
-            # prices and compute in Python.
-            peers_result = await self.db.execute(
-                select(Deal.deal_price)
-                .where(
-                    and_(
-                        Deal.category_id == category_id,
-                        Deal.is_active == True,  # noqa: E712
-                        Deal.product_id != exclude_product_id,
-                    )
+            category_id = _category_id_cache.get(category_slug)
+            if category_id is None:
+                cat_result = await self.db.execute(
+                    select(Category.id).where(Category.slug == category_slug)
                 )
-            )
-            peer_prices = [float(row) for row in peers_result.scalars().all() if row and float(row) > 0]
+                category_id = cat_result.scalar_one_or_none()
+                if category_id is None:
+                    return 0.0, 0.0
+                _category_id_cache.set(category_slug, category_id)
+
+            cached = _category_median_cache.get(category_id)
+            if cached is None:
+                # Published every few minutes by category_stats_refresher
+                cached = await _get_shared_category_median(category_slug)
+            if cached is not None:
+                category_median, peer_count = cached
+            else:
+                category_median, peer_count = await self._fetch_category_median(
+                    category_id, exclude_product_id
+                )
+                if peer_count > CATEGORY_MEDIAN_CACHE_MIN_PEERS:
+                    _category_median_cache.set(category_id, (category_median, peer_count))
 
-            if len(peer_prices) < 3:
+            if peer_count < 3:
                 # Too few peers — no meaningful comparison
                 return 0.0, 0.0
 
-            category_median = statistics.median(peer_prices)
+            category_median = float(category_median)
             if category_median <= 0:
                 return 0.0, 0.0
 
-            pct_below = float((Decimal(str(category_median)) - current_price) / Decimal(str(category_median)) * 100)
+            pct_below = (category_median - float(current_price)) / category_median * 100
 
             # Piecewise linear: 50%+ below median -> 20 pts
-            if pct_below <= 0:
-                score = 0.0
-            elif pct_below >= 50:
-                score = 20.0
-            elif pct_below >= 35:
-                score = 14.0 + (pct_below - 35) * (6.0 / 15.0)
-            elif pct_below >= 20:
-                score = 8.0 + (pct_below - 20) * (6.0 / 15.0)
-            elif pct_below >= 10:
-                score = 4.0 + (pct_below - 10) * (4.0 / 10.0)
-            else:
-                score = pct_below * 0.4
+            score = _interpolate(pct_below, CATEGORY_RELATIVE_CURVE)
 
             return round(score, 2), round(pct_below, 1)
 
@@ -663,7 +1099,83 @@ class PriceAnalyzer:
             )
             return 0.0, 0.0
 
-    def _score_freshness(self, created_at: Optional[datetime]) -> float:
+    async def _fetch_category_median(
+        self,
+        category_id: UUID,
+        exclude_product_id: UUID,
+    ) -> tuple[Optional[float], int]:
+        """Compute the median active deal price in a category.
+
+        Args:
+            category_id: Category to look up peers in
+            exclude_product_id: Product to exclude from the peer set
+
+        Returns:
+            Tuple of (median price or None, number of peer deals)
+        """
+        peer_filter = and_(
+            Deal.category_id == category_id,
+            Deal.is_active == True,  # noqa: E712
+            Deal.product_id != exclude_product_id,
+            Deal.deal_price > 0,
+        )
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Let PostgreSQL sort and pick the median instead of
+            # shipping every peer price to Python
+            median_result = await self.db.execute(
+                select(
+                    func.percentile_cont(0.5).within_group(Deal.deal_price.asc()),
+                    func.count(),
+                ).where(peer_filter)
+            )
+            category_median, peer_count = median_result.one()
+            return category_median, peer_count
+        else:
+            # SQLite has no PERCENTILE_CONT, so fetch the prices and
+            # compute the median in Python
+            peers_result = await self.db.execute(
+                select(Deal.deal_price).where(peer_filter)
+            )
+            peer_prices = [float(price) for price in peers_result.scalars().all()]
+            if not peer_prices:
+                return None, 0
+            return statistics.median(peer_prices), len(peer_prices)
+
+    async def _prefetch_category_medians(self, category_slugs: set[str]) -> None:
+        """Warm the category id and median caches for several categories.
+
+        Medians are computed over all active deals in each category (no
+        product excluded) and, as in _score_category_relative_price, only
+        cached for categories above CATEGORY_MEDIAN_CACHE_MIN_PEERS.
+
+        Args:
+            category_slugs: Category slugs about to be scored
+        """
+        try:
+            id_result = await self.db.execute(
+                select(Category.slug, Category.id).where(Category.slug.in_(category_slugs))
+            )
+            category_ids = []
+            for slug, category_id in id_result.all():
+                _category_id_cache.set(slug, category_id)
+                category_ids.append(category_id)
+
+            if not category_ids:
+                return
+
+            medians = await compute_category_medians(self.db, category_ids)
+            for category_id, (median, count) in medians.items():
+                if count > CATEGORY_MEDIAN_CACHE_MIN_PEERS:
+                    _category_median_cache.set(category_id, (median, count))
+
+        except Exception as exc:
+            # Scoring falls back to per-deal lookups
+            self.logger.warning(
+                "category_median_prefetch_failed",
+                error=str(exc),
+            )
+
+    def _score_freshness(self, created_at: Optional[datetime], now: datetime) -> float:
         """Award points for recency of the deal.
 
         Newer deals are more likely to reflect real-time pricing events
@@ -679,6 +1191,7 @@ class PriceAnalyzer:
 
         Args:
             created_at: Timezone-aware datetime when the deal was created
+            now: Reference time the age is measured against
 
         Returns:
             Score from 0.0 to 10.0
@@ -686,24 +1199,12 @@ class PriceAnalyzer:
         if created_at is None:
             return 3.0  # Neutral default when timestamp is unavailable
 
-        now = datetime.now(timezone.utc)
         # Ensure created_at is timezone-aware for comparison
         if created_at.tzinfo is None:
             created_at = created_at.replace(tzinfo=timezone.utc)
 
-        age = now - created_at
-
-        if age <= timedelta(hours=1):
-            return 10.0
-        if age <= timedelta(hours=6):
-            return 8.0
-        if age <= timedelta(hours=24):
-            return 6.0
-        if age <= timedelta(days=3):
-            return 4.0
-        if age <= timedelta(days=7):
-            return 2.0
-        return 0.0
+        age_seconds = (now - created_at).total_seconds()
+        return FRESHNESS_POINTS[bisect_left(FRESHNESS_MAX_AGE_SECONDS, age_seconds)]
 
     def _score_shop_reliability(self, shop_slug: Optional[str]) -> float:
         """Return a reliability bonus for well-known shopping platforms.
@@ -719,45 +1220,144 @@ class PriceAnalyzer:
         """
         if shop_slug is None:
             return 3.0  # Neutral default for unknown shop
-        return SHOP_RELIABILITY.get(shop_slug.lower(), 3.0)
+        return SHOP_RELIABILITY.get(shop_slug, 3.0)
 
     # ------------------------------------------------------------------
     # Shared helpers
     # ------------------------------------------------------------------
 
-    def _classify_tier(self, score: Decimal, threshold: Decimal) -> str:
-        """Classify a score into a deal tier string.
+    async def _get_price_stats(
+        self, product_id: UUID, days: int = 90, now: Optional[datetime] = None
+    ) -> PriceStats:
+        """Summarize a product's price history within a time window.
+
+        On PostgreSQL the summary is aggregated in SQL over the same rows
+        _get_price_history would return, so only one row comes back.
+        Elsewhere the rows are fetched and summarized in Python.
 
         Args:
-            score: Computed deal score (0-100)
-            threshold: Minimum score for 'deal' tier (category-specific)
+            product_id: Product UUID
+            days: Number of days to look back (default: 90)
+            now: End of the window (default: current UTC time)
 
         Returns:
-            One of "super_deal", "hot_deal", "deal", or "none"
+            PriceStats over up to MAX_HISTORY_POINTS newest records
         """
-        if score >= SUPER_DEAL_THRESHOLD:
-            return "super_deal"
-        if score >= HOT_DEAL_THRESHOLD:
-            return "hot_deal"
-        if score >= threshold:
-            return "deal"
-        return "none"
+        now = now or datetime.now(timezone.utc)
+        recent_cutoff = now - timedelta(days=RECENT_WINDOW_DAYS)
+
+        if self.db.get_bind().dialect.name != "postgresql":
+            history = await self._get_price_history(product_id, days=days, now=now)
+            return _summarize_history(history, recent_cutoff)
+
+        window = (
+            select(PriceHistory.price, PriceHistory.recorded_at)
+            .where(
+                and_(
+                    PriceHistory.product_id == product_id,
+                    PriceHistory.recorded_at >= now - timedelta(days=days),
+                )
+            )
+            .order_by(PriceHistory.recorded_at.desc())
+            .limit(MAX_HISTORY_POINTS)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.avg(window.c.price),
+                func.min(window.c.price),
+                func.max(window.c.price),
+                func.stddev_samp(window.c.price),
+                func.avg(window.c.price).filter(window.c.recorded_at > recent_cutoff),
+            )
+        )
+        return _price_stats_from_aggregates(*result.one())
+
+    async def _get_price_stats_bulk(
+        self, product_ids: List[UUID], days: int = 90, now: Optional[datetime] = None
+    ) -> dict[UUID, PriceStats]:
+        """Summarize price history for several products in one query.
+
+        On PostgreSQL this is one grouped aggregate over each product's
+        newest MAX_HISTORY_POINTS records; elsewhere the rows are fetched
+        with _get_price_histories_bulk and summarized in Python.
+
+        Args:
+            product_ids: Product UUIDs
+            days: Number of days to look back (default: 90)
+            now: End of the window (default: current UTC time)
+
+        Returns:
+            Dict of product_id -> PriceStats (products without history are
+            omitted)
+        """
+        now = now or datetime.now(timezone.utc)
+        recent_cutoff = now - timedelta(days=RECENT_WINDOW_DAYS)
+
+        if self.db.get_bind().dialect.name != "postgresql":
+            histories = await self._get_price_histories_bulk(product_ids, days=days, now=now)
+            return {
+                product_id: _summarize_history(history, recent_cutoff)
+                for product_id, history in histories.items()
+            }
+
+        ranked = (
+            select(
+                PriceHistory.product_id,
+                PriceHistory.price,
+                PriceHistory.recorded_at,
+                func.row_number().over(
+                    partition_by=PriceHistory.product_id,
+                    order_by=PriceHistory.recorded_at.desc(),
+                ).label("rn"),
+            )
+            .where(
+                and_(
+                    PriceHistory.product_id.in_(product_ids),
+                    PriceHistory.recorded_at >= now - timedelta(days=days),
+                )
+            )
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                ranked.c.product_id,
+                func.count(),
+                func.avg(ranked.c.price),
+                func.min(ranked.c.price),
+                func.max(ranked.c.price),
+                func.stddev_samp(ranked.c.price),
+                func.avg(ranked.c.price).filter(ranked.c.recorded_at > recent_cutoff),
+            )
+            .where(ranked.c.rn <= MAX_HISTORY_POINTS)
+            .group_by(ranked.c.product_id)
+        )
+        return {
+            product_id: _price_stats_from_aggregates(*aggregates)
+            for product_id, *aggregates in result.all()
+        }
 
     async def _get_price_history(
-        self, product_id: UUID, days: int = 90
-    ) -> List[PriceHistory]:
+        self, product_id: UUID, days: int = 90, now: Optional[datetime] = None
+    ) -> List[Row]:
         """Fetch price history for a product within a time window.
 
+        Only the columns scoring reads are selected, so rows skip ORM
+        hydration and the query can be answered from the covering index.
+
         Args:
             product_id: Product UUID
             days: Number of days to look back (default: 90)
+            now: End of the window (default: current UTC time)
 
         Returns:
-            List of PriceHistory records, ordered by recorded_at desc
+            Up to MAX_HISTORY_POINTS (price, recorded_at) rows, ordered by
+            recorded_at desc
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=days)
         result = await self.db.execute(
-            select(PriceHistory)
+            select(PriceHistory.price, PriceHistory.recorded_at)
             .where(
                 and_(
                     PriceHistory.product_id == product_id,
@@ -765,8 +1365,47 @@ class PriceAnalyzer:
                 )
             )
             .order_by(PriceHistory.recorded_at.desc())
+            .limit(MAX_HISTORY_POINTS)
         )
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def _get_price_histories_bulk(
+        self, product_ids: List[UUID], days: int = 90, now: Optional[datetime] = None
+    ) -> dict[UUID, List[Row]]:
+        """Fetch price history for several products in one query.
+
+        Args:
+            product_ids: Product UUIDs
+            days: Number of days to look back (default: 90)
+            now: End of the window (default: current UTC time)
+
+        Returns:
+            Dict of product_id -> (product_id, price, recorded_at) rows
+            ordered by recorded_at desc (products without history are
+            omitted)
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=days)
+        # Stream in chunks so long histories never sit in memory beyond the
+        # rows kept per product
+        result = await self.db.stream(
+            select(PriceHistory.product_id, PriceHistory.price, PriceHistory.recorded_at)
+            .where(
+                and_(
+                    PriceHistory.product_id.in_(product_ids),
+                    PriceHistory.recorded_at >= cutoff,
+                )
+            )
+            .order_by(PriceHistory.product_id, PriceHistory.recorded_at.desc())
+            .execution_options(yield_per=HISTORY_STREAM_CHUNK_SIZE)
+        )
+
+        histories: dict[UUID, List[Row]] = {}
+        async for row in result:
+            rows = histories.setdefault(row.product_id, [])
+            # Same cap as _get_price_history: keep the newest records only
+            if len(rows) < MAX_HISTORY_POINTS:
+                rows.append(row)
+        return histories
 
     # ------------------------------------------------------------------
     # Reasoning generators
@@ -812,19 +1451,12 @@ class PriceAnalyzer:
 
         parts.append(f"가격 이력 {history_count}건 분석")
 
-        tier_labels = {
-            "super_deal": "슈퍼특가",
-            "hot_deal": "핫딜",
-            "deal": "특가",
-            "none": "",
-        }
-
-        prefix = tier_labels.get(tier, "")
+        prefix = _TIER_DISPLAY_NAMES.get(tier)
         detail = ", ".join(parts) if parts else "할인 정보 분석 중"
 
         if prefix:
-            return f"{prefix} - {detail} (점수: {float(total):.0f}점)"
-        return f"{detail} (점수: {float(total):.0f}점)"
+            return f"{prefix} - {detail} (점수: {total:.0f}점)"
+        return f"{detail} (점수: {total:.0f}점)"
 
     def _generate_reasoning_limited(
         self,
@@ -876,19 +1508,12 @@ class PriceAnalyzer:
         # Always note that this used limited-history path so users understand
         parts.append("초기 가격 데이터 기반 분석")
 
-        tier_labels = {
-            "super_deal": "슈퍼특가",
-            "hot_deal": "핫딜",
-            "deal": "특가",
-            "none": "",
-        }
-
-        prefix = tier_labels.get(tier, "")
+        prefix = _TIER_DISPLAY_NAMES.get(tier)
         detail = ", ".join(parts) if parts else "신규 상품, 가격 데이터 수집 중"
 
         if prefix:
-            return f"{prefix} - {detail} (점수: {float(total):.0f}점)"
-        return f"{detail} (점수: {float(total):.0f}점)"
+            return f"{prefix} - {detail} (점수: {total:.0f}점)"
+        return f"{detail} (점수: {total:.0f}점)"
 
     # ------------------------------------------------------------------
     # Legacy public method kept for backward compatibility
@@ -10,18 +10,93 @@ from typing import Optional, List, Tuple
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, and_, func
+from sqlalchemy import JSON, select, insert, update, and_, cast, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.models.product import Product
 from app.models.price_history import PriceHistory
 from app.models.shop import Shop
 from app.models.category import Category
 from app.scrapers.base import NormalizedProduct
+from app.services.cache_service import LocalTTLCache
 
 logger = structlog.get_logger(__name__)
 
+# Columns a re-scraped product overwrites on conflict
+_UPSERT_COLUMNS = (
+    "title",
+    "current_price",
+    "original_price",
+    "image_url",
+    "product_url",
+    "brand",
+    "last_scraped_at",
+    "is_active",
+)
+
+
+# Products per statement (and commit) in bulk_upsert_products
+PRODUCT_UPSERT_BATCH_SIZE = 500
+
+# Last recorded (price, recorded_at) per product, so a product seen again
+# within a scrape run needs no query to decide whether to record its price.
+# Only this process's writes show up here, hence the short TTL.
+_last_price_cache = LocalTTLCache(maxsize=10_000, ttl=900)
+
+
+def clear_last_price_cache() -> None:
+    """Drop all cached last recorded prices."""
+    _last_price_cache.clear()
+
+
+def _price_needs_record(
+    last_price: Decimal,
+    last_recorded_at: datetime,
+    new_price: Decimal,
+    now: datetime,
+    min_interval_hours: int = 1,
+) -> bool:
+    """Whether a price differs from, or is old enough past, the last record."""
+    if last_price != new_price:
+        return True
+    if last_recorded_at.tzinfo is None:
+        # SQLite hands back naive UTC timestamps
+        last_recorded_at = last_recorded_at.replace(tzinfo=timezone.utc)
+    return now - last_recorded_at > timedelta(hours=min_interval_hours)
+
+
+def _product_upsert_statement(values):
+    """Build a PostgreSQL INSERT ... ON CONFLICT DO UPDATE for products.
+
+    Conflicts on (external_id, shop_id) overwrite the scraped fields, keep
+    the existing category unless a new one is given, and merge metadata in
+    SQL.
+
+    Args:
+        values: Column values for one product, or a list of them
+
+    Returns:
+        Insert statement, without RETURNING
+    """
+    stmt = pg_insert(Product).values(values)
+    columns = Product.__table__.c
+    conflict_set = {columns[name]: stmt.excluded[name] for name in _UPSERT_COLUMNS}
+    conflict_set[columns.category_id] = func.coalesce(
+        stmt.excluded.category_id, columns.category_id
+    )
+    # The column is plain JSON, which has no || operator
+    conflict_set[columns.metadata] = cast(
+        cast(columns.metadata, JSONB).op("||")(cast(stmt.excluded.metadata, JSONB)),
+        JSON,
+    )
+    conflict_set[columns.updated_at] = func.now()
+    return stmt.on_conflict_do_update(
+        index_elements=[columns.external_id, columns.shop_id],
+        set_=conflict_set,
+    )
+
 
 class ProductService:
     """Service for managing products and price history.
@@ -49,7 +124,8 @@ class ProductService:
 
         This is the main entry point for scrapers to add/update products.
         Uses the unique constraint (external_id, shop_id) to determine
-        if this is a new product or an update.
+        if this is a new product or an update; on PostgreSQL this is a
+        single INSERT ... ON CONFLICT DO UPDATE.
 
         Also records a price history entry for every upsert.
 
@@ -68,6 +144,251 @@ class ProductService:
             title=normalized.title[:50],
         )
 
+        now = datetime.now(timezone.utc)
+        use_returning = self.db.get_bind().dialect.name == "postgresql"
+
+        if use_returning:
+            # One round trip instead of SELECT + INSERT/UPDATE + flush
+            stmt = _product_upsert_statement(dict(
+                external_id=normalized.external_id,
+                shop_id=shop_id,
+                title=normalized.title,
+                original_price=normalized.original_price,
+                current_price=normalized.current_price,
+                currency=normalized.currency,
+                image_url=normalized.image_url,
+                product_url=normalized.product_url,
+                brand=normalized.brand,
+                category_id=category_id,
+                last_scraped_at=now,
+                is_active=True,
+                metadata_=normalized.metadata or {},
+            ))
+            result = await self.db.execute(
+                stmt.returning(Product).execution_options(populate_existing=True)
+            )
+            product = result.scalar_one()
+            should_record = await self._record_price_if_needed(product, now)
+        else:
+            product = await self._upsert_product_orm(
+                shop_id, normalized, category_id, now
+            )
+
+            # Record price history
+            # Only record if price has changed or it's been more than 1 hour
+            should_record = await self._should_record_price(
+                product.id,
+                normalized.current_price,
+            )
+
+            if should_record:
+                price_record = PriceHistory(
+                    product_id=product.id,
+                    price=normalized.current_price,
+                    currency=normalized.currency,
+                    source="scraper",
+                )
+                self.db.add(price_record)
+
+        if should_record:
+            self.logger.debug(
+                "price_history_recorded",
+                product_id=str(product.id),
+                price=float(normalized.current_price),
+            )
+
+        await self.db.commit()
+        if should_record:
+            _last_price_cache.set(product.id, (normalized.current_price, now))
+        if not use_returning:
+            # RETURNING already loaded server-generated columns; the ORM
+            # path has to read them back
+            await self.db.refresh(product)
+
+        self.logger.info(
+            "product_upserted",
+            product_id=str(product.id),
+            external_id=normalized.external_id,
+            is_new=product.created_at == product.updated_at,
+        )
+
+        return product
+
+    async def bulk_upsert_products(
+        self,
+        shop_id: UUID,
+        items: List[Tuple[NormalizedProduct, Optional[UUID]]],
+        batch_size: int = PRODUCT_UPSERT_BATCH_SIZE,
+    ) -> List[Product]:
+        """Upsert many scraped products, a batch per statement and commit.
+
+        Same per-product behavior as upsert_product, but each batch is one
+        INSERT ... ON CONFLICT on PostgreSQL, the last recorded prices are
+        read in one query, and new price history rows go in one multi-row
+        INSERT.
+
+        Args:
+            shop_id: Shop UUID
+            items: (NormalizedProduct, optional category UUID) pairs
+            batch_size: Products per batch
+
+        Returns:
+            Upserted Product for each item, in the same order
+        """
+        products: List[Product] = []
+        for start in range(0, len(items), batch_size):
+            products.extend(
+                await self._bulk_upsert_batch(shop_id, items[start:start + batch_size])
+            )
+
+        self.logger.info(
+            "products_bulk_upserted",
+            shop_id=str(shop_id),
+            count=len(products),
+        )
+
+        return products
+
+    async def _bulk_upsert_batch(
+        self,
+        shop_id: UUID,
+        items: List[Tuple[NormalizedProduct, Optional[UUID]]],
+    ) -> List[Product]:
+        """Upsert one batch for bulk_upsert_products and commit it."""
+        now = datetime.now(timezone.utc)
+        by_external_id: dict[str, Product] = {}
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # ON CONFLICT can't touch the same row twice in one statement,
+            # so fold repeated products together as successive upserts would
+            rows: dict[str, dict] = {}
+            for normalized, category_id in items:
+                previous = rows.get(normalized.external_id)
+                metadata = normalized.metadata or {}
+                if previous is not None:
+                    category_id = category_id or previous["category_id"]
+                    metadata = {**previous["metadata_"], **metadata}
+                rows[normalized.external_id] = dict(
+                    external_id=normalized.external_id,
+                    shop_id=shop_id,
+                    title=normalized.title,
+                    original_price=normalized.original_price,
+                    current_price=normalized.current_price,
+                    currency=normalized.currency,
+                    image_url=normalized.image_url,
+                    product_url=normalized.product_url,
+                    brand=normalized.brand,
+                    category_id=category_id,
+                    last_scraped_at=now,
+                    is_active=True,
+                    metadata_=metadata,
+                )
+
+            result = await self.db.execute(
+                _product_upsert_statement(list(rows.values()))
+                .returning(Product)
+                .execution_options(populate_existing=True)
+            )
+            for product in result.scalars().all():
+                by_external_id[product.external_id] = product
+        else:
+            for normalized, category_id in items:
+                by_external_id[normalized.external_id] = await self._upsert_product_orm(
+                    shop_id, normalized, category_id, now
+                )
+
+        # Record price history where the price changed or the last record
+        # is over an hour old
+        last_prices = await self._get_last_prices(
+            [product.id for product in by_external_id.values()]
+        )
+        history_rows = []
+        for product in by_external_id.values():
+            last = last_prices.get(product.id)
+            if last is None or _price_needs_record(
+                last[0], last[1], product.current_price, now
+            ):
+                history_rows.append(dict(
+                    product_id=product.id,
+                    price=product.current_price,
+                    currency=product.currency,
+                    source="scraper",
+                ))
+        if history_rows:
+            await self.db.execute(insert(PriceHistory), history_rows)
+
+        await self.db.commit()
+        for row in history_rows:
+            _last_price_cache.set(row["product_id"], (row["price"], now))
+
+        return [by_external_id[normalized.external_id] for normalized, _ in items]
+
+    async def _get_last_prices(
+        self, product_ids: List[UUID]
+    ) -> dict[UUID, tuple[Decimal, datetime]]:
+        """Fetch the most recent recorded price for several products.
+
+        Cached prices are used where available; the rest come from one query.
+
+        Args:
+            product_ids: Product UUIDs
+
+        Returns:
+            Dict of product_id -> (price, recorded_at) (products without
+            history are omitted)
+        """
+        last_prices = {}
+        missing = []
+        for product_id in product_ids:
+            cached = _last_price_cache.get(product_id)
+            if cached is None:
+                missing.append(product_id)
+            else:
+                last_prices[product_id] = cached
+
+        if not missing:
+            return last_prices
+
+        ranked = (
+            select(
+                PriceHistory.product_id,
+                PriceHistory.price,
+                PriceHistory.recorded_at,
+                func.row_number().over(
+                    partition_by=PriceHistory.product_id,
+                    order_by=PriceHistory.recorded_at.desc(),
+                ).label("rn"),
+            )
+            .where(PriceHistory.product_id.in_(missing))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ranked.c.product_id, ranked.c.price, ranked.c.recorded_at)
+            .where(ranked.c.rn == 1)
+        )
+        for product_id, price, recorded_at in result.all():
+            last_prices[product_id] = (price, recorded_at)
+            _last_price_cache.set(product_id, (price, recorded_at))
+        return last_prices
+
+    async def _upsert_product_orm(
+        self,
+        shop_id: UUID,
+        normalized: NormalizedProduct,
+        category_id: Optional[UUID],
+        now: datetime,
+    ) -> Product:
+        """Insert or update a product through the ORM (non-PostgreSQL).
+
+        Args:
+            shop_id: Shop UUID
+            normalized: NormalizedProduct from scraper
+            category_id: Optional category UUID
+            now: Scrape time
+
+        Returns:
+            Created or updated Product, flushed so it has an id
+        """
         # Check for existing product
         existing = await self.db.execute(
             select(Product).where(and_(
@@ -77,8 +398,6 @@ class ProductService:
         )
         product = existing.scalar_one_or_none()
 
-        now = datetime.now(timezone.utc)
-
         if product:
             # Update existing product
             self.logger.info("updating_existing_product", product_id=str(product.id))
@@ -123,37 +442,6 @@ class ProductService:
         # Flush to get product.id for price history
         await self.db.flush()
 
-        # Record price history
-        # Only record if price has changed or it's been more than 1 hour
-        should_record = await self._should_record_price(
-            product.id,
-            normalized.current_price,
-        )
-
-        if should_record:
-            price_record = PriceHistory(
-                product_id=product.id,
-                price=normalized.current_price,
-                currency=normalized.currency,
-                source="scraper",
-            )
-            self.db.add(price_record)
-            self.logger.debug(
-                "price_history_recorded",
-                product_id=str(product.id),
-                price=float(normalized.current_price),
-            )
-
-        await self.db.commit()
-        await self.db.refresh(product)
-
-        self.logger.info(
-            "product_upserted",
-            product_id=str(product.id),
-            external_id=normalized.external_id,
-            is_new=product.created_at == product.updated_at,
-        )
-
         return product
 
     async def _should_record_price(
@@ -176,29 +464,92 @@ class ProductService:
         Returns:
             True if should record, False otherwise
         """
-        # Get most recent price history entry
-        result = await self.db.execute(
-            select(PriceHistory)
-            .where(PriceHistory.product_id == product_id)
-            .order_by(PriceHistory.recorded_at.desc())
-            .limit(1)
+        last_entry = _last_price_cache.get(product_id)
+        if last_entry is None:
+            # Get most recent price history entry
+            result = await self.db.execute(
+                select(PriceHistory.price, PriceHistory.recorded_at)
+                .where(PriceHistory.product_id == product_id)
+                .order_by(PriceHistory.recorded_at.desc())
+                .limit(1)
+            )
+            last_entry = result.first()
+
+            if not last_entry:
+                # No history yet, always record
+                return True
+
+            last_entry = tuple(last_entry)
+            _last_price_cache.set(product_id, last_entry)
+
+        last_price, last_recorded_at = last_entry
+        return _price_needs_record(
+            last_price,
+            last_recorded_at,
+            new_price,
+            datetime.now(timezone.utc),
+            min_interval_hours,
         )
-        last_entry = result.scalar_one_or_none()
 
-        if not last_entry:
-            # No history yet, always record
-            return True
+    async def _record_price_if_needed(
+        self,
+        product: Product,
+        now: datetime,
+        min_interval_hours: int = 1,
+    ) -> bool:
+        """Record the current price of an upserted product if it is due.
 
-        # Check if price changed
-        if last_entry.price != new_price:
-            return True
+        Same rule as _should_record_price, but when the last price is not
+        cached the check runs inside a single INSERT ... SELECT instead of
+        reading the last record first. PostgreSQL only.
 
-        # Check if enough time has passed
-        time_since_last = datetime.now(timezone.utc) - last_entry.recorded_at
-        if time_since_last > timedelta(hours=min_interval_hours):
+        Args:
+            product: Product just returned by the upsert
+            now: Time of the upsert
+            min_interval_hours: Minimum hours between records (default: 1)
+
+        Returns:
+            True if a price history entry was recorded, False otherwise
+        """
+        cached = _last_price_cache.get(product.id)
+        if cached is not None:
+            if not _price_needs_record(
+                cached[0], cached[1], product.current_price, now, min_interval_hours
+            ):
+                return False
+            self.db.add(PriceHistory(
+                product_id=product.id,
+                price=product.current_price,
+                currency=product.currency,
+                source="scraper",
+            ))
             return True
 
-        return False
+        latest = (
+            select(PriceHistory.price, PriceHistory.recorded_at)
+            .where(PriceHistory.product_id == product.id)
+            .order_by(PriceHistory.recorded_at.desc())
+            .limit(1)
+            .subquery()
+        )
+        unchanged = select(latest.c.price).where(and_(
+            latest.c.price == product.current_price,
+            latest.c.recorded_at >= now - timedelta(hours=min_interval_hours),
+        ))
+        result = await self.db.execute(
+            insert(PriceHistory)
+            .from_select(
+                ["product_id", "price", "currency", "source"],
+                select(
+                    literal(product.id, PriceHistory.product_id.type),
+                    literal(product.current_price, PriceHistory.price.type),
+                    literal(product.currency, PriceHistory.currency.type),
+                    literal("scraper", PriceHistory.source.type),
+                ).where(~unchanged.exists()),
+            )
+            .returning(PriceHistory.id)
+        )
+        return result.first() is not None
 
     async def get_product_by_id(self, product_id: UUID) -> Optional[Product]:
         """Get product by ID with relationships loaded.
@@ -212,8 +563,8 @@ class ProductService:
         query = (
             select(Product)
             .options(
-                selectinload(Product.shop),
-                selectinload(Product.category),
+                joinedload(Product.shop),
+                joinedload(Product.category),
             )
             .where(Product.id == product_id)
         )
@@ -241,11 +592,13 @@ class ProductService:
         Returns:
             Tuple of (products list, total count)
         """
+        # The total rides along as a window count, so no separate COUNT runs.
+        # Shop and category are many-to-one, so joining them adds no rows.
         query = (
-            select(Product)
+            select(Product, func.count().over().label("total"))
             .options(
-                selectinload(Product.shop),
-                selectinload(Product.category),
+                joinedload(Product.shop),
+                joinedload(Product.category),
             )
             .where(Product.is_active == is_active)
         )
@@ -268,10 +621,17 @@ class ProductService:
 
         # Execute
         result = await self.db.execute(query)
-        products = list(result.scalars().all())
+        rows = result.all()
+        products = [row[0] for row in rows]
 
-        total_result = await self.db.execute(count_q)
-        total = total_result.scalar() or 0
+        if rows:
+            total = rows[0].total
+        elif page == 1:
+            total = 0
+        else:
+            # Pages past the end have no rows to carry the window count
+            total_result = await self.db.execute(count_q)
+            total = total_result.scalar() or 0
 
         return products, total
 
@@ -318,7 +678,8 @@ class ProductService:
     ) -> Optional[dict]:
         """Get price statistics for a product.
 
-        Computes min, max, average, and current price from price history.
+        Computes min, max, average, and current price from price history
+        with a single aggregate query.
 
         Args:
             product_id: Product UUID
@@ -327,23 +688,47 @@ class ProductService:
         Returns:
             Dict with statistics or None if insufficient data
         """
-        history = await self.get_price_history(product_id, days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        in_window = and_(
+            PriceHistory.product_id == product_id,
+            PriceHistory.recorded_at >= cutoff,
+        )
 
-        if len(history) < 2:
-            return None
+        # Aggregate in SQL; the latest price rides along as a scalar subquery
+        latest_price = (
+            select(PriceHistory.price)
+            .where(in_window)
+            .order_by(PriceHistory.recorded_at.desc())
+            .limit(1)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.min(PriceHistory.price),
+                func.max(PriceHistory.price),
+                func.avg(PriceHistory.price),
+                func.min(PriceHistory.recorded_at),
+                func.max(PriceHistory.recorded_at),
+                latest_price,
+            ).where(in_window)
+        )
+        count, min_price, max_price, avg_price, first_recorded, last_recorded, current_price = result.one()
 
-        prices = [float(h.price) for h in history]
+        if count < 2:
+            return None
 
         stats = {
             "product_id": str(product_id),
             "days_analyzed": days,
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "avg_price": sum(prices) / len(prices),
-            "current_price": prices[-1],  # Most recent
-            "data_points": len(prices),
-            "first_recorded": history[0].recorded_at.isoformat(),
-            "last_recorded": history[-1].recorded_at.isoformat(),
+            "min_price": float(min_price),
+            "max_price": float(max_price),
+            "avg_price": float(avg_price),
+            "current_price": float(current_price),  # Most recent
+            "data_points": count,
+            "first_recorded": first_recorded.isoformat(),
+            "last_recorded": last_recorded.isoformat(),
         }
 
         self.logger.info(
@@ -370,20 +755,20 @@ class ProductService:
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
+        # One UPDATE instead of loading every stale product. Products
+        # already loaded in the session aren't synced; refresh if needed.
         result = await self.db.execute(
-            select(Product).where(and_(
+            update(Product)
+            .where(and_(
                 Product.is_active == True,
                 Product.last_scraped_at < cutoff,
             ))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
         )
-        stale_products = list(result.scalars().all())
-
-        for product in stale_products:
-            product.is_active = False
-
         await self.db.commit()
 
-        count = len(stale_products)
+        count = result.rowcount
 
         self.logger.info(
             "stale_products_deactivated",
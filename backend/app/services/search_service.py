@@ -8,8 +8,9 @@ from datetime import datetime, timezone
 from typing import List, Tuple, Optional
 
 import structlog
-from sqlalchemy import select, func, or_, and_
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_, and_, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from app.models.deal import Deal
@@ -19,6 +20,14 @@ from app.models.category import Category
 
 logger = structlog.get_logger(__name__)
 
+# ORDER BY clauses for the sorts that don't depend on the query, built once;
+# "relevance" is built per query by SearchService._relevance_order
+_BY_SCORE = Deal.ai_score.desc().nullslast()
+_SORT_CLAUSES = {
+    "score": (_BY_SCORE,),
+    "newest": (Deal.created_at.desc(),),
+}
+
 
 class SearchService:
     """Service for searching deals and tracking search analytics.
@@ -36,6 +45,45 @@ class SearchService:
         self.db = db
         self.logger = logger.bind(service="search_service")
 
+    def _title_match(self, normalized_query: str):
+        """Build the WHERE clause matching deal titles against a query.
+
+        On PostgreSQL a title also matches when some word in it is
+        trigram-similar to the query (the <% operator), so misspellings
+        still find results; it and ILIKE are both served by the partial
+        idx_deals_title_trgm_active GIN index, whose WHERE is_active the
+        search filter implies. Other dialects use ILIKE alone.
+
+        Args:
+            normalized_query: Stripped, non-empty search query
+
+        Returns:
+            SQLAlchemy boolean clause
+        """
+        contains = Deal.title.ilike(f"%{normalized_query}%")
+        if self.db.get_bind().dialect.name != "postgresql":
+            return contains
+        return or_(contains, literal(normalized_query).op("<%")(Deal.title))
+
+    def _relevance_order(self, normalized_query: str) -> list:
+        """Build ORDER BY clauses ranking deals by how well they match.
+
+        On PostgreSQL results are ranked by trigram word-similarity distance
+        to the query (the <<-> operator), best first, then by AI score; the
+        idx_deals_title_trgm_gist index can return titles in that order.
+        Other dialects have no similarity function and rank by AI score
+        alone.
+
+        Args:
+            normalized_query: Stripped, non-empty search query
+
+        Returns:
+            List of ORDER BY clauses
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return [_BY_SCORE]
+        return [literal(normalized_query).op("<<->")(Deal.title), _BY_SCORE]
+
     async def search_deals(
         self,
         query: str,
@@ -44,11 +92,13 @@ class SearchService:
         category_slug: Optional[str] = None,
         shop_slug: Optional[str] = None,
         sort_by: str = "relevance",
+        track_keyword: bool = True,
     ) -> Tuple[List[Deal], int]:
         """Full-text search deals using pg_trgm similarity.
 
-        Searches deal titles using case-insensitive ILIKE pattern matching.
-        The trigram indexes enable fast fuzzy matching for Korean text.
+        Matches deal titles containing the query (case-insensitive) and, on
+        PostgreSQL, titles with a word similar to it. The trigram index
+        serves both, which enables fast fuzzy matching for Korean text.
 
         Args:
             query: Search query string
@@ -57,6 +107,10 @@ class SearchService:
             category_slug: Optional category filter
             shop_slug: Optional shop filter
             sort_by: Sort method ("relevance", "score", "newest")
+            track_keyword: Record the query for analytics before returning.
+                Callers that track it later, e.g. with
+                track_search_keyword() after the response is sent, pass
+                False.
 
         Returns:
             Tuple of (matching deals list, total count)
@@ -76,47 +130,36 @@ class SearchService:
             self.logger.warning("empty_search_query")
             return [], 0
 
-        # Build search query with trigram similarity
-        search_query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-            )
-            .where(and_(
-                Deal.is_active == True,
-                Deal.title.ilike(f"%{normalized_query}%"),
-            ))
-        )
-
-        # Count query
-        count_q = select(func.count(Deal.id)).where(and_(
+        # Match deals with trigram similarity; filters are built once and
+        # shared by the page query and the (rarely needed) count query
+        matching = select(Deal).where(and_(
             Deal.is_active == True,
-            Deal.title.ilike(f"%{normalized_query}%"),
+            self._title_match(normalized_query),
         ))
 
         # Apply filters
         if category_slug:
-            search_query = search_query.join(Category).where(Category.slug == category_slug)
-            count_q = count_q.join(Category).where(Category.slug == category_slug)
+            matching = matching.join(Category).where(Category.slug == category_slug)
 
         if shop_slug:
-            search_query = search_query.join(Deal.shop).where(Shop.slug == shop_slug)
-            count_q = count_q.join(Deal.shop).where(Shop.slug == shop_slug)
-
-        # Sorting
-        # Note: For true trigram similarity ranking, you would use:
-        # .order_by(func.similarity(Deal.title, normalized_query).desc())
-        # But this requires similarity() function which needs pg_trgm enabled
-        # For now, we'll sort by AI score as a proxy for relevance
+            matching = matching.join(Deal.shop).where(Shop.slug == shop_slug)
+
+        # The total rides along as a window count, so no separate COUNT runs
+        search_query = (
+            matching
+            .add_columns(func.count().over().label("total"))
+            .options(
+                selectinload(Deal.shop),
+                selectinload(Deal.category),
+            )
+        )
+
+        # Sorting (unknown sorts fall back to AI score)
         if sort_by == "relevance":
-            search_query = search_query.order_by(Deal.ai_score.desc().nullslast())
-        elif sort_by == "score":
-            search_query = search_query.order_by(Deal.ai_score.desc().nullslast())
-        elif sort_by == "newest":
-            search_query = search_query.order_by(Deal.created_at.desc())
+            order = self._relevance_order(normalized_query)
         else:
-            search_query = search_query.order_by(Deal.ai_score.desc().nullslast())
+            order = _SORT_CLAUSES.get(sort_by, _SORT_CLAUSES["score"])
+        search_query = search_query.order_by(*order)
 
         # Pagination
         offset = (page - 1) * limit
@@ -124,10 +167,9 @@ class SearchService:
 
         # Execute queries
         result = await self.db.execute(search_query)
-        deals = list(result.scalars().all())
-
-        total_result = await self.db.execute(count_q)
-        total = total_result.scalar() or 0
+        rows = result.all()
+        deals = [row[0] for row in rows]
+        total = await self._page_total(rows, page, matching)
 
         self.logger.info(
             "search_completed",
@@ -137,8 +179,8 @@ class SearchService:
             page=page,
         )
 
-        # Track keyword asynchronously (don't block search response)
-        await self._track_keyword(normalized_query)
+        if track_keyword:
+            await self._track_keyword(normalized_query)
 
         return deals, total
 
@@ -151,6 +193,7 @@ class SearchService:
         max_price: Optional[float] = None,
         category_slug: Optional[str] = None,
         shop_slug: Optional[str] = None,
+        track_keyword: bool = True,
     ) -> Tuple[List[Deal], int]:
         """Advanced search with additional filters.
 
@@ -162,6 +205,7 @@ class SearchService:
             max_price: Maximum price filter
             category_slug: Optional category filter
             shop_slug: Optional shop filter
+            track_keyword: Record the query for analytics before returning
 
         Returns:
             Tuple of (matching deals list, total count)
@@ -177,43 +221,37 @@ class SearchService:
         if not normalized_query:
             return [], 0
 
-        # Build search query
-        search_query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-            )
-            .where(and_(
-                Deal.is_active == True,
-                Deal.title.ilike(f"%{normalized_query}%"),
-            ))
-        )
-
-        count_q = select(func.count(Deal.id)).where(and_(
+        # Build the match once, for both the page and count queries
+        matching = select(Deal).where(and_(
             Deal.is_active == True,
-            Deal.title.ilike(f"%{normalized_query}%"),
+            self._title_match(normalized_query),
         ))
 
         # Apply advanced filters
         if min_score is not None:
-            search_query = search_query.where(Deal.ai_score >= min_score)
-            count_q = count_q.where(Deal.ai_score >= min_score)
+            matching = matching.where(Deal.ai_score >= min_score)
 
         if max_price is not None:
-            search_query = search_query.where(Deal.deal_price <= max_price)
-            count_q = count_q.where(Deal.deal_price <= max_price)
+            matching = matching.where(Deal.deal_price <= max_price)
 
         if category_slug:
-            search_query = search_query.join(Category).where(Category.slug == category_slug)
-            count_q = count_q.join(Category).where(Category.slug == category_slug)
+            matching = matching.join(Category).where(Category.slug == category_slug)
 
         if shop_slug:
-            search_query = search_query.join(Deal.shop).where(Shop.slug == shop_slug)
-            count_q = count_q.join(Deal.shop).where(Shop.slug == shop_slug)
+            matching = matching.join(Deal.shop).where(Shop.slug == shop_slug)
+
+        # The total comes back as a window count
+        search_query = (
+            matching
+            .add_columns(func.count().over().label("total"))
+            .options(
+                selectinload(Deal.shop),
+                selectinload(Deal.category),
+            )
+        )
 
-        # Sort by AI score
-        search_query = search_query.order_by(Deal.ai_score.desc().nullslast())
+        # Best matches first
+        search_query = search_query.order_by(*self._relevance_order(normalized_query))
 
         # Pagination
         offset = (page - 1) * limit
@@ -221,16 +259,37 @@ class SearchService:
 
         # Execute
         result = await self.db.execute(search_query)
-        deals = list(result.scalars().all())
+        rows = result.all()
+        deals = [row[0] for row in rows]
+        total = await self._page_total(rows, page, matching)
 
-        total_result = await self.db.execute(count_q)
-        total = total_result.scalar() or 0
-
-        # Track keyword
-        await self._track_keyword(normalized_query)
+        if track_keyword:
+            await self._track_keyword(normalized_query)
 
         return deals, total
 
+    async def _page_total(self, rows, page: int, matching) -> int:
+        """Total match count for a page fetched with a window count.
+
+        Args:
+            rows: Rows of (Deal, total) for the page
+            page: Page number (1-indexed)
+            matching: The filtered select(Deal) the page was built from
+
+        Returns:
+            Total number of matching deals
+        """
+        if rows:
+            return rows[0].total
+        if page == 1:
+            return 0
+        # Pages past the end have no rows to carry the window count, so
+        # count the same match (only now is the COUNT statement built)
+        total_result = await self.db.execute(
+            matching.with_only_columns(func.count(), maintain_column_froms=True)
+        )
+        return total_result.scalar() or 0
+
     async def get_trending_keywords(self, limit: int = 10) -> List[dict]:
         """Get trending search keywords.
 
@@ -294,8 +353,10 @@ class SearchService:
     async def _track_keyword(self, keyword: str) -> None:
         """Track a search keyword for analytics.
 
-        Creates or updates a SearchKeyword record to track search frequency.
-        Filters out very short queries (< 2 chars).
+        Creates or updates a SearchKeyword record to track search frequency;
+        on PostgreSQL this is a single INSERT ... ON CONFLICT DO UPDATE, so
+        concurrent searches for the same keyword never race. Filters out
+        very short queries (< 2 chars).
 
         Args:
             keyword: Search keyword to track
@@ -307,32 +368,48 @@ class SearchService:
             return
 
         try:
-            # Check if keyword exists
-            existing = await self.db.execute(
-                select(SearchKeyword).where(SearchKeyword.keyword == normalized)
-            )
-            kw = existing.scalar_one_or_none()
-
-            if kw:
-                # Update existing
-                kw.search_count += 1
-                kw.last_searched_at = datetime.now(timezone.utc)
-                self.logger.debug(
-                    "keyword_updated",
-                    keyword=normalized,
-                    count=kw.search_count,
-                )
-            else:
-                # Create new
-                kw = SearchKeyword(
+            if self.db.get_bind().dialect.name == "postgresql":
+                now = datetime.now(timezone.utc)
+                stmt = pg_insert(SearchKeyword).values(
                     keyword=normalized,
                     search_count=1,
+                    last_searched_at=now,
                 )
-                self.db.add(kw)
-                self.logger.debug(
-                    "keyword_created",
-                    keyword=normalized,
+                await self.db.execute(stmt.on_conflict_do_update(
+                    index_elements=[SearchKeyword.keyword],
+                    set_={
+                        "search_count": SearchKeyword.search_count + 1,
+                        "last_searched_at": now,
+                    },
+                ))
+                self.logger.debug("keyword_tracked", keyword=normalized)
+            else:
+                # Check if keyword exists
+                existing = await self.db.execute(
+                    select(SearchKeyword).where(SearchKeyword.keyword == normalized)
                 )
+                kw = existing.scalar_one_or_none()
+
+                if kw:
+                    # Update existing
+                    kw.search_count += 1
+                    kw.last_searched_at = datetime.now(timezone.utc)
+                    self.logger.debug(
+                        "keyword_updated",
+                        keyword=normalized,
+                        count=kw.search_count,
+                    )
+                else:
+                    # Create new
+                    kw = SearchKeyword(
+                        keyword=normalized,
+                        search_count=1,
+                    )
+                    self.db.add(kw)
+                    self.logger.debug(
+                        "keyword_created",
+                        keyword=normalized,
+                    )
 
             await self.db.commit()
 
@@ -344,3 +421,20 @@ class SearchService:
                 error=str(e),
             )
             await self.db.rollback()
+
+
+async def track_search_keyword(
+    session_factory: async_sessionmaker[AsyncSession],
+    keyword: str,
+) -> None:
+    """Record a search keyword for analytics in its own session.
+
+    Meant to run after the search response has been sent (as a FastAPI
+    background task), so the keyword write adds nothing to search latency.
+
+    Args:
+        session_factory: Async session factory for database access
+        keyword: Search keyword to track
+    """
+    async with session_factory() as db:
+        await SearchService(db)._track_keyword(keyword)
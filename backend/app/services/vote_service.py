@@ -3,13 +3,18 @@
 import uuid
 from typing import Optional, Dict, Any
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.deal import Deal
 from app.models.user_vote import UserVote
 
 
+def _adjusted(column, delta: int):
+    """SQL for a vote counter moved by delta, never going below zero."""
+    return case((column + delta < 0, 0), else_=column + delta)
+
+
 class VoteService:
     """Handles deal voting with per-user tracking."""
 
@@ -29,41 +34,40 @@ class VoteService:
 
         Returns dict with vote_up, vote_down, user_vote, or None if deal not found.
         """
-        # Get deal first (ensures it exists)
-        deal_stmt = select(Deal).where(Deal.id == deal_id)
-        deal_result = await self.db.execute(deal_stmt)
-        deal = deal_result.scalar_one_or_none()
-
-        if not deal:
-            return None
-
-        # Get existing vote
-        stmt = select(UserVote).where(
-            UserVote.user_id == user_id,
-            UserVote.deal_id == deal_id,
+        # Check the deal exists and get any existing vote in one query
+        stmt = (
+            select(Deal.id, UserVote)
+            .outerjoin(UserVote, and_(
+                UserVote.deal_id == Deal.id,
+                UserVote.user_id == user_id,
+            ))
+            .where(Deal.id == deal_id)
         )
         result = await self.db.execute(stmt)
-        existing = result.scalar_one_or_none()
+        row = result.first()
+
+        if not row:
+            return None
 
+        existing = row[1]
+        up_delta = down_delta = 0
         user_vote = None
 
         if existing:
             if existing.vote_type == vote_type:
                 # Toggle off: remove vote
                 if vote_type == "up":
-                    deal.vote_up = max(0, deal.vote_up - 1)
+                    up_delta = -1
                 else:
-                    deal.vote_down = max(0, deal.vote_down - 1)
+                    down_delta = -1
                 await self.db.delete(existing)
                 user_vote = None
             else:
                 # Switch vote
                 if existing.vote_type == "up":
-                    deal.vote_up = max(0, deal.vote_up - 1)
-                    deal.vote_down += 1
+                    up_delta, down_delta = -1, 1
                 else:
-                    deal.vote_down = max(0, deal.vote_down - 1)
-                    deal.vote_up += 1
+                    up_delta, down_delta = 1, -1
                 existing.vote_type = vote_type
                 user_vote = vote_type
         else:
@@ -75,17 +79,33 @@ class VoteService:
             )
             self.db.add(new_vote)
             if vote_type == "up":
-                deal.vote_up += 1
+                up_delta = 1
             else:
-                deal.vote_down += 1
+                down_delta = 1
             user_vote = vote_type
 
+        # Adjust the counters in SQL so concurrent votes on the same deal
+        # can't overwrite each other's increments
+        counts = {}
+        if up_delta:
+            counts[Deal.vote_up] = _adjusted(Deal.vote_up, up_delta)
+        if down_delta:
+            counts[Deal.vote_down] = _adjusted(Deal.vote_down, down_delta)
+        result = await self.db.execute(
+            update(Deal)
+            .where(Deal.id == deal_id)
+            .values(counts)
+            .returning(Deal.vote_up, Deal.vote_down)
+            .execution_options(synchronize_session=False)
+        )
+        vote_up, vote_down = result.one()
+
         await self.db.flush()
 
         return {
-            "deal_id": str(deal.id),
-            "vote_up": deal.vote_up,
-            "vote_down": deal.vote_down,
+            "deal_id": str(deal_id),
+            "vote_up": vote_up,
+            "vote_down": vote_down,
             "user_vote": user_vote,
         }
 
@@ -95,9 +115,10 @@ class VoteService:
         user_id: uuid.UUID,
     ) -> Optional[str]:
         """Get the current user's vote type for a deal, or None."""
+        # uq_user_deal_vote allows at most one row, so take the first
         stmt = select(UserVote.vote_type).where(
             UserVote.user_id == user_id,
             UserVote.deal_id == deal_id,
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.scalar()
@@ -51,8 +51,6 @@ async def seed_data():
                  is_active=False, scrape_interval_minutes=60,
                  country="KR", currency="KRW", metadata_={}),
         ]
-        for s in shops:
-            session.add(s)
 
         # Categories
         categories = [
@@ -63,9 +61,10 @@ async def seed_data():
             Category(name="상품권/쿠폰", name_en="Gift Cards", slug="gift-cards", icon="gift", sort_order=5),
             Category(name="생활/식품", name_en="Living/Food", slug="living-food", icon="shopping-basket", sort_order=6),
         ]
-        for c in categories:
-            session.add(c)
 
+        # Ids are generated client-side, so the flush sends each table's
+        # rows as one batched INSERT
+        session.add_all(shops + categories)
         await session.commit()
         print(f"[OK] Seeded {len(shops)} shops, {len(categories)} categories")
 
@@ -91,32 +90,47 @@ async def run_naver_scraper():
         return
     print("[OK] Naver API is healthy")
 
-    # Fetch deals from just 2 categories to start small
+    # Fetch deals from just 2 categories to start small. Categories are
+    # fetched concurrently; the adapter's rate limiter paces the API calls.
     test_categories = ["pc-hardware", "laptop-mobile"]
-    all_deals = []
 
-    for cat in test_categories:
-        print(f"[...] Fetching deals for category: {cat}")
+    async def fetch_category(cat):
         try:
-            deals = await adapter.fetch_deals(category=cat)
-            all_deals.extend(deals)
-            print(f"  -> {len(deals)} deals found")
+            return cat, await adapter.fetch_deals(category=cat)
         except Exception as e:
-            print(f"  -> Error: {e}")
+            return cat, e
 
-    print(f"\n[TOTAL] {len(all_deals)} deals fetched from Naver")
-
-    if not all_deals:
-        print("[WARN] No deals to save")
-        return
-
-    # Save to DB
     from app.scrapers.scraper_service import ScraperService
 
+    # Save each category as soon as its fetch finishes, while the others
+    # are still downloading, so only one category's deals are held at once
+    print(f"[...] Fetching deals for categories: {', '.join(test_categories)}")
+    fetched = 0
+    stats = {}
     async with async_session_factory() as session:
         service = ScraperService(session)
-        stats = await service.process_deals(all_deals, "naver")
-        await session.commit()
+        for next_done in asyncio.as_completed(
+            [fetch_category(cat) for cat in test_categories]
+        ):
+            cat, deals = await next_done
+            if isinstance(deals, Exception):
+                print(f"  -> {cat}: Error: {deals}")
+                continue
+            print(f"  -> {cat}: {len(deals)} deals found")
+            if not deals:
+                continue
+
+            fetched += len(deals)
+            batch_stats = await service.process_deals(deals, "naver")
+            await session.commit()
+            for key, value in batch_stats.items():
+                stats[key] = stats.get(key, 0) + value
+
+    print(f"\n[TOTAL] {fetched} deals fetched from Naver")
+
+    if not fetched:
+        print("[WARN] No deals to save")
+        return
 
     print(f"\n[RESULTS]")
     print(f"  Products created: {stats['products_created']}")
@@ -129,31 +143,38 @@ async def run_naver_scraper():
 async def show_saved_deals():
     """Print deals saved in DB."""
     from sqlalchemy import select
+    from sqlalchemy.orm import raiseload
     from app.db.session import async_session_factory
     from app.models.deal import Deal
 
     async with async_session_factory() as session:
+        # Only Deal columns are printed; raise instead of lazy-loading a
+        # relationship per row if that ever changes
         result = await session.execute(
-            select(Deal).where(Deal.is_active == True)
+            select(Deal).options(raiseload("*")).where(Deal.is_active == True)
             .order_by(Deal.ai_score.desc().nullslast())
             .limit(10)
         )
         deals = result.scalars().all()
 
-        if not deals:
-            print("\n[INFO] No deals in DB yet")
-            return
+    # The session is closed before any output is written
+    if not deals:
+        print("\n[INFO] No deals in DB yet")
+        return
 
-        print(f"\n{'='*70}")
-        print(f"  Top {len(deals)} Deals in DB (by AI Score)")
-        print(f"{'='*70}")
-        for i, d in enumerate(deals, 1):
-            score = f"{d.ai_score:.0f}" if d.ai_score else "N/A"
-            disc = f"{d.discount_percentage:.0f}%" if d.discount_percentage else "-"
-            price = f"{d.deal_price:,.0f}" if d.deal_price else "?"
-            print(f"  {i:2}. [{score}점] {d.title[:50]}")
-            print(f"      {price}원 (할인 {disc})")
-        print(f"{'='*70}")
+    lines = [
+        f"\n{'='*70}",
+        f"  Top {len(deals)} Deals in DB (by AI Score)",
+        f"{'='*70}",
+    ]
+    for i, d in enumerate(deals, 1):
+        score = f"{d.ai_score:.0f}" if d.ai_score else "N/A"
+        disc = f"{d.discount_percentage:.0f}%" if d.discount_percentage else "-"
+        price = f"{d.deal_price:,.0f}" if d.deal_price else "?"
+        lines.append(f"  {i:2}. [{score}점] {d.title[:50]}")
+        lines.append(f"      {price}원 (할인 {disc})")
+    lines.append(f"{'='*70}")
+    print("\n".join(lines))
 
 
 async def main():
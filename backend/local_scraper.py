@@ -26,13 +26,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import gzip
 import json
 import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 # ---------------------------------------------------------------------------
 # Graceful import guards -- give clear errors before anything else fails
@@ -58,6 +60,11 @@ except ImportError:
     print("       pip install playwright && playwright install chromium  을 실행하세요.")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # optional — falls back to the stdlib json module
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Local sys.path fix so `app.*` imports resolve when running from backend/
 # ---------------------------------------------------------------------------
@@ -143,6 +150,36 @@ BROWSER_SHOP_REGISTRY: Dict[str, Any] = {
 # Shops that need image loading (anti-bot detects image blocking)
 _NO_IMAGE_BLOCK = {"aliexpress", "temu", "amazon"}
 
+# Chromium launch flags: hide automation, and skip subsystems scraping never uses
+_CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI,MediaRouter,OptimizationHints",
+]
+
+# Request types aborted in contexts that block heavy resources
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Analytics / ad hosts aborted in contexts that block heavy resources
+_BLOCKED_HOSTS = frozenset({
+    "www.google-analytics.com",
+    "ssl.google-analytics.com",
+    "analytics.google.com",
+    "www.googletagmanager.com",
+    "stats.g.doubleclick.net",
+    "googleads.g.doubleclick.net",
+    "pagead2.googlesyndication.com",
+    "connect.facebook.net",
+    "www.facebook.com",
+    "bat.bing.com",
+    "wcs.naver.net",
+    "analytics.tiktok.com",
+})
+
 # Shops that need a non-Korean locale (e.g. Amazon redirects ko-KR)
 _SHOP_LOCALES = {"amazon": "en-US"}
 
@@ -179,6 +216,20 @@ def _decimal_default(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _json_dumps(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_decimal_default)
+    return json.dumps(payload, default=_decimal_default).encode("utf-8")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def deal_to_dict(deal: NormalizedDeal) -> Dict[str, Any]:
     """Convert a NormalizedDeal dataclass to a JSON-serialisable dict.
 
@@ -186,10 +237,12 @@ def deal_to_dict(deal: NormalizedDeal) -> Dict[str, Any]:
         deal: NormalizedDeal instance returned by an adapter.
 
     Returns:
-        Plain dict suitable for JSON serialisation.
+        Plain dict suitable for JSON serialisation. ``starts_at`` and
+        ``expires_at`` stay datetimes; the payload encoder formats them.
     """
+    product = deal.product
     return {
-        "external_id": deal.product.external_id,
+        "external_id": product.external_id,
         "title": deal.title,
         "deal_price": float(deal.deal_price),
         "original_price": float(deal.original_price) if deal.original_price else None,
@@ -198,16 +251,37 @@ def deal_to_dict(deal: NormalizedDeal) -> Dict[str, Any]:
         ),
         "deal_url": deal.deal_url,
         "image_url": deal.image_url,
-        "category_hint": deal.product.category_hint,
+        "category_hint": product.category_hint,
         "deal_type": deal.deal_type,
-        "brand": deal.product.brand,
+        "brand": product.brand,
         "description": deal.description,
-        "starts_at": deal.starts_at.isoformat() if deal.starts_at else None,
-        "expires_at": deal.expires_at.isoformat() if deal.expires_at else None,
+        "starts_at": deal.starts_at,
+        "expires_at": deal.expires_at,
         "metadata": deal.metadata or {},
     }
 
 
+def convert_deals(deals: List[NormalizedDeal], shop_slug: str) -> List[Dict[str, Any]]:
+    """Convert a shop's deals with deal_to_dict, skipping ones that fail.
+
+    Each deal is converted once; failures are logged and dropped.
+
+    Args:
+        deals: NormalizedDeal instances returned by an adapter.
+        shop_slug: Shop identifier, for logging.
+
+    Returns:
+        Deal dicts for every deal that converted cleanly.
+    """
+    deal_dicts = []
+    for deal in deals:
+        try:
+            deal_dicts.append(deal_to_dict(deal))
+        except Exception as exc:
+            log.warning("deal_conversion_failed", shop=shop_slug, error=str(exc))
+    return deal_dicts
+
+
 # ---------------------------------------------------------------------------
 # Browser context factory
 # ---------------------------------------------------------------------------
@@ -222,7 +296,8 @@ async def _create_browser_context(
 
     Args:
         browser: Launched Playwright Browser instance.
-        block_images: Whether to block image/font requests for speed.
+        block_images: Whether to block image/font/media and tracker
+            requests for speed.
         locale: Browser locale (e.g. "ko-KR", "en-US").
 
     Returns:
@@ -245,16 +320,90 @@ async def _create_browser_context(
     stealth_js = _STEALTH_JS_TEMPLATE.format(languages_json=languages_json)
     await context.add_init_script(stealth_js)
 
-    # Block heavy resources to speed up scraping
+    # Block heavy resources and trackers to speed up scraping
     if block_images:
-        await context.route(
-            "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,eot}",
-            lambda route: route.abort(),
-        )
+        await context.route("**/*", _route_filter)
 
     return context
 
 
+async def _route_filter(route: Any) -> None:
+    """Abort image/font/media requests and analytics beacons; pass the rest."""
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        or urlsplit(request.url).hostname in _BLOCKED_HOSTS
+    ):
+        await route.abort("blockedbyclient")
+    else:
+        await route.continue_()
+
+
+def _context_profile(shop_slug: str) -> Tuple[bool, str]:
+    """Return the (block_images, locale) pair a shop's context is built with."""
+    return shop_slug not in _NO_IMAGE_BLOCK, _SHOP_LOCALES.get(shop_slug, "ko-KR")
+
+
+class ContextPool:
+    """Reusable browser contexts, kept in one idle queue per profile.
+
+    Contexts are configured at creation (locale, stealth script, resource
+    blocking), so one is only handed out again for a shop with the same
+    (block_images, locale) profile. Released contexts have their cookies
+    and permissions cleared instead of being closed.
+    """
+
+    def __init__(self, browser: Browser) -> None:
+        self._browser = browser
+        self._idle: Dict[Tuple[bool, str], asyncio.Queue] = {}
+        self._contexts: List[BrowserContext] = []
+
+    def _queue(self, profile: Tuple[bool, str]) -> asyncio.Queue:
+        return self._idle.setdefault(profile, asyncio.Queue())
+
+    async def _create(self, profile: Tuple[bool, str]) -> BrowserContext:
+        block_images, locale = profile
+        context = await _create_browser_context(
+            self._browser, block_images=block_images, locale=locale,
+        )
+        self._contexts.append(context)
+        return context
+
+    async def prewarm(self, profiles: List[Tuple[bool, str]]) -> None:
+        """Create one idle context per profile, all concurrently."""
+        contexts = await asyncio.gather(*(self._create(p) for p in profiles))
+        for profile, context in zip(profiles, contexts):
+            self._queue(profile).put_nowait(context)
+
+    async def acquire(self, profile: Tuple[bool, str]) -> BrowserContext:
+        """Take an idle context for the profile, creating one if none is left."""
+        try:
+            return self._queue(profile).get_nowait()
+        except asyncio.QueueEmpty:
+            return await self._create(profile)
+
+    async def release(self, profile: Tuple[bool, str], context: BrowserContext) -> None:
+        """Reset a context's state and return it to the idle queue."""
+        try:
+            await context.clear_cookies()
+            await context.clear_permissions()
+        except Exception as exc:
+            # Don't hand out a context we couldn't reset; close() cleans it up
+            log.warning("context_reset_failed", error=str(exc))
+            return
+        self._queue(profile).put_nowait(context)
+
+    async def close(self) -> None:
+        """Close every context the pool has created."""
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._contexts.clear()
+        self._idle.clear()
+
+
 # ---------------------------------------------------------------------------
 # Backend posting
 # ---------------------------------------------------------------------------
@@ -262,6 +411,22 @@ async def _create_browser_context(
 
 BATCH_SIZE = 50  # Max deals per ingest request (avoids Render free-tier timeouts)
 
+MAX_CONCURRENT_BATCHES = 4  # Ingest requests in flight at once, across all shops
+
+# Retries for transient ingest failures: 0.5s, 1s, 2s, 4s between attempts
+POST_MAX_ATTEMPTS = 5
+POST_BACKOFF_SECONDS = 0.5
+_RETRYABLE_POST_ERRORS = (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Shared by every post_deals_to_backend() call so concurrent callers can't
+# multiply the load on the uplink and the backend
+_POST_SEMAPHORE = asyncio.BoundedSemaphore(MAX_CONCURRENT_BATCHES)
+
+GZIP_LEVEL = 6  # Deal JSON compresses well; the upload from a home PC is the bottleneck
+
+MAX_CONCURRENT_SHOPS = 4  # Shops scraped at once, each with its own browser context
+
 
 async def _post_batch(
     deals_batch: List[Dict[str, Any]],
@@ -270,18 +435,35 @@ async def _post_batch(
     api_key: str,
     http_client: httpx.AsyncClient,
 ) -> Dict[str, Any]:
-    """POST a single batch of deals. Returns raw stats dict or error."""
+    """POST a single gzip-compressed batch of deals. Returns raw stats dict or error.
+
+    Connection failures, timeouts and gateway errors (e.g. Render waking
+    up) are retried with exponential backoff. Replaying a batch is safe
+    because ingest upserts products and deals. Other HTTP errors are
+    raised immediately.
+    """
     payload = {"api_key": api_key, "shop_slug": shop_slug, "deals": deals_batch}
-    headers = {"Content-Type": "application/json"}
+    headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    body = gzip.compress(_json_dumps(payload), compresslevel=GZIP_LEVEL)
 
-    response = await http_client.post(
-        url,
-        content=json.dumps(payload, default=_decimal_default),
-        headers=headers,
-        timeout=120.0,
-    )
-    response.raise_for_status()
-    return response.json().get("stats", {})
+    attempt = 1
+    while True:
+        last_attempt = attempt >= POST_MAX_ATTEMPTS
+        try:
+            response = await http_client.post(url, content=body, headers=headers, timeout=120.0)
+        except _RETRYABLE_POST_ERRORS as exc:
+            if last_attempt:
+                raise
+            reason = str(exc) or type(exc).__name__
+        else:
+            if response.status_code not in _RETRYABLE_STATUS_CODES or last_attempt:
+                response.raise_for_status()
+                return _json_loads(response.content).get("stats", {})
+            reason = f"HTTP {response.status_code}"
+
+        log.warning("ingest_post_retry", shop=shop_slug, attempt=attempt, reason=reason)
+        await asyncio.sleep(POST_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        attempt += 1
 
 
 async def post_deals_to_backend(
@@ -294,7 +476,9 @@ async def post_deals_to_backend(
     """POST scraped deals in batches to the backend ingest endpoint.
 
     Large batches are split into chunks of BATCH_SIZE to avoid timeouts
-    on Render's free tier. Stats from each chunk are aggregated.
+    on Render's free tier. Up to MAX_CONCURRENT_BATCHES chunks (counted
+    across all callers) are posted at once over the shared client, and
+    their stats are aggregated; a failed chunk doesn't affect the others.
 
     Args:
         deals: List of deal dicts (output of deal_to_dict).
@@ -317,25 +501,30 @@ async def post_deals_to_backend(
         "deals_skipped": 0,
         "errors": 0,
     }
-    errors: List[str] = []
-    total_batches = (len(deals) + BATCH_SIZE - 1) // BATCH_SIZE
-
-    for i in range(0, len(deals), BATCH_SIZE):
-        batch = deals[i : i + BATCH_SIZE]
-        batch_num = i // BATCH_SIZE + 1
-
-        if total_batches > 1:
-            print(f"  [{shop_slug}] 배치 {batch_num}/{total_batches} ({len(batch)}개)")
+    batches = [deals[i : i + BATCH_SIZE] for i in range(0, len(deals), BATCH_SIZE)]
+    total_batches = len(batches)
+    async def _send(batch_num: int, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        async with _POST_SEMAPHORE:
+            if total_batches > 1:
+                print(f"  [{shop_slug}] 배치 {batch_num}/{total_batches} ({len(batch)}개)")
+            return await _post_batch(batch, shop_slug, url, api_key, http_client)
+
+    outcomes = await asyncio.gather(
+        *(_send(num, batch) for num, batch in enumerate(batches, start=1)),
+        return_exceptions=True,
+    )
 
-        try:
-            stats = await _post_batch(batch, shop_slug, url, api_key, http_client)
+    errors: List[str] = []
+    for batch_num, outcome in enumerate(outcomes, start=1):
+        if isinstance(outcome, httpx.HTTPStatusError):
+            # Decode only the head of the body; error pages can be large HTML
+            body = outcome.response.content[:1200].decode("utf-8", "replace")[:300]
+            errors.append(f"배치 {batch_num}: HTTP {outcome.response.status_code}: {body}")
+        elif isinstance(outcome, BaseException):
+            errors.append(f"배치 {batch_num}: {outcome}")
+        else:
             for key in agg_stats:
-                agg_stats[key] += stats.get(key, 0)
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:300]
-            errors.append(f"배치 {batch_num}: HTTP {exc.response.status_code}: {body}")
-        except Exception as exc:
-            errors.append(f"배치 {batch_num}: {exc}")
+                agg_stats[key] += outcome.get(key, 0)
 
     accepted = agg_stats["deals_created"] + agg_stats["products_created"]
     rejected = agg_stats["deals_skipped"] + agg_stats["errors"]
@@ -368,147 +557,57 @@ class ShopResult:
     error: Optional[str] = None
 
 
-async def scrape_shop(
+async def collect_shop_deals(
     shop_slug: str,
     adapter_class: Any,
-    browser: Browser,
+    pool: ContextPool,
     rate_limiter: DomainRateLimiter,
-    backend_url: str,
-    api_key: str,
-    http_client: httpx.AsyncClient,
-    dry_run: bool = False,
-) -> ShopResult:
-    """Scrape a single shop and optionally POST results to the backend.
+) -> Tuple[List[Dict[str, Any]], int, Optional[ShopResult]]:
+    """Scrape a single shop and convert its deals, without posting them.
+
+    Used by main() to scrape shops concurrently before cross-shop dedup.
+    Never raises; a failed shop comes back with no deals and a ShopResult
+    describing the error.
 
     Args:
         shop_slug: Shop identifier (e.g. "gmarket").
         adapter_class: Scraper adapter class to instantiate.
-        browser: Shared Playwright Browser instance.
+        pool: Shared ContextPool to borrow a browser context from.
         rate_limiter: Shared DomainRateLimiter instance.
-        backend_url: Backend base URL.
-        api_key: API key for authentication.
-        http_client: Shared httpx AsyncClient.
-        dry_run: If True, scrape but do not POST to backend.
 
     Returns:
-        ShopResult summary.
+        Tuple of (deal dicts, raw deal count, ShopResult on failure or None).
     """
     start_time = time.monotonic()
-    print(f"\n[{shop_slug}] 스크래핑 시작...")
+    print(f"[{shop_slug}] 스크래핑 시작...")
 
-    # Create a fresh browser context per shop for isolation
-    block_images = shop_slug not in _NO_IMAGE_BLOCK
-    locale = _SHOP_LOCALES.get(shop_slug, "ko-KR")
-    context = await _create_browser_context(browser, block_images=block_images, locale=locale)
+    profile = _context_profile(shop_slug)
+    context: Optional[BrowserContext] = None
 
     try:
-        # Instantiate adapter and inject dependencies
+        context = await pool.acquire(profile)
+
         adapter = adapter_class()
         adapter.rate_limiter = rate_limiter
         adapter.browser_context = context
 
-        # Fetch deals
         deals: List[NormalizedDeal] = await adapter.fetch_deals()
         print(f"[{shop_slug}] {len(deals)}개 딜 발견")
 
-        if not deals:
-            return ShopResult(
-                shop_slug=shop_slug,
-                deals_found=0,
-                deals_sent=0,
-                deals_accepted=0,
-                deals_rejected=0,
-                elapsed_seconds=time.monotonic() - start_time,
-            )
-
-        # Convert to dicts
-        deal_dicts = []
-        for deal in deals:
-            try:
-                deal_dicts.append(deal_to_dict(deal))
-            except Exception as exc:
-                log.warning("deal_conversion_failed", shop=shop_slug, error=str(exc))
-
-        # Dry run: print samples and return
-        if dry_run:
-            def _safe(s: str) -> str:
-                """Encode string safely for Windows cp949 console output."""
-                return s.replace('\xa0', ' ').encode('cp949', 'replace').decode('cp949')
-
-            print(f"[{shop_slug}] [DRY RUN] 백엔드 전송 건너뜀. 딜 {len(deal_dicts)}개:")
-            for i, sample in enumerate(deal_dicts[:5]):
-                orig = sample.get('original_price')
-                pct = sample.get('discount_percentage')
-                title = _safe(sample.get('title', 'N/A'))[:60]
-                price_str = f"     가격: {sample.get('deal_price', 0):,.0f}원"
-                if orig and pct:
-                    price_str += f" (원래 {orig:,.0f}원, -{pct:.0f}%)"
-                print(f"  {i+1}. {title}")
-                print(price_str)
-            if len(deal_dicts) > 5:
-                print(f"  ... 외 {len(deal_dicts)-5}개")
-            return ShopResult(
-                shop_slug=shop_slug,
-                deals_found=len(deals),
-                deals_sent=0,
-                deals_accepted=0,
-                deals_rejected=0,
-                elapsed_seconds=time.monotonic() - start_time,
-            )
-
-        # POST to backend
-        print(f"[{shop_slug}] 백엔드에 {len(deal_dicts)}개 딜 전송 중...")
-        result = await post_deals_to_backend(
-            deals=deal_dicts,
-            shop_slug=shop_slug,
-            backend_url=backend_url,
-            api_key=api_key,
-            http_client=http_client,
-        )
-
-        if result["error"]:
-            print(f"[{shop_slug}] 전송 오류: {result['error']}")
-        else:
-            stats = result.get("stats", {})
-            print(
-                f"[{shop_slug}] 전송 완료: "
-                f"상품생성={stats.get('products_created', 0)}개 "
-                f"상품갱신={stats.get('products_updated', 0)}개 "
-                f"딜생성={stats.get('deals_created', 0)}개 "
-                f"딜건너뜀={stats.get('deals_skipped', 0)}개 "
-                f"오류={stats.get('errors', 0)}개"
-            )
-
-        return ShopResult(
-            shop_slug=shop_slug,
-            deals_found=len(deals),
-            deals_sent=result["sent"],
-            deals_accepted=result["accepted"],
-            deals_rejected=result["rejected"],
-            elapsed_seconds=time.monotonic() - start_time,
-            error=result["error"],
-        )
+        return convert_deals(deals, shop_slug), len(deals), None
 
     except Exception as exc:
         elapsed = time.monotonic() - start_time
         log.error("shop_scrape_failed", shop=shop_slug, error=str(exc))
         print(f"[{shop_slug}] 스크래핑 실패: {exc}")
-        return ShopResult(
-            shop_slug=shop_slug,
-            deals_found=0,
-            deals_sent=0,
-            deals_accepted=0,
-            deals_rejected=0,
-            elapsed_seconds=elapsed,
-            error=str(exc),
+        return [], 0, ShopResult(
+            shop_slug=shop_slug, deals_found=0, deals_sent=0,
+            deals_accepted=0, deals_rejected=0,
+            elapsed_seconds=elapsed, error=str(exc),
         )
-
     finally:
-        # Always close the per-shop context
-        try:
-            await context.close()
-        except Exception:
-            pass
+        if context is not None:
+            await pool.release(profile, context)
 
 
 # ---------------------------------------------------------------------------
@@ -686,6 +785,20 @@ def print_summary(results: List[ShopResult], dry_run: bool) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _playwright_browsers_root() -> Optional[str]:
+    """Return the directory Playwright installs browsers into, if known."""
+    custom = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if custom:
+        # "0" means browsers live inside the playwright package itself
+        return None if custom == "0" else custom
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+        return os.path.join(base, "ms-playwright")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/ms-playwright")
+    return os.path.expanduser("~/.cache/ms-playwright")
+
+
 def ensure_playwright_browsers() -> None:
     """Check that Chromium is installed and print help if not.
 
@@ -694,44 +807,39 @@ def ensure_playwright_browsers() -> None:
     human-readable message before the async event loop starts so the user
     does not have to wait through Python startup to see the error.
 
-    Detection strategy: ask Playwright to list installed browsers (``show``
-    command available since 1.x). If the output does not mention chromium,
-    print the install command and continue (Playwright will fail loudly later).
+    Detection strategy: look for a ``chromium-*/chrome-*`` directory under
+    Playwright's browser install root. This is a plain filesystem check, so
+    it costs no subprocess or Playwright driver start-up on every run.
     """
-    import subprocess
+    import glob
 
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "playwright", "install", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        # If playwright itself is missing this will raise FileNotFoundError or
-        # return a non-zero exit. In both cases we skip the check and let the
-        # import guard at the top of the file handle it.
-        if result.returncode != 0:
-            return
-    except Exception:
+    root = _playwright_browsers_root()
+    if root is None:
+        return
+
+    if not glob.glob(os.path.join(root, "chromium-*", "chrome-*")):
+        print("[경고] Chromium 브라우저가 설치되어 있지 않습니다.")
+        print("       다음 명령어로 설치하세요:")
+        print("         playwright install chromium")
+        print()
+
+
+def install_event_loop_policy() -> None:
+    """Use uvloop where available; keep the Proactor loop on Windows.
+
+    Playwright drives Chromium through a subprocess, which on Windows only
+    the Proactor loop supports. Elsewhere uvloop (optional) cuts per-callback
+    overhead for the many Playwright and httpx tasks running at once.
+    """
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
         return
 
-    # Attempt a quick executable presence check using the Python playwright API
     try:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as p:
-            # get_browser_path returns the expected path; if it doesn't exist
-            # the browser has not been installed.
-            chromium_path = p.chromium.executable_path
-            if not os.path.exists(chromium_path):
-                print("[경고] Chromium 브라우저가 설치되어 있지 않습니다.")
-                print("       다음 명령어로 설치하세요:")
-                print("         playwright install chromium")
-                print()
-    except Exception:
-        # Any failure here is non-fatal; Playwright's own launch() error is
-        # descriptive enough.
-        pass
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 # ---------------------------------------------------------------------------
@@ -773,61 +881,44 @@ async def main(
         print("[브라우저] Chromium 실행 중...")
         browser = await playwright.chromium.launch(
             headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
+            args=_CHROMIUM_ARGS,
         )
         print("[브라우저] Chromium 실행 완료\n")
 
+        # Shops are scraped concurrently, each in its own context of the
+        # shared browser; the semaphore caps how many contexts are open
+        known_shops = []
         for shop_slug in shops:
-            adapter_class = BROWSER_SHOP_REGISTRY.get(shop_slug)
-            if adapter_class is None:
+            if shop_slug not in BROWSER_SHOP_REGISTRY:
                 print(f"[{shop_slug}] 알 수 없는 쇼핑몰 — 건너뜀")
                 continue
+            known_shops.append(shop_slug)
 
-            start_time = time.monotonic()
-            print(f"\n[{shop_slug}] 스크래핑 시작...")
+        # Contexts for the first wave of shops are created up front, in
+        # parallel, rather than one by one as each shop starts
+        pool = ContextPool(browser)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SHOPS)
 
-            block_images = shop_slug not in _NO_IMAGE_BLOCK
-            locale = _SHOP_LOCALES.get(shop_slug, "ko-KR")
-            context = await _create_browser_context(browser, block_images=block_images, locale=locale)
+        async def _collect(shop_slug: str):
+            async with semaphore:
+                return await collect_shop_deals(
+                    shop_slug, BROWSER_SHOP_REGISTRY[shop_slug], pool, rate_limiter,
+                )
 
-            try:
-                adapter = adapter_class()
-                adapter.rate_limiter = rate_limiter
-                adapter.browser_context = context
-
-                deals: List[NormalizedDeal] = await adapter.fetch_deals()
-                print(f"[{shop_slug}] {len(deals)}개 딜 발견")
-                shop_raw_counts[shop_slug] = len(deals)
-
-                deal_dicts = []
-                for deal in deals:
-                    try:
-                        deal_dicts.append(deal_to_dict(deal))
-                    except Exception as exc:
-                        log.warning("deal_conversion_failed", shop=shop_slug, error=str(exc))
-
-                scraped_deals[shop_slug] = deal_dicts
-
-            except Exception as exc:
-                elapsed = time.monotonic() - start_time
-                log.error("shop_scrape_failed", shop=shop_slug, error=str(exc))
-                print(f"[{shop_slug}] 스크래핑 실패: {exc}")
-                scraped_deals[shop_slug] = []
-                shop_raw_counts[shop_slug] = 0
-                results.append(ShopResult(
-                    shop_slug=shop_slug, deals_found=0, deals_sent=0,
-                    deals_accepted=0, deals_rejected=0,
-                    elapsed_seconds=elapsed, error=str(exc),
-                ))
-            finally:
-                try:
-                    await context.close()
-                except Exception:
-                    pass
+        try:
+            await pool.prewarm(
+                [_context_profile(slug) for slug in known_shops[:MAX_CONCURRENT_SHOPS]]
+            )
+            outcomes = await asyncio.gather(*(_collect(slug) for slug in known_shops))
+        finally:
+            await pool.close()
+
+        # Keep shop order so dedup and the summary don't depend on timing
+        for shop_slug, (deal_dicts, raw_count, failure) in zip(known_shops, outcomes):
+            scraped_deals[shop_slug] = deal_dicts
+            shop_raw_counts[shop_slug] = raw_count
+            if failure is not None:
+                results.append(failure)
 
         print("\n[브라우저] 종료 중...")
         await browser.close()
@@ -836,7 +927,12 @@ async def main(
     deduped = dedup_cross_shop(scraped_deals)
 
     # Phase 3: Send or display results
-    async with httpx.AsyncClient(timeout=60.0) as http_client:
+    # Keep enough pooled connections for one shop's concurrent batches
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_BATCHES * 2,
+        max_keepalive_connections=MAX_CONCURRENT_BATCHES,
+    )
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as http_client:
         for shop_slug in shops:
             if shop_slug not in deduped:
                 continue
@@ -1016,6 +1112,7 @@ if __name__ == "__main__":
     ensure_playwright_browsers()
 
     # Run
+    install_event_loop_policy()
     try:
         asyncio.run(
             main(
@@ -44,7 +44,7 @@ from app.db.session import async_session_factory
 from app.models.deal import Deal
 from app.models.shop import Shop
 from app.models.category import Category
-from app.services.price_analysis import PriceAnalyzer, DEAL_THRESHOLD, HOT_DEAL_THRESHOLD, SUPER_DEAL_THRESHOLD
+from app.services.price_analysis import PriceAnalyzer, DealScore, ScoreInput, DEAL_THRESHOLD, HOT_DEAL_THRESHOLD, SUPER_DEAL_THRESHOLD
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +72,31 @@ def _tier_emoji(score: Decimal) -> str:
     return "[ ]"
 
 
+def _score_input(deal: Deal) -> ScoreInput:
+    """Build the scorer input for a deal loaded with its shop and category."""
+    # UUID handling — the DB stores UUIDs as strings in SQLite
+    product_id: UUID
+    if isinstance(deal.product_id, str):
+        product_id = UUID(deal.product_id)
+    else:
+        product_id = deal.product_id
+
+    # created_at may be a naive datetime from SQLite
+    created_at: Optional[datetime] = deal.created_at
+    if created_at is not None and created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    return ScoreInput(
+        product_id=product_id,
+        current_price=deal.deal_price,
+        original_price=deal.original_price,
+        category_slug=deal.category.slug if deal.category else None,
+        title=deal.title,
+        shop_slug=deal.shop.slug if deal.shop else None,
+        created_at=created_at,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Core rescoring logic
 # ---------------------------------------------------------------------------
@@ -85,8 +110,8 @@ async def rescore_all(
     """Re-score all qualifying deals in the database.
 
     Iterates over all active deals (optionally filtered by shop slug),
-    calls PriceAnalyzer.compute_deal_score() for each, and writes the
-    updated ai_score and ai_reasoning back to the database in batches.
+    scores them a batch at a time with PriceAnalyzer.compute_deal_scores(),
+    and writes the updated ai_score and ai_reasoning back to the database.
 
     Args:
         dry_run: If True, compute scores but do not write to the database.
@@ -103,14 +128,12 @@ async def rescore_all(
 
     async with async_session_factory() as session:
         # ------------------------------------------------------------------
-        # Fetch deals with their related shop and category
+        # Fetch the ids of the deals to rescore; the deals themselves are
+        # loaded a batch at a time so only one batch of ORM objects exists
+        # at once
         # ------------------------------------------------------------------
         query = (
-            select(Deal)
-            .options(
-                selectinload(Deal.shop),
-                selectinload(Deal.category),
-            )
+            select(Deal.id)
             .where(Deal.is_active == True)  # noqa: E712
             .order_by(Deal.created_at.desc())
         )
@@ -122,11 +145,11 @@ async def rescore_all(
             query = query.limit(limit)
 
         result = await session.execute(query)
-        deals = list(result.scalars().all())
+        deal_ids = list(result.scalars().all())
 
-    print(f"Found {len(deals)} deal(s) to process.\n")
+    print(f"Found {len(deal_ids)} deal(s) to process.\n")
 
-    if not deals:
+    if not deal_ids:
         print("Nothing to do.")
         return
 
@@ -134,7 +157,7 @@ async def rescore_all(
     # Score distribution tracking
     # ------------------------------------------------------------------
     stats = {
-        "total": len(deals),
+        "total": len(deal_ids),
         "scored": 0,
         "errors": 0,
         "tiers": {"super_deal": 0, "hot_deal": 0, "deal": 0, "none": 0},
@@ -148,47 +171,85 @@ async def rescore_all(
     BATCH_SIZE = 50
     start_time = time.monotonic()
 
-    for batch_start in range(0, len(deals), BATCH_SIZE):
-        batch = deals[batch_start : batch_start + BATCH_SIZE]
+    for batch_start in range(0, len(deal_ids), BATCH_SIZE):
+        batch_ids = deal_ids[batch_start : batch_start + BATCH_SIZE]
 
         async with async_session_factory() as session:
+            # Load this batch with its shop and category, in id order
+            batch_result = await session.execute(
+                select(Deal)
+                .options(
+                    selectinload(Deal.shop),
+                    selectinload(Deal.category),
+                )
+                .where(Deal.id.in_(batch_ids))
+            )
+            by_id = {deal.id: deal for deal in batch_result.scalars().all()}
+            batch = [by_id[deal_id] for deal_id in batch_ids if deal_id in by_id]
+
             analyzer = PriceAnalyzer(session)
             updates: list[dict] = []
 
-            for deal in batch:
+            # Plain values for reporting, so a rollback below (which
+            # expires the loaded deals) doesn't trigger lazy loads
+            inputs = [_score_input(deal) for deal in batch]
+            reports = [
+                (deal.id, deal.title, deal.ai_score, score_input)
+                for deal, score_input in zip(batch, inputs)
+            ]
+
+            # Score the whole batch with shared history/category queries
+            deal_scores: list[Optional[DealScore]]
+            try:
+                deal_scores = list(
+                    await analyzer.compute_deal_scores(inputs, bypass_cache=True)
+                )
+            except Exception as exc:
+                # Fall back to one deal at a time so a bad deal only
+                # costs itself
+                await session.rollback()
+                print(
+                    f"[WARN] Batch scoring failed for {len(batch)} deal(s) "
+                    f"starting at #{batch_start}: {exc}; scoring them one by one",
+                    file=sys.stderr,
+                )
+                deal_scores = []
+                for deal_id, title, _, score_input in reports:
+                    try:
+                        deal_scores.append(await analyzer.compute_deal_score(
+                            product_id=score_input.product_id,
+                            current_price=score_input.current_price,
+                            original_price=score_input.original_price,
+                            category_slug=score_input.category_slug,
+                            title=score_input.title,
+                            shop_slug=score_input.shop_slug,
+                            created_at=score_input.created_at,
+                            bypass_cache=True,
+                        ))
+                    except Exception as exc:
+                        await session.rollback()
+                        deal_scores.append(None)
+                        stats["errors"] += 1
+                        title_preview = title[:50] if title else "(no title)"
+                        print(
+                            f"[ERROR] Failed to score deal {deal_id} "
+                            f"('{title_preview}'): {exc}",
+                            file=sys.stderr,
+                        )
+
+            for (deal_id, title, ai_score, score_input), deal_score in zip(reports, deal_scores):
+                if deal_score is None:
+                    continue
                 try:
-                    # Gather context for the new scorer
-                    shop_slug_val: Optional[str] = deal.shop.slug if deal.shop else None
-                    category_slug_val: Optional[str] = deal.category.slug if deal.category else None
+                    shop_slug_val: Optional[str] = score_input.shop_slug
+                    category_slug_val: Optional[str] = score_input.category_slug
 
-                    old_score = float(deal.ai_score) if deal.ai_score is not None else 0.0
+                    old_score = float(ai_score) if ai_score is not None else 0.0
                     stats["old_score_sum"] += old_score
 
-                    # UUID handling — the DB stores UUIDs as strings in SQLite
-                    product_id: UUID
-                    if isinstance(deal.product_id, str):
-                        product_id = UUID(deal.product_id)
-                    else:
-                        product_id = deal.product_id
-
-                    # created_at may be a naive datetime from SQLite
-                    created_at: Optional[datetime] = deal.created_at
-                    if created_at is not None and created_at.tzinfo is None:
-                        created_at = created_at.replace(tzinfo=timezone.utc)
-
-                    deal_score = await analyzer.compute_deal_score(
-                        product_id=product_id,
-                        current_price=deal.deal_price,
-                        original_price=deal.original_price,
-                        category_slug=category_slug_val,
-                        title=deal.title,
-                        shop_slug=shop_slug_val,
-                        created_at=created_at,
-                    )
-
                     new_score = float(deal_score.score)
                     updates.append({
-                        "id": deal.id,
+                        "id": deal_id,
                         "ai_score": deal_score.score,
                         "ai_reasoning": deal_score.reasoning,
                     })
@@ -204,7 +265,7 @@ async def rescore_all(
 
                     if verbose:
                         tier_str = _tier_emoji(deal_score.score)
-                        title_preview = deal.title[:55] if deal.title else "(no title)"
+                        title_preview = title[:55] if title else "(no title)"
                         print(
                             f"{tier_str} {new_score:5.1f} pts  "
                             f"(was {old_score:5.1f})  "
@@ -237,9 +298,9 @@ async def rescore_all(
 
                 except Exception as exc:
                     stats["errors"] += 1
-                    title_preview = deal.title[:50] if deal.title else "(no title)"
+                    title_preview = title[:50] if title else "(no title)"
                     print(
-                        f"[ERROR] Failed to score deal {deal.id} "
+                        f"[ERROR] Failed to score deal {deal_id} "
                         f"('{title_preview}'): {exc}",
                         file=sys.stderr,
                     )
@@ -259,11 +320,11 @@ async def rescore_all(
                     )
                 await session.commit()
 
-        processed = min(batch_start + BATCH_SIZE, len(deals))
+        processed = min(batch_start + BATCH_SIZE, len(deal_ids))
         elapsed = time.monotonic() - start_time
         rate = processed / elapsed if elapsed > 0 else 0
         print(
-            f"Progress: {processed}/{len(deals)} deals processed  "
+            f"Progress: {processed}/{len(deal_ids)} deals processed  "
             f"({rate:.1f} deals/sec)",
             flush=True,
         )
@@ -7,3 +7,17 @@ import pytest
 def anyio_backend():
     """Use asyncio as the async backend for tests."""
     return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    """Reset in-process caches so state never leaks between tests."""
+    from app.services.deal_service import invalidate_deal_counts
+    from app.services.price_analysis import clear_deal_score_cache, invalidate_category_stats
+    from app.services.product_service import clear_last_price_cache
+
+    invalidate_deal_counts()
+    invalidate_category_stats()
+    clear_deal_score_cache()
+    clear_last_price_cache()
+    yield
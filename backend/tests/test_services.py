@@ -9,6 +9,7 @@ Tests cover:
 
 import pytest
 import json
+import statistics
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from uuid import uuid4
@@ -16,20 +17,25 @@ from jsonschema import validate, ValidationError
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest_asyncio
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.db.session import Base
 from app.models import (
     Shop, Category, Product, Deal, PriceHistory,
-    SearchKeyword, ScraperJob
+    SearchKeyword, ScraperJob, User
 )
 from app.schemas import (
     ProductResponse, ProductDetailResponse, DealResponse,
     DealDetailResponse, ShopResponse, CategoryResponse
 )
 from app.services.product_service import ProductService
-from app.services.deal_service import DealService
+from app.services.comment_service import CommentService
+from app.services.deal_service import DealService, encode_deal_cursor
+from app.services.price_analysis import PriceAnalyzer, ScoreInput
+from app.services.search_service import SearchService
+from app.services.vote_service import VoteService
 from app.scrapers.base import NormalizedProduct, NormalizedDeal
 
 
@@ -217,6 +223,48 @@ class TestProductService:
         assert len(history) == 1
         assert history[0].price == Decimal("10000.00")
 
+    async def test_bulk_upsert_products(
+        self,
+        test_db: AsyncSession,
+        sample_shop: Shop,
+        sample_category: Category,
+        sample_product: Product
+    ):
+        """Bulk upsert creates and updates products in input order."""
+        service = ProductService(test_db)
+
+        items = [
+            (NormalizedProduct(
+                external_id="bulk-001",
+                title="벌크 상품 1",
+                current_price=Decimal("20000.00"),
+                product_url="https://example.com/bulk-1",
+            ), sample_category.id),
+            (NormalizedProduct(
+                external_id=sample_product.external_id,
+                title="업데이트된 상품",
+                current_price=Decimal("45000.00"),
+                product_url="https://example.com/product/test",
+            ), None),
+            (NormalizedProduct(
+                external_id="bulk-002",
+                title="벌크 상품 2",
+                current_price=Decimal("30000.00"),
+                product_url="https://example.com/bulk-2",
+            ), None),
+        ]
+
+        products = await service.bulk_upsert_products(sample_shop.id, items, batch_size=2)
+
+        assert [p.external_id for p in products] == ["bulk-001", sample_product.external_id, "bulk-002"]
+        assert products[0].category_id == sample_category.id
+        assert products[1].id == sample_product.id
+        assert products[1].title == "업데이트된 상품"
+        assert products[1].category_id == sample_category.id  # Kept when not given
+        for product in products:
+            history = await service.get_price_history(product.id)
+            assert [h.price for h in history] == [product.current_price]
+
     async def test_get_product_by_id(
         self,
         test_db: AsyncSession,
@@ -445,6 +493,51 @@ class TestDealService:
         assert len(deals) == 2
         assert total == 5
 
+    async def test_get_deals_cursor_pagination(
+        self,
+        test_db: AsyncSession,
+        sample_shop: Shop,
+        sample_product: Product
+    ):
+        """Test keyset pagination walks every deal exactly once."""
+        service = DealService(test_db)
+
+        for i in range(5):
+            deal = Deal(
+                product_id=sample_product.id,
+                shop_id=sample_shop.id,
+                deal_price=Decimal("50000.00"),
+                title=f"커서 {i}",
+                deal_url="https://example.com/deal",
+                ai_score=Decimal(str(50 + i)) if i % 2 else None,
+                is_active=True,
+            )
+            test_db.add(deal)
+
+        await test_db.commit()
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            deals, total = await service.get_deals(limit=2, sort_by="score", cursor=cursor)
+            assert total == 5
+            seen.extend(d.id for d in deals)
+            if deals:
+                cursor = encode_deal_cursor(deals[-1], "score")
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    async def test_get_deals_invalid_cursor(
+        self,
+        test_db: AsyncSession
+    ):
+        """Test malformed cursors are rejected."""
+        service = DealService(test_db)
+
+        with pytest.raises(ValueError, match="cursor"):
+            await service.get_deals(cursor="not-a-cursor")
+
     async def test_get_deals_filter_by_category(
         self,
         test_db: AsyncSession,
@@ -586,6 +679,43 @@ class TestDealService:
         assert updated.vote_down == 1
         assert updated.vote_up == 0
 
+    async def test_user_vote_switch_and_toggle(
+        self,
+        test_db: AsyncSession,
+        sample_shop: Shop,
+        sample_product: Product
+    ):
+        """Test per-user votes switch and toggle the deal counters."""
+        service = VoteService(test_db)
+
+        user = User(
+            email="voter@example.com",
+            username="voter",
+            hashed_password="x",
+        )
+        deal = Deal(
+            product_id=sample_product.id,
+            shop_id=sample_shop.id,
+            deal_price=Decimal("50000.00"),
+            title="사용자 투표",
+            deal_url="https://example.com/deal",
+            is_active=True,
+        )
+        test_db.add_all([user, deal])
+        await test_db.commit()
+
+        result = await service.vote(deal.id, user.id, "up")
+        assert (result["vote_up"], result["vote_down"], result["user_vote"]) == (1, 0, "up")
+
+        result = await service.vote(deal.id, user.id, "down")
+        assert (result["vote_up"], result["vote_down"], result["user_vote"]) == (0, 1, "down")
+
+        result = await service.vote(deal.id, user.id, "down")
+        assert (result["vote_up"], result["vote_down"], result["user_vote"]) == (0, 0, None)
+        assert await service.get_user_vote(deal.id, user.id) is None
+
+        assert await service.vote(uuid4(), user.id, "up") is None
+
     async def test_expire_stale_deals(
         self,
         test_db: AsyncSession,
@@ -633,6 +763,272 @@ class TestDealService:
         assert expired.is_expired is True
 
 
+# ============================================================================
+# TESTS: COMMENT SERVICE
+# ============================================================================
+
+class TestCommentService:
+    """Tests for CommentService."""
+
+    async def test_comment_lifecycle(
+        self,
+        test_db: AsyncSession,
+        sample_shop: Shop,
+        sample_product: Product
+    ):
+        """Test creating, replying to, editing and deleting comments."""
+        service = CommentService(test_db)
+
+        user = User(
+            email="commenter@example.com",
+            username="commenter",
+            hashed_password="x",
+        )
+        deal = Deal(
+            product_id=sample_product.id,
+            shop_id=sample_shop.id,
+            deal_price=Decimal("50000.00"),
+            title="댓글 특가",
+            deal_url="https://example.com/deal",
+            is_active=True,
+        )
+        test_db.add_all([user, deal])
+        await test_db.commit()
+
+        comment = await service.create_comment(deal.id, user, "첫 댓글")
+        assert comment is not None
+        assert comment.user is user
+        assert comment.replies == []
+
+        reply = await service.create_comment(deal.id, user, "답글", parent_id=comment.id)
+        assert reply is not None
+        assert reply.parent_id == comment.id
+
+        # Missing deal or parent: nothing is inserted
+        assert await service.create_comment(uuid4(), user, "없는 딜") is None
+        assert await service.create_comment(deal.id, user, "없는 부모", parent_id=uuid4()) is None
+        await test_db.commit()
+
+        # Read back as a later request would, not from the identity map
+        test_db.expunge_all()
+        threads = await service.get_comments_for_deal(deal.id)
+        assert [c.id for c in threads] == [comment.id]
+        assert [r.id for r in threads[0].replies] == [reply.id]
+
+        updated = await service.update_comment(comment.id, user, "수정된 댓글")
+        assert updated.content == "수정된 댓글"
+        assert updated.user is user
+        assert await service.update_comment(comment.id, User(id=uuid4()), "남의 댓글") is None
+
+        assert await service.delete_comment(reply.id, user.id) is True
+        assert await service.delete_comment(reply.id, user.id) is False
+        await test_db.commit()
+
+        assert await test_db.scalar(
+            select(Deal.comment_count).where(Deal.id == deal.id)
+        ) == 1
+
+
+# ============================================================================
+# TESTS: SEARCH SERVICE
+# ============================================================================
+
+class TestSearchService:
+    """Tests for SearchService."""
+
+    async def test_search_deals_pagination(
+        self,
+        test_db: AsyncSession,
+        sample_shop: Shop,
+        sample_product: Product
+    ):
+        """Test search totals come back with every page of results."""
+        service = SearchService(test_db)
+
+        for i in range(5):
+            test_db.add(Deal(
+                product_id=sample_product.id,
+                shop_id=sample_shop.id,
+                deal_price=Decimal("50000.00"),
+                title=f"삼성 모니터 특가 {i}" if i < 3 else f"키보드 {i}",
+                deal_url="https://example.com/deal",
+                is_active=True,
+            ))
+        await test_db.commit()
+
+        deals, total = await service.search_deals("모니터", page=1, limit=2)
+        assert len(deals) == 2
+        assert total == 3
+
+        deals, total = await service.search_deals("모니터", page=2, limit=2)
+        assert len(deals) == 1
+        assert total == 3
+
+        deals, total = await service.search_deals("모니터", page=5, limit=2)
+        assert deals == []
+        assert total == 3
+
+    async def test_track_keyword_counts_repeat_searches(
+        self,
+        test_db: AsyncSession
+    ):
+        """Test repeated searches increment one keyword row."""
+        service = SearchService(test_db)
+
+        await service._track_keyword("  Monitor ")
+        await service._track_keyword("monitor")
+        await service._track_keyword("m")
+
+        trending = await service.get_trending_keywords()
+        assert trending == [{"keyword": "monitor", "count": 2}]
+
+
+# ============================================================================
+# TESTS: PRICE ANALYZER
+# ============================================================================
+
+class TestPriceAnalyzer:
+    """Tests for PriceAnalyzer."""
+
+    async def test_compute_deal_scores_matches_single_scoring(
+        self,
+        test_db: AsyncSession,
+        sample_product: Product
+    ):
+        """Batch scoring gives the same result as scoring one at a time."""
+        analyzer = PriceAnalyzer(test_db)
+
+        now = datetime.now(timezone.utc)
+        for i in range(6):
+            test_db.add(PriceHistory(
+                product_id=sample_product.id,
+                price=Decimal("60000.00") - Decimal(i * 1000),
+                currency="KRW",
+                recorded_at=now - timedelta(days=i * 5),
+            ))
+        await test_db.commit()
+
+        items = [
+            ScoreInput(
+                product_id=sample_product.id,
+                current_price=Decimal("45000.00"),
+                original_price=Decimal("100000.00"),
+                category_slug="electronics",
+            ),
+            ScoreInput(
+                product_id=uuid4(),
+                current_price=Decimal("9900.00"),
+                original_price=Decimal("19900.00"),
+                category_slug="electronics",
+                title="초특가 핫딜",
+                shop_slug="coupang",
+            ),
+        ]
+
+        batch = await analyzer.compute_deal_scores(items)
+        single = [
+            await analyzer.compute_deal_score(
+                product_id=item.product_id,
+                current_price=item.current_price,
+                original_price=item.original_price,
+                category_slug=item.category_slug,
+                title=item.title,
+                shop_slug=item.shop_slug,
+                bypass_cache=True,
+            )
+            for item in items
+        ]
+
+        assert [score.score for score in batch] == [score.score for score in single]
+        assert batch[0].components["scoring_path"] == "full_history"
+        assert batch[1].components["scoring_path"] == "limited_history"
+        assert await analyzer.compute_deal_scores([]) == []
+
+    async def test_memoized_deal_score_is_shared_read_only(
+        self,
+        test_db: AsyncSession,
+        sample_product: Product
+    ):
+        """A memoized score can be looked up and its components are read-only."""
+        analyzer = PriceAnalyzer(test_db)
+        assert analyzer.get_cached_deal_score(sample_product.id, Decimal("9900.00")) is None
+
+        score = await analyzer.compute_deal_score(
+            product_id=sample_product.id,
+            current_price=Decimal("9900.00"),
+        )
+
+        assert analyzer.get_cached_deal_score(sample_product.id, Decimal("9900.00")) is score
+        with pytest.raises(TypeError):
+            score.components["freshness"] = 10.0
+
+    async def test_get_price_stats(
+        self,
+        test_db: AsyncSession,
+        sample_product: Product
+    ):
+        """Price stats summarize the scoring window of price history."""
+        now = datetime.now(timezone.utc)
+        prices = [50000.0, 52000.0, 55000.0, 61000.0]
+        for i, price in enumerate(prices):
+            test_db.add(PriceHistory(
+                product_id=sample_product.id,
+                price=Decimal(str(price)),
+                currency="KRW",
+                recorded_at=now - timedelta(days=i * 3),
+            ))
+        await test_db.commit()
+
+        stats = await PriceAnalyzer(test_db)._get_price_stats(
+            sample_product.id, days=90, now=now
+        )
+
+        assert stats.count == 4
+        assert stats.avg_price == pytest.approx(statistics.mean(prices))
+        assert stats.std_dev == pytest.approx(statistics.stdev(prices))
+        assert stats.min_price == 50000.0
+        assert stats.max_price == 61000.0
+        # Last 7 days: today, three and six days ago
+        assert stats.recent_avg == pytest.approx(statistics.mean(prices[:3]))
+
+    async def test_category_relative_price_uses_published_median(
+        self,
+        test_db: AsyncSession,
+        sample_category: Category
+    ):
+        """Category medians published to Redis are used without a DB scan."""
+        analyzer = PriceAnalyzer(test_db)
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=json.dumps([20000.0, 80]))
+
+        with patch("app.services.price_analysis.get_cache_service", return_value=cache):
+            score, pct_below = await analyzer._score_category_relative_price(
+                Decimal("10000.00"), "electronics", uuid4()
+            )
+
+        assert score == 20.0
+        assert pct_below == 50.0
+        cache.get.assert_awaited_once_with("cat_median:electronics")
+
+    async def test_unpublished_category_median_is_remembered(
+        self,
+        test_db: AsyncSession,
+        sample_category: Category
+    ):
+        """A category without a published median is looked up in Redis once."""
+        analyzer = PriceAnalyzer(test_db)
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+
+        with patch("app.services.price_analysis.get_cache_service", return_value=cache):
+            for _ in range(2):
+                await analyzer._score_category_relative_price(
+                    Decimal("10000.00"), "electronics", uuid4()
+                )
+
+        cache.get.assert_awaited_once_with("cat_median:electronics")
+
+
 # ============================================================================
 # TESTS: SCHEMA VALIDATION
 # ============================================================================